@@ -0,0 +1,108 @@
+"""고유명사 그라운딩 검증 마이크로벤치마크 — 단순 부분 문자열 검색 vs Aho-Corasick.
+
+실행: python scripts/bench_grounding.py [--nouns 200] [--corpus-kb 200]
+"""
+import argparse
+import random
+import time
+
+from rich.console import Console
+from rich.table import Table
+
+from blog_agents.utils.text_match import MultiPatternMatcher
+
+console = Console()
+
+SYLLABLES = "가나다라마바사아자차카타파하전시미술관작품회고展영화드라마서울광주"
+
+
+def _word(rng: random.Random, lo: int = 2, hi: int = 6) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(lo, hi)))
+
+
+def build_case(n_nouns: int, corpus_kb: int, n_items: int, seed: int = 7):
+    rng = random.Random(seed)
+    nouns = {_word(rng, 3, 8) for _ in range(n_nouns)}
+    words = [_word(rng) for _ in range(2000)]
+    grounded = rng.sample(sorted(nouns), len(nouns) // 2)
+
+    parts: list[str] = []
+    size = 0
+    while size < corpus_kb * 1000:
+        chunk = " ".join(rng.choices(words, k=30))
+        if grounded and rng.random() < 0.2:
+            chunk += " " + rng.choice(grounded)
+        parts.append(chunk)
+        size += len(chunk.encode("utf-8"))
+    corpus = "\n".join(parts)
+
+    items = [
+        " ".join(rng.choices(words, k=25))
+        + (" " + rng.choice(sorted(nouns)) if rng.random() < 0.3 else "")
+        for _ in range(n_items)
+    ]
+    return nouns, corpus, items
+
+
+def naive(nouns, corpus, items):
+    corpus_lower = corpus.lower()
+    ungrounded = [n for n in nouns if n.lower() not in corpus_lower]
+    kept = [it for it in items if not any(t in it for t in ungrounded)]
+    return ungrounded, kept
+
+
+def automaton(nouns, corpus, items):
+    grounded = {n.lower() for n in MultiPatternMatcher(nouns).find(corpus)}
+    ungrounded = [n for n in nouns if n.lower() not in grounded]
+    matcher = MultiPatternMatcher(ungrounded)
+    kept = [it for it in items if not matcher.contains_any(it)]
+    return ungrounded, kept
+
+
+def _time(fn, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nouns", type=int, default=200)
+    parser.add_argument("--corpus-kb", type=int, default=200)
+    parser.add_argument("--items", type=int, default=60)
+    args = parser.parse_args()
+
+    table = Table(title="그라운딩 검증 벤치마크 (최솟값, 3회)", show_header=True)
+    table.add_column("고유명사", justify="right")
+    table.add_column("코퍼스(KB)", justify="right")
+    table.add_column("단순 검색(ms)", justify="right")
+    table.add_column("Aho-Corasick(ms)", justify="right")
+    table.add_column("배속", justify="right")
+
+    for scale in (0.25, 0.5, 1.0, 2.0, 4.0):
+        n_nouns = max(1, int(args.nouns * scale))
+        corpus_kb = max(1, int(args.corpus_kb * scale))
+        nouns, corpus, items = build_case(n_nouns, corpus_kb, args.items)
+
+        a = naive(nouns, corpus, items)
+        b = automaton(nouns, corpus, items)
+        assert sorted(a[0]) == sorted(b[0]) and a[1] == b[1], "결과 불일치"
+
+        t_naive = _time(naive, nouns, corpus, items)
+        t_ac = _time(automaton, nouns, corpus, items)
+        table.add_row(
+            str(len(nouns)),
+            str(corpus_kb),
+            f"{t_naive * 1000:.1f}",
+            f"{t_ac * 1000:.1f}",
+            f"{t_naive / t_ac:.1f}x",
+        )
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,10 +10,12 @@ from google.genai import types
 from google.genai.errors import ClientError
 from jinja2 import Environment, FileSystemLoader
 from pydantic import BaseModel
-from rich.console import Console
+
+from blog_agents.utils.console import AgentConsole
+from blog_agents.utils.quota import QuotaLedger, RateLimiter
 
 T = TypeVar("T", bound=BaseModel)
-console = Console()
+console = AgentConsole()
 
 
 class BaseAgent(ABC):
@@ -25,6 +27,11 @@ class BaseAgent(ABC):
         self.config = config
         self.model = model or config.models.get("writer", "gemini-2.0-flash")
         self.client = genai.Client(api_key=config.settings.gemini_api_key)
+        self.quota = QuotaLedger.for_path(
+            config.cache_dir / "quota_ledger.json",
+            config.quota.get("daily_limits", {}),
+        )
+        self.rate_limiter = RateLimiter.shared(config.quota.get("rpm_limits", {}))
         self.jinja_env = Environment(
             loader=FileSystemLoader(str(config.prompts_dir)),
             keep_trailing_newline=True,
@@ -126,6 +133,7 @@ class BaseAgent(ABC):
         system_prompt: str,
         user_message: str,
         max_tokens: int = 8192,
+        temperature: float = 0.8,
     ) -> str:
         """Gemini를 호출하여 자유 형식 텍스트를 반환받는다."""
         console.print(
@@ -138,7 +146,7 @@ class BaseAgent(ABC):
         response = self._call_with_retry(
             full_prompt,
             max_output_tokens=max_tokens,
-            temperature=0.8,
+            temperature=temperature,
         )
 
         return response.text
@@ -157,12 +165,15 @@ class BaseAgent(ABC):
         import re as _re
 
         for attempt in range(max_retries):
+            self.rate_limiter.wait(self.model)
             try:
-                return self.client.models.generate_content(
+                response = self.client.models.generate_content(
                     model=self.model,
                     contents=prompt,
                     config=types.GenerateContentConfig(**config_kwargs),
                 )
+                self.quota.record(self.model)
+                return response
             except ClientError as e:
                 err_str = str(e)
                 if "429" not in err_str:
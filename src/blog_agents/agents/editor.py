@@ -1,17 +1,33 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from rich.console import Console
 from rich.table import Table
 
 from blog_agents.agents.base import BaseAgent
 from blog_agents.models.content import Draft
 from blog_agents.models.research import ResearchBrief
-from blog_agents.models.review import EditReview
+from blog_agents.models.review import (
+    DimensionReview,
+    EditReview,
+    LineEdit,
+    ScoreDimension,
+)
+from blog_agents.utils.brief_renderer import EDITOR, BriefRenderer
+from blog_agents.utils.console import AgentConsole
+from blog_agents.utils.draft_lint import DraftLinter, LintReport
+from blog_agents.utils.grounding import GroundingIndex, GroundingReport
+from blog_agents.utils.review_merge import (
+    DIMENSION_GROUPS,
+    DimensionGroup,
+    merge_group_reviews,
+    missing_dimensions,
+)
+from blog_agents.utils.sections import DraftDiff, diff_drafts, render_section
 
-console = Console()
+console = AgentConsole()
 
 
 class EditorAgent(BaseAgent):
@@ -19,20 +35,89 @@ class EditorAgent(BaseAgent):
 
     agent_name = "편집장"
 
-    def __init__(self, config):
-        model = config.models.get("editor", "claude-sonnet-4-5-20250514")
+    def __init__(self, config, model: str | None = None):
+        model = model or config.models.get("editor", "claude-sonnet-4-5-20250514")
         super().__init__(config, model=model)
         self.approval_threshold = config.quality.get("approval_threshold", 7.0)
+        grounding = config.quality.get("grounding", {})
+        self.max_unsupported_ratio = grounding.get("max_unsupported_ratio", 0.4)
+        self.min_claims = grounding.get("min_claims", 5)
+        self.linter = DraftLinter(config.quality)
+        diff_review = config.quality.get("diff_review", {})
+        self.diff_review_enabled = diff_review.get("enabled", True)
+        self.max_diff_ratio = diff_review.get("max_changed_ratio", 0.4)
+        parallel_review = config.quality.get("parallel_review", {})
+        self.parallel_review_enabled = parallel_review.get("enabled", False)
+        self.parallel_concurrency = parallel_review.get("concurrency", 3)
 
-    def review_draft(self, draft: Draft, brief: ResearchBrief) -> EditReview:
-        """초안을 검토하고 구조화된 리뷰를 반환한다."""
+    def review_draft(
+        self,
+        draft: Draft,
+        brief: ResearchBrief,
+        previous: tuple[Draft, EditReview] | None = None,
+    ) -> EditReview:
+        """초안을 검토하고 구조화된 리뷰를 반환한다.
+
+        previous(직전 초안과 그 리뷰)가 주어지고 변경 폭이 작으면 전체 대신
+        이전 리뷰 + diff + 바뀐 섹션만 보내 점수를 갱신받는다.
+        """
         console.print(
             f'\n[bold magenta]편집장 에이전트: "{draft.title}" 검토 (v{draft.version})[/]'
         )
 
+        # 로컬 규격 점검: 치명적 위반이 있으면 LLM 호출 없이 반려
+        lint = self.linter.lint(draft, brief)
+        if lint.findings:
+            console.print(
+                f"  자동 점검: 치명 {len(lint.hard)}건, 참고 {len(lint.soft)}건",
+                style="dim",
+            )
+        if lint.hard:
+            for finding in lint.hard:
+                console.print(f"  [red]- {finding.message}[/]")
+            console.print("  [red]규격 위반 → 편집장 호출 생략, 반려[/]")
+            review = lint.to_review(
+                draft, max_score=max(1.0, self.approval_threshold - 1)
+            )
+            self._print_review(review)
+            return review
+
+        # 로컬 근거 검증: 근거 없는 주장이 너무 많으면 LLM 호출 없이 반려
+        grounding = GroundingIndex.from_brief(brief).score_draft(draft.full_markdown)
+        console.print(
+            f"  근거 검증: 주장 {grounding.claim_count}개 중 "
+            f"미확인 {grounding.unsupported_count}개 "
+            f"({grounding.unsupported_ratio:.0%})",
+            style="dim",
+        )
+        if (
+            grounding.claim_count >= self.min_claims
+            and grounding.unsupported_ratio > self.max_unsupported_ratio
+        ):
+            review = self._reject_ungrounded(draft, grounding)
+            self._print_review(review)
+            return review
+
         today = datetime.now().strftime("%Y년 %m월 %d일")
-        system_prompt = self._load_prompt("editor_agent.md", today=today)
-        user_message = self._format_for_review(draft, brief)
+        diff = self._diff_for_review(draft, previous)
+        if diff is None and self.parallel_review_enabled:
+            review = self._review_parallel(draft, brief, grounding, lint, today)
+            if review is not None:
+                review.draft_id = draft.id
+                review.draft_version = draft.version
+                review.approved = review.overall_score >= self.approval_threshold
+                self._print_review(review)
+                return review
+
+        system_prompt = self._load_prompt(
+            "editor_agent.md", today=today, diff_mode=diff is not None
+        )
+        if diff is not None:
+            user_message = self._format_diff_review(
+                draft, brief, previous[1], diff, grounding, lint
+            )
+        else:
+            user_message = self._format_for_review(draft, brief, grounding, lint)
 
         review = self._call_structured(
             system_prompt, user_message, EditReview, max_tokens=4096
@@ -41,6 +126,7 @@ class EditorAgent(BaseAgent):
         # 메타 정보 설정
         review.draft_id = draft.id
         review.draft_version = draft.version
+        review.review_mode = "diff" if diff is not None else "full"
 
         # 승인 여부 결정 (threshold 기반)
         review.approved = review.overall_score >= self.approval_threshold
@@ -50,51 +136,278 @@ class EditorAgent(BaseAgent):
 
         return review
 
-    def _format_for_review(self, draft: Draft, brief: ResearchBrief) -> str:
-        """초안과 리서치 브리핑을 검토용으로 포맷팅."""
-        parts = [
+    def _reject_ungrounded(
+        self, draft: Draft, grounding: GroundingReport
+    ) -> EditReview:
+        """근거 미확인 주장이 기준을 넘은 초안을 LLM 호출 없이 반려한다."""
+        ratio = grounding.unsupported_ratio
+        score = max(1.0, round(10 * (1 - ratio) - 2, 1))
+        weak = sorted(grounding.weak_sentences, key=lambda s: s.score)[:10]
+
+        console.print(
+            f"  [red]근거 미확인 주장 비율 {ratio:.0%} > "
+            f"{self.max_unsupported_ratio:.0%} → 편집장 호출 생략, 반려[/]"
+        )
+        return EditReview(
+            draft_id=draft.id,
+            draft_version=draft.version,
+            overall_score=score,
+            dimensions=[
+                ScoreDimension(
+                    dimension="사실정확성",
+                    score=score,
+                    feedback=(
+                        f"수치·날짜·인용 고유명사 {grounding.claim_count}개 중 "
+                        f"{grounding.unsupported_count}개가 브리핑·원본 자료에서 "
+                        f"확인되지 않습니다."
+                    ),
+                )
+            ],
+            approved=False,
+            review_mode="grounding",
+            revision_instructions=(
+                "브리핑과 원본 자료에 없는 수치·날짜·작품명·인명을 삭제하거나 "
+                "브리핑에 있는 표기로 바로잡으십시오. "
+                "근거가 없는 구체적 정보는 쓰지 마십시오."
+            ),
+            line_edits=[
+                LineEdit(
+                    location="근거 미확인 문장",
+                    original=s.sentence,
+                    suggestion="",
+                    reason=f"브리핑·원본 자료에 없음: {', '.join(s.unsupported)}",
+                )
+                for s in weak
+            ],
+        )
+
+    def _review_parallel(
+        self,
+        draft: Draft,
+        brief: ResearchBrief,
+        grounding: GroundingReport,
+        lint: LintReport,
+        today: str,
+    ) -> EditReview | None:
+        """차원 그룹별로 짧은 구조화 호출을 동시에 보내고 결과를 병합한다.
+
+        그룹 하나라도 실패하거나 맡은 차원 중 하나라도 점수를 매기지 않으면
+        None을 반환해 기존 단일 호출 검토로 돌아간다 (빠진 차원의 가중치가
+        다른 차원으로 넘어가 사실정확성 평가 없이 승인되는 일을 막는다).
+        """
+        workers = max(1, min(self.parallel_concurrency, len(DIMENSION_GROUPS)))
+        console.print(
+            f"  차원 그룹별 병렬 검토: {len(DIMENSION_GROUPS)}개 그룹, 동시 {workers}개",
+            style="dim",
+        )
+
+        def review_group(group: DimensionGroup) -> DimensionReview:
+            system_prompt = self._load_prompt(
+                "editor_dimension.md",
+                today=today,
+                label=group.label,
+                dimensions=group.dimensions,
+            )
+            user_message = self._format_group_review(
+                group, draft, brief, grounding, lint
+            )
+            partial = self._call_structured(
+                system_prompt, user_message, DimensionReview, max_tokens=2048
+            )
+            missing = missing_dimensions(group, partial)
+            if missing:
+                raise ValueError(f"평가 누락: {', '.join(missing)}")
+            return partial
+
+        results: list[tuple[DimensionGroup, DimensionReview]] = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="review") as pool:
+            futures = {pool.submit(review_group, g): g for g in DIMENSION_GROUPS}
+            for future, group in futures.items():
+                try:
+                    results.append((group, future.result()))
+                except Exception as e:
+                    console.print(
+                        f"  [yellow]{group.label} 검토 실패 ({e}) → 전체 검토로 전환[/]"
+                    )
+                    for other in futures:
+                        other.cancel()
+                    return None
+
+        return merge_group_reviews(results)
+
+    def _format_group_review(
+        self,
+        group: DimensionGroup,
+        draft: Draft,
+        brief: ResearchBrief,
+        grounding: GroundingReport,
+        lint: LintReport,
+    ) -> str:
+        """그룹이 맡은 차원에 필요한 자료만 담은 검토 요청.
+
+        사실·지식 그룹은 브리핑 전문과 근거 검증 표·원본 검색 결과를,
+        SEO·실용성 그룹은 타겟 키워드와 전시 기본 정보를 받는다.
+        문체·구성 그룹은 초안만 본다.
+        """
+        parts: list[str] = []
+        if group.name == "facts":
+            parts.append(BriefRenderer.for_brief(brief).render(EDITOR))
+            parts.append("\n---\n")
+        elif group.name == "seo":
+            topic = brief.topic
+            parts.append(f"# 작성 기준: {topic.title}")
+            parts.append(f"\n## 타겟 키워드\n{', '.join(topic.target_keywords)}")
+            parts.append(f"\n## 작성 관점\n{topic.angle}")
+            if brief.exhibition_info:
+                parts.append("\n## 전시 기본 정보")
+                parts.extend(f"- {item}" for item in brief.exhibition_info)
+            parts.append("\n---\n")
+
+        parts.extend([
             "# 검토 대상 초안",
             f"제목: {draft.title}",
             f"카테고리: {draft.category.display_name}",
             f"버전: v{draft.version}",
             f"글자 수: {len(draft.full_markdown)}자",
             f"\n## 초안 본문\n{draft.full_markdown}",
-            "\n---\n",
-            "# 원본 리서치 브리핑 (팩트체크 기준)",
-            f"\n## 배경\n{brief.background_context}",
-        ]
+        ])
 
-        if brief.key_facts:
-            parts.append("\n## 핵심 팩트 (초안과 교차 검증할 것)")
-            for fact in brief.key_facts:
-                parts.append(f"- {fact}")
+        if group.name == "facts":
+            parts.append("\n---\n")
+            parts.append("# 근거 검증 결과 (원본 검색 결과 대조)")
+            parts.append(grounding.to_table())
+            if brief.raw_source_snippets:
+                parts.append("\n# 원본 검색 결과 (수집된 원시 데이터)")
+                parts.append(brief.raw_source_snippets)
 
-        if brief.exhibition_info:
-            parts.append("\n## 전시 기본 정보 (일정·장소·요금 정확성 확인)")
-            for info in brief.exhibition_info:
-                parts.append(f"- {info}")
+        lint_notes = lint.to_prompt(group.dimensions)
+        if lint_notes:
+            parts.append("\n---\n")
+            parts.append("# 자동 규격 점검 (참고)")
+            parts.append(lint_notes)
 
-        if brief.artist_info:
-            parts.append("\n## 작가 정보 (약력·작품세계 정확성 확인)")
-            for info in brief.artist_info:
-                parts.append(f"- {info}")
+        parts.append(
+            "\n---\n"
+            f"위 초안을 {', '.join(group.dimensions)} 차원으로만 평가하고 "
+            "구체적인 피드백과 수정 요청을 제공해주세요."
+        )
+        return "\n".join(parts)
 
-        if brief.artwork_highlights:
-            parts.append("\n## 주요 작품 (작품명·매체·해석 정확성 확인)")
-            for work in brief.artwork_highlights:
-                parts.append(f"- {work}")
+    def _diff_for_review(
+        self, draft: Draft, previous: tuple[Draft, EditReview] | None
+    ) -> DraftDiff | None:
+        """diff 검토가 가능하면 변경 요약을, 아니면 None(전체 검토)을 반환한다."""
+        if not self.diff_review_enabled or previous is None:
+            return None
+        prev_draft, prev_review = previous
+        # 로컬 자동 반려 리뷰는 편집장이 글을 본 적이 없으므로 전체 검토
+        if prev_review.review_mode not in ("full", "parallel", "diff"):
+            return None
+        diff = diff_drafts(prev_draft.full_markdown, draft.full_markdown)
+        if diff.changed_ratio > self.max_diff_ratio:
+            console.print(
+                f"  변경 폭 {diff.changed_ratio:.0%} > {self.max_diff_ratio:.0%} → 전체 검토",
+                style="dim",
+            )
+            return None
+        console.print(
+            f"  변경분 검토: 변경 {diff.changed_ratio:.0%}, "
+            f"섹션 {len(diff.changed_sections)}개",
+            style="dim",
+        )
+        return diff
 
-        if brief.data_points:
-            parts.append("\n## 데이터 (수치 정확성 확인)")
-            for dp in brief.data_points:
-                parts.append(f"- {dp}")
+    def _format_diff_review(
+        self,
+        draft: Draft,
+        brief: ResearchBrief,
+        prev_review: EditReview,
+        diff: DraftDiff,
+        grounding: GroundingReport,
+        lint: LintReport,
+    ) -> str:
+        """직전 리뷰·diff·바뀐 섹션만으로 구성한 재검토 요청."""
+        parts = [
+            "# 재검토 요청 (변경분)",
+            f"제목: {draft.title}",
+            f"버전: v{prev_review.draft_version} → v{draft.version}",
+            f"글자 수: {len(draft.full_markdown)}자",
+            f"SEO 키워드: {', '.join(brief.topic.target_keywords)}",
+            f"\n## 직전 리뷰 (v{prev_review.draft_version}, "
+            f"종합 {prev_review.overall_score:.1f}점)",
+        ]
+        for dim in prev_review.dimensions:
+            parts.append(f"- {dim.dimension}: {dim.score:.1f}점 — {dim.feedback}")
+        if prev_review.line_edits:
+            parts.append("\n### 직전 수정 요청")
+            for edit in prev_review.line_edits:
+                line = f"- [{edit.location}] {edit.reason}"
+                if edit.original:
+                    line += f' (원문: "{edit.original[:80]}")'
+                parts.append(line)
+        if prev_review.strengths:
+            parts.append("\n### 직전 강점")
+            parts.extend(f"- {s}" for s in prev_review.strengths)
+
+        parts.append("\n## 변경 내역 (unified diff)")
+        parts.append(f"```diff\n{diff.unified}\n```")
+
+        if diff.changed_sections:
+            parts.append("\n## 변경된 섹션 전문")
+            for section in diff.changed_sections:
+                parts.append(render_section(section).strip())
+                parts.append("")
+
+        parts.append("\n---\n")
+        parts.append("# 근거 검증 결과 (전체 초안 기준, 원본 검색 결과 대조)")
+        parts.append(grounding.to_table())
+        if lint.findings:
+            parts.append("\n# 자동 규격 점검 (참고)")
+            parts.append(lint.to_prompt())
 
         parts.append(
-            f"\n## SEO 키워드\n{', '.join(brief.topic.target_keywords)}"
+            "\n---\n"
+            "직전 리뷰의 수정 요청이 반영되었는지 확인하고 6가지 차원 점수를 갱신해주세요. "
+            "변경되지 않은 부분은 직전 평가를 유지하되, 변경으로 새로 생긴 문제는 "
+            "반드시 지적하십시오. 리뷰 형식은 전체 검토와 같습니다."
         )
+        return "\n".join(parts)
+
+    def _format_for_review(
+        self,
+        draft: Draft,
+        brief: ResearchBrief,
+        grounding: GroundingReport | None = None,
+        lint: LintReport | None = None,
+    ) -> str:
+        """초안과 리서치 브리핑을 검토용으로 포맷팅.
+
+        브리핑(작가 프롬프트와 같은 렌더링)을 맨 앞에 두어 같은 브리핑의
+        검토 요청끼리 메시지 앞부분이 같도록 한다.
+        """
+        parts = [
+            BriefRenderer.for_brief(brief).render(EDITOR),
+            "\n---\n",
+            "# 검토 대상 초안",
+            f"제목: {draft.title}",
+            f"카테고리: {draft.category.display_name}",
+            f"버전: v{draft.version}",
+            f"글자 수: {len(draft.full_markdown)}자",
+            f"\n## 초안 본문\n{draft.full_markdown}",
+        ]
 
-        # 원본 검색 결과 스니펫 (교차 검증용)
-        if brief.raw_source_snippets:
+        # 원본 자료 대비 로컬 근거 검증 결과 (원시 스니펫 대신 요약 표)
+        if grounding is not None:
+            parts.append("\n---\n")
+            parts.append("# 근거 검증 결과 (원본 검색 결과 대조)")
+            parts.append(
+                "초안의 수치·날짜·인용 고유명사를 브리핑과 원본 검색 결과에 "
+                "자동 대조한 결과입니다.\n"
+                "근거 미확인 주장이 초안에 남아 있으면 "
+                "**사실 정확성 자동 감점** 대상입니다.\n"
+            )
+            parts.append(grounding.to_table())
+        elif brief.raw_source_snippets:
             parts.append("\n---\n")
             parts.append("# 원본 검색 결과 (수집된 원시 데이터)")
             parts.append(
@@ -106,12 +419,21 @@ class EditorAgent(BaseAgent):
             )
             parts.append(brief.raw_source_snippets)
 
+        if lint is not None and lint.findings:
+            parts.append("\n---\n")
+            parts.append("# 자동 규격 점검 (참고)")
+            parts.append(
+                "분량·소제목·키워드·고유명사를 자동 점검한 결과입니다. "
+                "해당 차원 평가와 수정 제안에 반영하십시오.\n"
+            )
+            parts.append(lint.to_prompt())
+
         parts.append(
             "\n---\n"
             "위 초안을 6가지 차원(사실정확성, 문화예술지식, 가독성·문체, SEO, "
             "구성/논리, 실용성/정보가치)으로 평가하고 구체적인 피드백을 제공해주세요.\n\n"
             "**특히 다음 사항을 철저히 검증하세요:**\n"
-            "- 작품명, 인물명, 장소명이 원본 검색 결과에 실제로 존재하는지\n"
+            "- 작품명, 인물명, 장소명이 브리핑·근거 검증 결과와 일치하는지\n"
             "- 전시 일정, 장소, 입장료 등 기본 정보의 정확성\n"
             "- 작가명, 작품명, 용어의 정확성\n"
             "- 독자에게 매력적인 소개와 실용 정보가 있는지\n"
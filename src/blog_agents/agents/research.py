@@ -1,11 +1,8 @@
 from __future__ import annotations
 
 import json
-import re
 from datetime import datetime
 
-from rich.console import Console
-
 from blog_agents.agents.base import BaseAgent
 from blog_agents.models.research import (
     ContentCategory,
@@ -16,11 +13,25 @@ from blog_agents.models.research import (
     TopicSuggestion,
     TopicSuggestionList,
 )
+from blog_agents.tools.prompt_packer import PromptPacker
+from blog_agents.tools.relevance import IdfHistory, RankedItem, rank_items
 from blog_agents.tools.rss_reader import RSSReader
 from blog_agents.tools.search import WebSearcher
+from blog_agents.tools.source_health import SourceHealth
+from blog_agents.tools.transport import HttpTransport
 from blog_agents.tools.web_scraper import ExhibitionScraper
+from blog_agents.utils.brief_sanitizer import (
+    BriefSanitizer,
+    SanitizeReport,
+    extract_proper_nouns,
+)
+from blog_agents.utils.cache import BriefCache, TopicCache, raw_data_hash
+from blog_agents.utils.console import AgentConsole, quiet_output
+from blog_agents.utils.history import PublishedIndex
+from blog_agents.utils.text_match import MultiPatternMatcher
+from blog_agents.utils.urls import dedupe_by_url
 
-console = Console()
+console = AgentConsole()
 
 
 class ResearchAgent(BaseAgent):
@@ -31,14 +42,56 @@ class ResearchAgent(BaseAgent):
     def __init__(self, config):
         model = config.models.get("research", "claude-haiku-4-5-20250514")
         super().__init__(config, model=model)
-        self.rss_reader = RSSReader(config.sources)
-        self.scraper = ExhibitionScraper()
-        self.searcher = WebSearcher()
+        # 세 도구가 하나의 커넥션 풀·호스트별 동시성 제한을 공유
+        self.http = HttpTransport.from_config(config.network)
+        self.source_health = SourceHealth.from_config(
+            config.cache_dir / "source_health.json", config.source_health
+        )
+        self.rss_reader = RSSReader(
+            config.sources, transport=self.http, health=self.source_health
+        )
+        self.scraper = ExhibitionScraper(
+            cache_dir=config.cache_dir / "articles",
+            transport=self.http,
+            health=self.source_health,
+        )
+        self.searcher = WebSearcher(transport=self.http)
+        self.brief_cache = BriefCache(
+            config.cache_dir / "briefs",
+            max_age_hours=config.research.get("brief_cache_max_age_hours", 12),
+        )
+        self.topic_cache = TopicCache(config.cache_dir / "topics", tz=config.timezone)
+        # 카테고리 파이프라인이 동시에 돌아도 df 갱신이 서로 덮어쓰지 않도록 공유
+        self.idf_history = IdfHistory(config.cache_dir / "idf_history.json")
+        self.published_index = PublishedIndex(
+            config.output_dir / "published", config.cache_dir / "published_index.json"
+        )
+
+    def discover_topics(
+        self, category: ContentCategory, refresh: bool = False
+    ) -> list[TopicSuggestion]:
+        """카테고리별 최신 전시 정보를 수집하고 블로그 토픽을 제안한다.
 
-    def discover_topics(self, category: ContentCategory) -> list[TopicSuggestion]:
-        """카테고리별 최신 전시 정보를 수집하고 블로그 토픽을 제안한다."""
+        같은 날 이미 제안한 토픽이 있으면 수집 없이 그대로 반환한다.
+        refresh=True면 다시 수집하되, 수집 데이터가 그대로면 LLM 호출은 생략한다.
+        """
         console.print(f"\n[bold blue]리서치 에이전트: {category.display_name} 토픽 탐색[/]")
 
+        self.published_index.refresh()
+        cached = self.topic_cache.get(category)
+        if cached is not None:
+            # 캐시 이후 발행된 글과 겹치는 토픽은 다시 걸러낸다
+            cached = (self._screen_published(cached[0]), cached[1])
+            if not cached[0]:
+                cached = None
+        if cached is not None and not refresh:
+            topics, _ = cached
+            console.print(
+                f"  [green]오늘 제안된 토픽 {len(topics)}개 재사용[/] "
+                "(--refresh로 새로 수집)"
+            )
+            return topics
+
         mapping = self.config.sources.get("category_source_mapping", {}).get(
             category.value, {}
         )
@@ -47,10 +100,17 @@ class ResearchAgent(BaseAgent):
             category, mapping
         )
 
-        # 수집 데이터를 Claude에게 전달하여 토픽 제안
-        raw_data = self._format_raw_data(
-            rss_items, scraped_items, search_results, category
+        # 카테고리 관련도 순으로 정렬·선별한 뒤 프롬프트용 텍스트로 변환
+        ranked = self._rank_collected_items(
+            rss_items, scraped_items, search_results, mapping
         )
+        total = len(rss_items) + len(scraped_items) + len(search_results)
+        raw_data = self._format_raw_data(ranked, total, category)
+        raw_hash = raw_data_hash(raw_data)
+
+        if cached is not None and cached[1] == raw_hash:
+            console.print("  [green]수집 데이터 변화 없음 - 기존 토픽 재사용[/]")
+            return cached[0]
 
         today = datetime.now().strftime("%Y년 %m월 %d일")
         system_prompt = self._load_prompt(
@@ -63,6 +123,16 @@ class ResearchAgent(BaseAgent):
             f"이 데이터를 분석하여 블로그 포스트로 작성하기 좋은 토픽 3개를 제안해주세요.\n\n"
             f"{raw_data}"
         )
+        recent = self.published_index.recent_titles(
+            category.value,
+            days=self.config.research.get("exclude_recent_days", 90),
+            limit=self.config.research.get("exclude_max_titles", 20),
+        )
+        if recent:
+            user_message += (
+                "\n\n### 이미 발행한 글 (같거나 비슷한 주제는 제안하지 마세요)\n"
+                + "\n".join(f"- {t}" for t in recent)
+            )
 
         result = self._call_structured(
             system_prompt, user_message, TopicSuggestionList
@@ -74,6 +144,9 @@ class ResearchAgent(BaseAgent):
 
         # 토픽 제목 검증: raw_data에 없는 고유명사가 제목에 포함되면 제거
         result.topics = self._validate_topic_titles(result.topics, raw_data)
+        result.topics = self._screen_published(result.topics)
+        if result.topics:
+            self.topic_cache.put(category, result.topics, raw_hash)
 
         console.print(
             f"  [green]토픽 {len(result.topics)}개 제안 완료[/]"
@@ -81,19 +154,45 @@ class ResearchAgent(BaseAgent):
         return result.topics
 
     def build_brief(
-        self, topic: TopicSuggestion, category: ContentCategory
+        self,
+        topic: TopicSuggestion,
+        category: ContentCategory,
+        refresh: bool = False,
+        quiet: bool = False,
     ) -> ResearchBrief:
-        """선택된 토픽에 대한 상세 리서치 브리핑을 생성한다."""
+        """선택된 토픽에 대한 상세 리서치 브리핑을 생성한다.
+
+        유효 기간 내에 같은 토픽으로 만든 브리핑이 있으면 재사용한다
+        (refresh=True면 무시하고 새로 조사). quiet=True면 이 호출 동안
+        현재 스레드의 에이전트·도구 로그를 출력하지 않는다 (백그라운드 사전 생성용).
+        """
+        if quiet:
+            with quiet_output():
+                return self.build_brief(topic, category, refresh)
+
         console.print(
             f'\n[bold blue]리서치 에이전트: "{topic.title}" 심층 조사[/]'
         )
 
+        if not refresh:
+            cached = self.brief_cache.get(topic.title, category)
+            if cached is not None:
+                # 캐시 시점과 오늘 사이의 날짜 판정 차이를 다시 정리
+                report = BriefSanitizer().run(cached)
+                self._print_sanitize_report(report)
+                age_hours = (datetime.now() - cached.created_at).total_seconds() / 3600
+                console.print(
+                    f"  [green]캐시된 브리핑 재사용 ({age_hours:.1f}시간 전 생성)[/]"
+                )
+                return cached
+
         # 토픽 관련 추가 검색
         console.print("  심층 검색 중...", style="dim")
         deep_results = self.searcher.search_news(topic.title, max_results=5)
         for kw in topic.target_keywords[:2]:
             more = self.searcher.search_news(kw, max_results=3)
             deep_results.extend(more)
+        deep_results = dedupe_by_url(deep_results, key=lambda r: r.url)
 
         # 소스 구성
         sources = [
@@ -118,6 +217,11 @@ class ResearchAgent(BaseAgent):
             for r in deep_results
         )
 
+        # 상위 출처의 기사 본문으로 근거 보강
+        article_context = self._fetch_article_context(deep_results)
+        if article_context:
+            search_context += "\n\n" + article_context
+
         user_message = (
             f"## 선정된 토픽\n"
             f"- 제목: {topic.title}\n"
@@ -145,22 +249,23 @@ class ResearchAgent(BaseAgent):
 
         # 할루시네이션 검증: 브리핑의 고유명사가 원본 자료에 존재하는지 확인
         console.print("  브리핑 팩트 검증 중...", style="dim")
-        valid_urls = {r.url for r in deep_results}
-        brief_output = self._validate_brief(brief_output, deep_results, topic)
-        self._validate_urls(brief_output, valid_urls)
-        self._detect_date_repetition(brief_output.key_facts)
 
-        # 미래 날짜 사후 검증 및 제거
-        brief_output.key_facts = self._sanitize_future_dates(brief_output.key_facts)
-        brief_output.data_points = self._sanitize_future_dates(brief_output.data_points)
-        brief_output.expert_opinions = self._sanitize_future_dates(brief_output.expert_opinions)
+        # 가짜 URL·미래 날짜 제거, 날짜 반복 집계, 고유명사 추출을 한 번에 수행
+        report = BriefSanitizer(valid_urls={r.url for r in deep_results}).run(
+            brief_output
+        )
+        self._print_sanitize_report(report)
+        brief_output = self._validate_brief(
+            brief_output, deep_results, topic,
+            extra_corpus=article_context, report=report,
+        )
 
         # ResearchBrief 조립
         brief = ResearchBrief(
             category=category,
             topic=topic,
             sources=sources,
-            background_context=self._remove_future_dates_from_text(brief_output.background_context),
+            background_context=brief_output.background_context,
             key_facts=brief_output.key_facts,
             exhibition_info=brief_output.exhibition_info,
             artist_info=brief_output.artist_info,
@@ -169,7 +274,9 @@ class ResearchAgent(BaseAgent):
             data_points=brief_output.data_points,
             related_topics=brief_output.related_topics,
             raw_source_snippets=search_context,
+            sanitize_report=report.to_dict(),
         )
+        self.brief_cache.put(brief)
 
         console.print(
             f"  [green]리서치 브리핑 완료 "
@@ -179,6 +286,33 @@ class ResearchAgent(BaseAgent):
         )
         return brief
 
+    def _fetch_article_context(self, deep_results: list) -> str:
+        """상위 검색 결과의 기사 본문을 가져와 프롬프트용 텍스트로 만든다."""
+        top_n = self.config.research.get("article_fetch_top_n", 3)
+        max_chars = self.config.research.get("article_max_chars", 1500)
+        if top_n <= 0:
+            return ""
+
+        # 디코딩되지 않은 Google News 리다이렉트 URL은 본문을 얻을 수 없으므로 제외
+        targets = [
+            r for r in deep_results
+            if r.url and "news.google.com" not in r.url
+        ][:top_n]
+        if not targets:
+            return ""
+
+        console.print("  기사 본문 수집 중...", style="dim")
+        bodies = self.scraper.fetch_articles(
+            [r.url for r in targets], max_chars=max_chars
+        )
+
+        parts = []
+        for r in targets:
+            body = bodies.get(r.url, "")
+            if body:
+                parts.append(f"### 기사 본문: {r.title}\n출처: {r.url}\n{body}")
+        return "\n\n".join(parts)
+
     def _collect_exhibition_data(self, category, mapping):
         """전시 관련 데이터 수집."""
         # 1. RSS 피드 수집
@@ -194,6 +328,7 @@ class ResearchAgent(BaseAgent):
             if institution in scrape_config:
                 items = self.scraper.scrape_exhibitions(institution)
                 scraped_items.extend(items)
+        self.source_health.save()
 
         # 3. 키워드 기반 뉴스 검색
         console.print("  전시 뉴스 검색 중...", style="dim")
@@ -202,99 +337,105 @@ class ResearchAgent(BaseAgent):
         for kw in keywords[:3]:
             results = self.searcher.search_news(f"{kw} 2026", max_results=3)
             search_results.extend(results)
+        search_results = dedupe_by_url(search_results, key=lambda r: r.url)
 
         return rss_items, scraped_items, search_results
 
-    def _format_raw_data(
-        self, rss_items, scraped_items, search_results, category
-    ) -> str:
-        """수집 데이터를 텍스트로 포맷팅."""
-        parts = []
-
-        if rss_items:
-            parts.append("### RSS 피드 (최근 전시 뉴스)")
-            for item in rss_items[:30]:
-                date_str = (
-                    item.published.strftime("%m/%d") if item.published else "?"
-                )
-                parts.append(
-                    f"- [{date_str}] {item.title} ({item.source})"
-                )
-                if item.summary:
-                    parts.append(f"  요약: {item.summary[:500]}")
-
-        if scraped_items:
-            parts.append("\n### 미술관/갤러리 전시 목록")
-            for item in scraped_items[:15]:
-                parts.append(
-                    f"- [{item.date or '?'}] {item.title} ({item.source})"
-                )
+    def _rank_collected_items(
+        self, rss_items, scraped_items, search_results, mapping
+    ) -> list[RankedItem]:
+        """수집 항목 전체를 카테고리 키워드 기준 BM25로 순위화한다."""
+        items = [
+            RankedItem(
+                kind="rss",
+                title=it.title,
+                text=it.summary,
+                source=it.source,
+                date=it.published.strftime("%m/%d") if it.published else "?",
+                published=it.published,
+                url=it.url,
+                item=it,
+            )
+            for it in rss_items
+        ]
+        items += [
+            RankedItem(
+                kind="scraped",
+                title=it.title,
+                text="",
+                source=it.source,
+                date=it.date or "?",
+                url=it.url,
+                item=it,
+            )
+            for it in scraped_items
+        ]
+        items += [
+            RankedItem(
+                kind="search",
+                title=it.title,
+                text=it.snippet,
+                url=it.url,
+                item=it,
+            )
+            for it in search_results
+        ]
 
-        if search_results:
-            parts.append("\n### 전시 뉴스 검색 결과")
-            for item in search_results[:15]:
-                parts.append(f"- {item.title}")
-                if item.snippet:
-                    parts.append(f"  {item.snippet[:500]}")
+        ranked = rank_items(
+            items, mapping.get("search_keywords", []), self.idf_history
+        )
+        self.idf_history.save()
+        return ranked
 
-        parts.append(f"\n### 카테고리: {category.display_name}")
+    def _format_raw_data(
+        self, ranked: list[RankedItem], total: int, category
+    ) -> str:
+        """관련도 상위 항목을 모델별 토큰 예산 안에서 출처 유형별로 포맷팅."""
         mapping = self.config.sources.get("category_source_mapping", {}).get(
             category.value, {}
         )
         keywords = mapping.get("search_keywords", [])
-        parts.append(f"주요 키워드: {', '.join(keywords)}")
-
-        total = len(rss_items) + len(scraped_items) + len(search_results)
-        parts.append(f"\n총 수집 자료: {total}건")
-
-        return "\n".join(parts)
-
-    @staticmethod
-    def _sanitize_future_dates(items: list[str]) -> list[str]:
-        """리스트의 각 항목에서 미래 날짜를 제거한다."""
-        today = datetime.now()
-        sanitized = []
-        for item in items:
-            sanitized.append(ResearchAgent._remove_future_dates_from_text(item))
-        return sanitized
-
-    @staticmethod
-    def _remove_future_dates_from_text(text: str) -> str:
-        """텍스트에서 미래 날짜를 매체명만 남기고 제거한다.
-
-        예: "(한국경제, 2026.2.23)" → "(한국경제)"
-            "(2026.2.23)" → ""
-        """
-        today = datetime.now()
-
-        def check_and_replace(match):
-            full = match.group(0)
-            year = int(match.group("year"))
-            month = int(match.group("month"))
-            day = int(match.group("day"))
-            try:
-                date = datetime(year, month, day)
-                if date.date() > today.date():
-                    # 미래 날짜 → 날짜 부분만 제거
-                    # 앞에 매체명이 있으면 매체명만 남기기
-                    prefix = match.group("prefix")
-                    if prefix:
-                        return f"({prefix.rstrip(', ')})"
-                    return ""
-            except ValueError:
-                pass
-            return full
-
-        # 패턴: (매체명, YYYY.M.DD) 또는 (YYYY.M.DD)
-        pattern = re.compile(
-            r"\((?P<prefix>[^()]*?,\s*)?(?P<year>20\d{2})\.(?P<month>\d{1,2})\.(?P<day>\d{1,2})\)"
+        packer = PromptPacker.from_config(self.config.research, self.model)
+        footer = (
+            f"\n### 카테고리: {category.display_name}\n"
+            f"주요 키워드: {', '.join(keywords[:10])}"
+        )
+        result = packer.pack(ranked, footer=footer)
+        console.print(
+            f"  프롬프트 패킹: {len(result.included)}/{len(ranked)}건, "
+            f"약 {result.used_tokens:,}/{result.budget:,} 토큰 "
+            f"(제외 {result.dropped}건, 요약 축약 {result.trimmed}건)",
+            style="dim",
+        )
+        return (
+            f"{result.text}\n\n"
+            f"총 수집 자료: {total}건 (우선순위 상위 {len(result.included)}건 표시)"
         )
-        return pattern.sub(check_and_replace, text)
 
     # ------------------------------------------------------------------
     # 할루시네이션 검증 메서드
     # ------------------------------------------------------------------
 
+    def _screen_published(
+        self, topics: list[TopicSuggestion]
+    ) -> list[TopicSuggestion]:
+        """이미 발행한 글과 주제가 겹치는 토픽을 제거한다."""
+        threshold = self.config.research.get("duplicate_threshold", 0.65)
+        kept = []
+        for topic in topics:
+            matches = self.published_index.find_similar(
+                topic.title, topic.target_keywords, threshold=threshold
+            )
+            if matches:
+                top = matches[0]
+                console.print(
+                    f'  [yellow]발행 이력 중복 제거: "{topic.title}" '
+                    f'≈ "{top.entry.title}" ({top.entry.date}, 유사도 {top.score:.2f})[/]'
+                )
+                continue
+            kept.append(topic)
+        return kept
+
     def _validate_topic_titles(
         self,
         topics: list[TopicSuggestion],
@@ -305,21 +446,30 @@ class ResearchAgent(BaseAgent):
         Gemini가 토픽 제안 시 영화 제목 등을 날조하는 패턴을 방지한다.
         예: 자료에 "넘버원"만 있는데 "넘버원 리미니트 밥상"으로 변형.
         """
-        corpus_lower = raw_data.lower()
-
-        for topic in topics:
-            # 제목에서 따옴표로 감싼 고유명사 추출
-            quoted = self.extract_proper_nouns(topic.title)
+        # 모든 토픽의 고유명사와 그 구성 단어를 한 번에 코퍼스에서 찾는다
+        nouns_by_topic = [self.extract_proper_nouns(t.title) for t in topics]
+        candidates = {
+            term
+            for nouns in nouns_by_topic
+            for noun in nouns
+            for term in [noun, *noun.split()]
+        }
+        found = {
+            term.lower()
+            for term in MultiPatternMatcher(candidates).find(raw_data)
+        }
+
+        for topic, quoted in zip(topics, nouns_by_topic):
             for noun in quoted:
                 # 원본 데이터에 존재하면 OK
-                if noun.lower() in corpus_lower:
+                if noun.lower() in found:
                     continue
                 # 부분 매칭: 고유명사의 핵심 단어가 corpus에 있는지
                 words = noun.split()
                 if len(words) <= 1:
                     continue
                 # 각 단어 중 corpus에 있는 것만 남겨서 복원
-                found_words = [w for w in words if w.lower() in corpus_lower]
+                found_words = [w for w in words if w.lower() in found]
                 if found_words and len(found_words) < len(words):
                     original = noun
                     corrected = " ".join(found_words)
@@ -338,50 +488,49 @@ class ResearchAgent(BaseAgent):
         '...', "...", 《...》, 「...」 패턴을 인식한다.
         2글자 미만 결과는 제외한다.
         """
-        patterns = [
-            r"['\u2018\u2019]([^'\u2018\u2019]+?)['\u2018\u2019]",
-            r"\u201c([^\u201d]+?)\u201d",
-            r"《([^》]+?)》",
-            r"「([^」]+?)」",
-        ]
-        terms = set()
-        for pat in patterns:
-            terms.update(re.findall(pat, text))
-        return {t.strip() for t in terms if len(t.strip()) >= 2}
+        return extract_proper_nouns(text)
 
     def _validate_brief(
         self,
         brief_output: ResearchBriefOutput,
         deep_results: list,
         topic: TopicSuggestion,
+        extra_corpus: str = "",
+        report: SanitizeReport | None = None,
     ) -> ResearchBriefOutput:
         """브리핑의 고유명사가 원본 검색 결과에 존재하는지 검증한다.
 
         원본에 없는 고유명사를 포함한 항목은 제거하고 경고를 출력한다.
+        extra_corpus(수집한 기사 본문 등)도 근거 자료로 인정한다.
+        report가 주어지면 이미 추출된 고유명사를 쓰고 제거 항목을 기록한다.
         """
         # 원본 자료 코퍼스 구성
         source_corpus = " ".join(
-            f"{r.title} {r.snippet}" for r in deep_results
-        ).lower()
-
-        # 브리핑 전체 텍스트에서 고유명사 추출
-        all_brief_text = "\n".join(
-            [brief_output.background_context]
-            + brief_output.key_facts
-            + brief_output.exhibition_info
-            + brief_output.artist_info
-            + brief_output.artwork_highlights
+            [f"{r.title} {r.snippet}" for r in deep_results] + [extra_corpus]
         )
-        proper_nouns = self.extract_proper_nouns(all_brief_text)
+
+        # 브리핑 전체 텍스트에서 고유명사 추출 (정제 패스에서 이미 추출했으면 재사용)
+        if report is not None:
+            proper_nouns = report.proper_nouns
+        else:
+            all_brief_text = "\n".join(
+                [brief_output.background_context]
+                + brief_output.key_facts
+                + brief_output.exhibition_info
+                + brief_output.artist_info
+                + brief_output.artwork_highlights
+            )
+            proper_nouns = self.extract_proper_nouns(all_brief_text)
 
         if not proper_nouns:
             return brief_output
 
-        # 각 고유명사가 원본에 존재하는지 확인
-        ungrounded = []
-        for noun in proper_nouns:
-            if noun.lower() not in source_corpus:
-                ungrounded.append(noun)
+        # 각 고유명사가 원본에 존재하는지 확인 (코퍼스 1회 스캔)
+        grounded = {
+            noun.lower()
+            for noun in MultiPatternMatcher(proper_nouns).find(source_corpus)
+        }
+        ungrounded = sorted(n for n in proper_nouns if n.lower() not in grounded)
 
         if not ungrounded:
             console.print("  [green]고유명사 검증 통과[/]")
@@ -395,14 +544,20 @@ class ResearchAgent(BaseAgent):
             console.print(f"    - '{term}'", style="yellow")
 
         # 불일치 고유명사를 포함한 항목 제거
+        ungrounded_matcher = MultiPatternMatcher(ungrounded)
         for field_name in [
             "key_facts", "artist_info", "artwork_highlights", "exhibition_info",
         ]:
             items = getattr(brief_output, field_name)
             filtered = [
                 item for item in items
-                if not any(term in item for term in ungrounded)
+                if not ungrounded_matcher.contains_any(item)
             ]
+            if report is not None:
+                report.removed_items.extend(
+                    {"field": field_name, "item": item}
+                    for item in items if item not in filtered
+                )
             removed = len(items) - len(filtered)
             if removed > 0:
                 console.print(
@@ -420,66 +575,25 @@ class ResearchAgent(BaseAgent):
 
         return brief_output
 
-    def _validate_urls(
-        self, brief_output: ResearchBriefOutput, valid_urls: set[str]
-    ) -> None:
-        """브리핑 텍스트 내 URL이 실제 수집된 URL인지 확인하고 가짜 URL을 제거한다."""
-        url_pattern = re.compile(r"https?://[^\s),\]]+")
-
-        def replace_invalid(match: re.Match) -> str:
-            url = match.group(0).rstrip(")")
-            # 수집된 URL 중 하나와 prefix가 일치하면 유효
-            if any(
-                url.startswith(v) or v.startswith(url) for v in valid_urls
-            ):
-                return match.group(0)
+    @staticmethod
+    def _print_sanitize_report(report: SanitizeReport) -> None:
+        """정제 결과(가짜 URL·미래 날짜·날짜 반복)를 콘솔에 출력한다."""
+        for entry in report.removed_urls:
+            console.print(f"    [yellow]가짜 URL 제거: {entry['url'][:80]}[/]")
+        if report.removed_dates:
             console.print(
-                f"    [yellow]가짜 URL 제거: {url[:80]}[/]"
+                f"    [yellow]미래 날짜 {len(report.removed_dates)}건 제거[/]"
             )
-            return ""
-
-        for field_name in ["expert_opinions", "key_facts"]:
-            items = getattr(brief_output, field_name)
-            cleaned = [url_pattern.sub(replace_invalid, item) for item in items]
-            setattr(brief_output, field_name, cleaned)
-
-        brief_output.background_context = url_pattern.sub(
-            replace_invalid, brief_output.background_context
-        )
-
-    @staticmethod
-    def _detect_date_repetition(
-        items: list[str], threshold: int = 4
-    ) -> set[str]:
-        """동일 날짜가 과도하게 반복되는 패턴을 감지한다.
-
-        반복 날짜가 오늘 날짜와 같으면 날조 가능성이 높으므로 해당 날짜를 제거한다.
-        """
-        date_pattern = re.compile(r"\d{4}\.\d{1,2}\.\d{1,2}")
-        date_counts: dict[str, int] = {}
-        for item in items:
-            for d in date_pattern.findall(item):
-                date_counts[d] = date_counts.get(d, 0) + 1
-
-        suspicious = {d for d, c in date_counts.items() if c >= threshold}
-        if not suspicious:
-            return set()
-
-        today_str = datetime.now().strftime("%Y.%-m.%-d")
-        today_str2 = datetime.now().strftime("%Y.%m.%d")
-
-        for d in suspicious:
-            is_today = d in (today_str, today_str2)
-            label = " (오늘 날짜 — 날조 가능성 높음)" if is_today else ""
+        for d, count in report.repeated_dates.items():
+            label = " (오늘 날짜 — 날조 가능성 높음)" if report.is_today(d) else ""
             console.print(
-                f"  [yellow]날짜 반복 경고: {d} "
-                f"({date_counts[d]}회 반복){label}[/]"
+                f"  [yellow]날짜 반복 경고: {d} ({count}회 반복){label}[/]"
             )
 
-        return suspicious
-
     def cleanup(self):
         """리소스 정리."""
+        self.http.print_report()
         self.rss_reader.close()
         self.scraper.close()
         self.searcher.close()
+        self.http.close()
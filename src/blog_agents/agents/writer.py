@@ -1,17 +1,25 @@
 from __future__ import annotations
 
 import json
+import re
 from uuid import uuid4
 
-from rich.console import Console
-
 from blog_agents.agents.base import BaseAgent
-from blog_agents.agents.research import ResearchAgent
 from blog_agents.models.content import Draft, DraftMetadata
 from blog_agents.models.research import ContentCategory, ResearchBrief
 from blog_agents.models.review import EditReview
-
-console = Console()
+from blog_agents.utils.brief_renderer import WRITER, BriefRenderer
+from blog_agents.utils.console import AgentConsole
+from blog_agents.utils.draft_lint import length_bounds
+from blog_agents.utils.markdown_doc import MarkdownDoc, parse_markdown
+from blog_agents.utils.sections import (
+    join_sections,
+    render_section,
+    split_sections,
+    target_sections,
+)
+
+console = AgentConsole()
 
 # 카테고리별 스타일 프롬프트 파일 매핑
 STYLE_PROMPTS = {
@@ -26,8 +34,8 @@ class WriterAgent(BaseAgent):
 
     agent_name = "작가"
 
-    def __init__(self, config):
-        model = config.models.get("writer", "claude-sonnet-4-5-20250514")
+    def __init__(self, config, model: str | None = None):
+        model = model or config.models.get("writer", "claude-sonnet-4-5-20250514")
         super().__init__(config, model=model)
 
     def write_draft(
@@ -35,43 +43,158 @@ class WriterAgent(BaseAgent):
         brief: ResearchBrief,
         version: int = 1,
         review: EditReview | None = None,
+        temperature: float = 0.8,
     ) -> Draft:
         """리서치 브리핑을 기반으로 블로그 초안을 작성한다."""
         console.print(
-            f'\n[bold green]작가 에이전트: "{brief.topic.title}" 작성 (v{version})[/]'
+            f'\n[bold green]작가 에이전트: "{brief.topic.title}" 작성 '
+            f"(v{version}, temperature {temperature:.2f})[/]"
         )
 
-        # 프롬프트 조합: 기본 + 카테고리 스타일
-        style_file = STYLE_PROMPTS.get(brief.category, "writer_agent.md")
-
-        # 수정 요청이 있는 경우 프롬프트에 포함
-        revision_instructions = ""
-        line_edits = []
-        if review and not review.approved:
-            revision_instructions = review.revision_instructions or ""
-            line_edits = [e.model_dump() for e in review.line_edits]
-
-        base_prompt = self._load_prompt(
-            "writer_agent.md",
-            revision_instructions=revision_instructions,
-            line_edits=line_edits,
-        )
-        style_prompt = self._load_prompt(style_file)
-        system_prompt = base_prompt + "\n\n" + style_prompt
+        system_prompt = self._build_system_prompt(brief)
 
         # 리서치 브리핑을 사용자 메시지로 구성
         user_message = self._format_brief_for_writing(brief, version, review)
 
         # 블로그 본문 생성 (자유 형식 마크다운)
         markdown_body = self._call_text(
-            system_prompt, user_message, max_tokens=6000
+            system_prompt, user_message, max_tokens=6000, temperature=temperature
         )
 
-        # 메타데이터 추출
-        metadata = self._extract_metadata(markdown_body, brief)
+        draft = self._assemble_draft(brief, version, markdown_body)
+        word_count = len(markdown_body)
+        console.print(
+            f"  [green]초안 v{version} 완료 ({word_count}자, "
+            f"읽기 {draft.estimated_read_time_minutes}분)[/]"
+        )
+        return draft
 
-        # Draft 객체 조립
-        draft = Draft(
+    def revise_draft(
+        self,
+        draft: Draft,
+        brief: ResearchBrief,
+        version: int,
+        review: EditReview,
+    ) -> Draft:
+        """편집 피드백을 반영한 다음 버전 초안을 만든다.
+
+        수정 제안이 일부 섹션에 몰려 있으면 해당 섹션만 다시 써서 끼워 넣고,
+        그렇지 않으면 write_draft로 전체를 다시 쓴다.
+        """
+        options = self.config.quality.get("section_revision", {})
+        if options.get("enabled", True):
+            revised = self._revise_sections(
+                draft, brief, version, review,
+                max_ratio=options.get("max_section_ratio", 0.6),
+            )
+            if revised is not None:
+                return revised
+        return self.write_draft(brief, version=version, review=review)
+
+    def _revise_sections(
+        self,
+        draft: Draft,
+        brief: ResearchBrief,
+        version: int,
+        review: EditReview,
+        max_ratio: float,
+    ) -> Draft | None:
+        """대상 섹션만 재작성해 스플라이스한다. 적용할 수 없으면 None."""
+        sections = split_sections(draft.full_markdown)
+        if len(sections) < 3 or not review.line_edits:
+            return None
+        targets, unplaced = target_sections(review.line_edits, sections)
+        if unplaced or not targets or len(targets) / len(sections) > max_ratio:
+            console.print(
+                f"  [dim]부분 수정 불가 (대상 {len(targets)}/{len(sections)}개 섹션, "
+                f"위치 미확인 제안 {len(unplaced)}개) - 전체 재작성[/]"
+            )
+            return None
+
+        order = sorted(targets)
+        console.print(
+            f'\n[bold green]작가 에이전트: "{brief.topic.title}" 부분 수정 (v{version}, '
+            f"섹션 {len(order)}/{len(sections)}개)[/]"
+        )
+
+        system_prompt = (
+            self._build_system_prompt(brief)
+            + "\n\n"
+            + self._load_prompt("writer_section_revision.md")
+        )
+        outline = [
+            f"{i}. {s.heading or '(제목·도입부)'}" + (" ← 수정 대상" if i in targets else "")
+            for i, s in enumerate(sections)
+        ]
+        request = "\n".join(
+            ["## 글 전체 구성", *outline, "", "## 수정 대상 섹션"]
+            + [f"<<<SECTION {i}>>>\n{render_section(sections[i]).strip()}\n" for i in order]
+            + ["---", "위 수정 대상 섹션만 피드백을 반영해 다시 작성하십시오."]
+        )
+        user_message = self._format_brief_for_writing(
+            brief, version, review, closing=request
+        )
+
+        response = self._call_text(system_prompt, user_message, max_tokens=3000)
+        replaced = self._parse_revised_sections(response, sections, order)
+        if replaced is None:
+            console.print("  [yellow]부분 수정 응답 형식 오류 - 전체 재작성[/]")
+            return None
+
+        markdown_body = join_sections(replaced)
+        revised = self._assemble_draft(brief, version, markdown_body)
+        console.print(
+            f"  [green]초안 v{version} 완료 ({len(markdown_body)}자, "
+            f"섹션 {len(order)}개 교체)[/]"
+        )
+        return revised
+
+    @staticmethod
+    def _parse_revised_sections(response: str, sections, order):
+        """``<<<SECTION n>>>`` 구분선으로 응답을 나눠 원래 섹션 목록에 끼워 넣는다."""
+        pieces = re.split(r"^<<<SECTION (\d+)>>>[ \t]*$", response, flags=re.MULTILINE)
+        revised = {}
+        for num, body in zip(pieces[1::2], pieces[2::2]):
+            parsed = split_sections(body.strip("\n"))
+            if len(parsed) != 1:
+                return None
+            revised[int(num)] = parsed[0]
+        if sorted(revised) != order:
+            return None
+
+        result = list(sections)
+        for i in order:
+            old, new = sections[i], revised[i]
+            if bool(old.heading) != bool(new.heading):
+                return None
+            # 섹션 앞뒤 빈 줄은 원래대로 두어 이어붙인 모양을 유지
+            lead = len(old.content) - len(old.content.lstrip("\n"))
+            trail = len(old.content) - len(old.content.rstrip("\n"))
+            body = new.content.strip("\n")
+            result[i] = old.model_copy(update={
+                "heading": new.heading,
+                "content": "\n" * lead + body + "\n" * trail,
+            })
+        return result
+
+    def _build_system_prompt(self, brief: ResearchBrief) -> str:
+        """기본 프롬프트 + 카테고리 스타일 프롬프트 (라운드와 무관하게 고정)."""
+        style_file = STYLE_PROMPTS.get(brief.category, "writer_agent.md")
+        length_range = self._length_range()
+        base_prompt = self._load_prompt("writer_agent.md", length_range=length_range)
+        style_prompt = self._load_prompt(style_file, length_range=length_range)
+        return base_prompt + "\n\n" + style_prompt
+
+    def _length_range(self) -> str:
+        min_chars, max_chars = length_bounds(self.config.quality)
+        return f"{min_chars:,}~{max_chars:,}"
+
+    def _assemble_draft(
+        self, brief: ResearchBrief, version: int, markdown_body: str
+    ) -> Draft:
+        """본문에서 메타데이터를 뽑아 Draft 객체를 조립한다."""
+        metadata = self._extract_metadata(markdown_body, brief)
+        return Draft(
             id=str(uuid4()),
             research_brief_id=brief.id,
             version=version,
@@ -84,63 +207,20 @@ class WriterAgent(BaseAgent):
             sources_cited=brief.sources,
         )
 
-        word_count = len(markdown_body)
-        console.print(
-            f"  [green]초안 v{version} 완료 ({word_count}자, "
-            f"읽기 {draft.estimated_read_time_minutes}분)[/]"
-        )
-        return draft
-
     def _format_brief_for_writing(
         self,
         brief: ResearchBrief,
         version: int,
         review: EditReview | None,
+        closing: str | None = None,
     ) -> str:
-        """리서치 브리핑을 작가가 사용하기 좋은 형식으로 포맷팅."""
-        parts = [
-            f"# 리서치 브리핑: {brief.topic.title}",
-            f"\n## 카테고리: {brief.category.display_name}",
-            f"\n## 작성 관점\n{brief.topic.angle}",
-            f"\n## 시의성\n{brief.topic.timeliness}",
-            f"\n## 타겟 키워드\n{', '.join(brief.topic.target_keywords)}",
-            f"\n## 배경\n{brief.background_context}",
-        ]
+        """리서치 브리핑을 작가가 사용하기 좋은 형식으로 포맷팅.
 
-        if brief.key_facts:
-            parts.append("\n## 핵심 팩트")
-            for fact in brief.key_facts:
-                parts.append(f"- {fact}")
-
-        if brief.exhibition_info:
-            parts.append("\n## 전시 기본 정보")
-            for info in brief.exhibition_info:
-                parts.append(f"- {info}")
-
-        if brief.artist_info:
-            parts.append("\n## 작가 정보")
-            for info in brief.artist_info:
-                parts.append(f"- {info}")
-
-        if brief.artwork_highlights:
-            parts.append("\n## 주요 작품")
-            for work in brief.artwork_highlights:
-                parts.append(f"- {work}")
-
-        if brief.expert_opinions:
-            parts.append("\n## 전문가 의견")
-            for opinion in brief.expert_opinions:
-                parts.append(f"- {opinion}")
-
-        if brief.data_points:
-            parts.append("\n## 데이터/통계")
-            for dp in brief.data_points:
-                parts.append(f"- {dp}")
-
-        if brief.sources:
-            parts.append("\n## 참고 출처")
-            for src in brief.sources[:10]:
-                parts.append(f"- {src.title} ({src.publisher}): {src.url}")
+        브리핑 본문을 맨 앞에 두고 라운드마다 달라지는 피드백은 뒤에 붙여,
+        같은 브리핑이면 메시지 앞부분이 항상 같도록 한다.
+        closing이 주어지면 마지막 작성 지시 대신 붙인다 (부분 수정용).
+        """
+        parts = [BriefRenderer.for_brief(brief).render(WRITER)]
 
         # 이전 초안 + 피드백이 있는 경우
         if version > 1 and review:
@@ -151,23 +231,21 @@ class WriterAgent(BaseAgent):
                 for s in review.strengths:
                     parts.append(f"  - {s}")
 
-        # 고유명사 앵커 목록 (브리핑에서 추출)
-        all_brief_text = "\n".join(
-            [brief.background_context]
-            + brief.key_facts
-            + brief.exhibition_info
-            + brief.artist_info
-            + brief.artwork_highlights
-        )
-        proper_nouns = ResearchAgent.extract_proper_nouns(all_brief_text)
-        if proper_nouns:
-            parts.append("\n## 고유명사 목록 (반드시 이 표기 그대로 사용)")
-            for noun in sorted(proper_nouns):
-                parts.append(f"- {noun}")
+        # 수정 요청 (시스템 프롬프트가 아닌 메시지 끝에 두어 접두부를 고정)
+        if review and not review.approved:
+            parts.append("\n" + self._load_prompt(
+                "writer_revision.md",
+                revision_instructions=review.revision_instructions or "",
+                line_edits=[e.model_dump() for e in review.line_edits],
+            ).strip())
+
+        if closing is not None:
+            parts.append("\n" + closing)
+            return "\n".join(parts)
 
         parts.append(
             "\n---\n"
-            "위 브리핑을 바탕으로 1,500~2,500자 분량의 전문적인 블로그 포스트를 "
+            f"위 브리핑을 바탕으로 본문 {self._length_range()}자 분량의 전문적인 블로그 포스트를 "
             "마크다운 형식으로 작성해주세요. "
             "제목은 H1(#)으로, 소제목은 H2(##)로 시작하십시오."
         )
@@ -180,19 +258,16 @@ class WriterAgent(BaseAgent):
         """생성된 마크다운에서 메타데이터를 추출한다."""
         console.print("  메타데이터 추출 중...", style="dim")
 
+        doc = parse_markdown(markdown)
+
         # 제목 추출 (첫 번째 H1)
-        title = brief.topic.title
-        for line in markdown.split("\n"):
-            if line.startswith("# ") and not line.startswith("## "):
-                title = line.lstrip("# ").strip()
-                break
+        title = doc.title or brief.topic.title
 
         # 글자 수 기반 읽기 시간 추정 (한국어: 분당 약 400자)
-        word_count = len(markdown.replace(" ", "").replace("\n", ""))
-        read_time = max(1, round(word_count / 400))
+        read_time = max(1, round(doc.char_count / 400))
 
         # 본문 첫 문단에서 meta description 추출 (Google 검색 결과 미리보기)
-        meta_desc = self._extract_first_paragraph(markdown, title, brief)
+        meta_desc = self._extract_first_paragraph(doc, title, brief)
 
         return DraftMetadata(
             title=title,
@@ -202,17 +277,12 @@ class WriterAgent(BaseAgent):
         )
 
     @staticmethod
-    def _extract_first_paragraph(markdown: str, title: str, brief) -> str:
+    def _extract_first_paragraph(doc: MarkdownDoc, title: str, brief) -> str:
         """본문 첫 문단을 meta description으로 추출 (155자 이내)."""
-        lines = markdown.split("\n")
         paragraphs = []
-        for line in lines:
-            stripped = line.strip()
-            # 헤딩, 빈줄, 마크다운 기호 건너뛰기
-            if not stripped or stripped.startswith("#") or stripped.startswith("-") or stripped.startswith(">"):
-                continue
-            # 마크다운 서식 제거
-            clean = stripped.replace("**", "").replace("*", "").replace("`", "")
+        # 헤딩·리스트·인용·이미지를 제외한 일반 문단에서 서식 기호를 뺀 본문
+        for block in doc.paragraphs():
+            clean = block.plain
             if len(clean) > 20:
                 paragraphs.append(clean)
                 if len(paragraphs) >= 2:
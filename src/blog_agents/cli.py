@@ -72,6 +72,18 @@ def generate(
         False, "--draft",
         help="임시저장으로 발행 (--publish와 함께 사용)",
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh",
+        help="캐시된 리서치 결과를 무시하고 새로 수집",
+    ),
+    all_categories: bool = typer.Option(
+        False, "--all",
+        help="모든 카테고리를 한 프로세스에서 동시에 생성 (토픽 자동 선택)",
+    ),
+    concurrency: Optional[int] = typer.Option(
+        None, "--concurrency", "-j",
+        help="--all 동시 실행 카테고리 수 (기본: settings.yaml content.all_concurrency)",
+    ),
     project_dir: Optional[str] = typer.Option(
         None, "--project-dir", "-d",
         help="프로젝트 루트 디렉토리 (기본: 현재 위치에서 자동 감지)",
@@ -80,6 +92,12 @@ def generate(
     """전체 파이프라인 실행: 리서치 → 작성 → 편집 → 발행"""
     config = _get_config(project_dir)
 
+    if all_categories:
+        if category:
+            raise typer.BadParameter("--all과 카테고리 인자는 함께 쓸 수 없습니다.")
+        _generate_all(config, publish_flag or draft, draft, refresh, concurrency)
+        return
+
     # 카테고리 미지정 시 자동 로테이션
     if category:
         cat = _resolve_category(category)
@@ -110,7 +128,9 @@ def generate(
 
     orchestrator = BlogOrchestrator(config)
     try:
-        result = orchestrator.run_full_pipeline(cat, auto_select=auto)
+        result = orchestrator.run_full_pipeline(
+            cat, auto_select=auto, refresh=refresh
+        )
         if result:
             console.print("\n[bold green]블로그 포스트 생성 완료![/]")
 
@@ -124,6 +144,33 @@ def generate(
         orchestrator.cleanup()
 
 
+def _generate_all(
+    config: AppConfig,
+    publish_flag: bool,
+    draft: bool,
+    refresh: bool,
+    concurrency: Optional[int],
+):
+    """모든 카테고리 파이프라인을 동시에 실행하고, 요청 시 완료된 글을 차례로 발행."""
+    orchestrator = BlogOrchestrator(config)
+    try:
+        results = orchestrator.run_all_categories(
+            refresh=refresh, concurrency=concurrency
+        )
+        done = [cat for cat, post in results.items() if post is not None]
+        console.print(
+            f"\n[bold green]{len(done)}/{len(results)}개 카테고리 생성 완료[/]"
+        )
+        # 브라우저 세션을 공유하므로 발행은 순차로
+        if publish_flag:
+            for cat in done:
+                _auto_publish_naver(config, cat, results[cat], is_draft=draft)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]사용자에 의해 중단됨[/]")
+    finally:
+        orchestrator.cleanup()
+
+
 def _auto_publish_naver(config: AppConfig, category, blog_post, is_draft: bool = False):
     """생성된 글을 네이버 블로그에 자동 발행."""
     naver_id = config.settings.naver_blog_id
@@ -172,12 +219,174 @@ def _auto_publish_naver(config: AppConfig, category, blog_post, is_draft: bool =
         console.print(f"[red]네이버 발행 실패: {e}[/]")
 
 
+@app.command()
+def batch(
+    categories: Optional[list[str]] = typer.Argument(
+        None,
+        help="카테고리 목록 (seoul, gwangju, kcontent). 미지정 시 전체",
+    ),
+    per_category: Optional[int] = typer.Option(
+        None, "--per-category", "-n",
+        help="카테고리당 생성할 글 수 (기본: settings.yaml content.batch.posts_per_category)",
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh",
+        help="캐시된 리서치 결과를 무시하고 새로 수집",
+    ),
+    project_dir: Optional[str] = typer.Option(
+        None, "--project-dir", "-d",
+    ),
+):
+    """여러 편을 단계별 파이프라인(리서치와 작성·편집 동시 진행)으로 생성"""
+    config = _get_config(project_dir)
+    cats = [_resolve_category(c) for c in categories] if categories else None
+
+    orchestrator = BlogOrchestrator(config)
+    try:
+        orchestrator.run_batch(cats, per_category=per_category, refresh=refresh)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]사용자에 의해 중단됨 (resume으로 개별 실행 재개 가능)[/]")
+    finally:
+        orchestrator.cleanup()
+
+
+@app.command()
+def resume(
+    run_id: Optional[str] = typer.Argument(
+        None,
+        help="재개할 실행 ID (미지정 시 가장 최근의 미완료 실행)",
+    ),
+    list_runs: bool = typer.Option(
+        False, "--list", "-l",
+        help="최근 실행 기록 목록만 표시",
+    ),
+    publish_flag: bool = typer.Option(
+        False, "--publish", "-p",
+        help="완료 후 네이버 블로그에 자동 발행",
+    ),
+    draft: bool = typer.Option(
+        False, "--draft",
+        help="임시저장으로 발행 (--publish와 함께 사용)",
+    ),
+    project_dir: Optional[str] = typer.Option(
+        None, "--project-dir", "-d",
+    ),
+):
+    """중단된 파이프라인을 마지막 완료 단계부터 이어서 실행"""
+    config = _get_config(project_dir)
+
+    if list_runs:
+        from blog_agents.utils.storage import StorageManager
+
+        runs = StorageManager(config.output_dir).list_runs()[:15]
+        if not runs:
+            console.print("[yellow]실행 기록이 없습니다.[/]")
+            return
+        table = Table(title="최근 실행 기록", show_header=True)
+        table.add_column("실행 ID", style="cyan")
+        table.add_column("카테고리")
+        table.add_column("단계")
+        table.add_column("라운드", justify="right")
+        table.add_column("토픽", width=30)
+        table.add_column("오류", style="red", width=24)
+        for run in runs:
+            phase_style = "green" if run.completed else "yellow"
+            table.add_row(
+                run.run_id,
+                run.category.display_name,
+                f"[{phase_style}]{run.phase.display_name}[/]",
+                str(len(run.rounds)),
+                run.topic_title or "-",
+                (run.error or "")[:24],
+            )
+        console.print(table)
+        return
+
+    orchestrator = BlogOrchestrator(config)
+    try:
+        result = orchestrator.resume_run(run_id)
+        if result:
+            console.print("\n[bold green]블로그 포스트 생성 완료![/]")
+            if publish_flag or draft:
+                _auto_publish_naver(
+                    config, result.draft.category, result, is_draft=draft
+                )
+    except FileNotFoundError as e:
+        console.print(f"[red]{e}[/]")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]사용자에 의해 중단됨 (다시 resume으로 재개 가능)[/]")
+    finally:
+        orchestrator.cleanup()
+
+
+@app.command()
+def serve(
+    port: Optional[int] = typer.Option(
+        None, "--port",
+        help="/health 상태 엔드포인트 포트 (기본: settings.yaml serve.health_port, 0이면 끔)",
+    ),
+    publish_flag: bool = typer.Option(
+        False, "--publish", "-p",
+        help="예정 실행이 끝날 때마다 네이버 블로그에 자동 발행",
+    ),
+    draft: bool = typer.Option(
+        False, "--draft",
+        help="임시저장으로 발행 (--publish와 함께 사용)",
+    ),
+    project_dir: Optional[str] = typer.Option(
+        None, "--project-dir", "-d",
+    ),
+):
+    """상주하며 요일 스케줄(content.schedule)에 맞춰 글을 생성"""
+    import signal
+
+    from blog_agents.scheduler import BlogScheduler
+
+    config = _get_config(project_dir)
+    on_published = None
+    if publish_flag or draft:
+        def on_published(post):
+            _auto_publish_naver(config, post.draft.category, post, is_draft=draft)
+
+    scheduler = BlogScheduler(config, on_published=on_published)
+    signal.signal(signal.SIGTERM, lambda *_: scheduler.stop())
+
+    serve_cfg = config.serve
+    port = serve_cfg.get("health_port", 8765) if port is None else port
+    schedule = ", ".join(
+        f"{day}: {cat}" for day, cat in scheduler.schedule.items()
+    ) or "(없음)"
+    lines = [
+        "[bold]블로그 에이전트 데몬 시작[/]",
+        f"스케줄: {schedule}",
+        f"실행 시각: {scheduler.run_time:%H:%M} ({scheduler.tz.key}), "
+        f"사전 수집 {int(scheduler.prefetch_lead.total_seconds() // 60)}분 전",
+    ]
+    if port:
+        host = serve_cfg.get("health_host", "127.0.0.1")
+        server = scheduler.start_health_server(host, port)
+        lines.append(f"상태: http://{host}:{server.server_address[1]}/health")
+    console.print(Panel("\n".join(lines), style="blue"))
+
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]사용자에 의해 중단됨[/]")
+    finally:
+        scheduler.shutdown()
+
+
 @app.command()
 def research(
     category: str = typer.Argument(
         ...,
         help="콘텐츠 카테고리 (seoul, gwangju, kcontent)",
     ),
+    refresh: bool = typer.Option(
+        False, "--refresh",
+        help="오늘 제안된 토픽을 무시하고 새로 수집",
+    ),
     project_dir: Optional[str] = typer.Option(
         None, "--project-dir", "-d",
     ),
@@ -188,7 +397,7 @@ def research(
 
     orchestrator = BlogOrchestrator(config)
     try:
-        topics = orchestrator.run_research_only(cat)
+        topics = orchestrator.run_research_only(cat, refresh=refresh)
 
         if not topics:
             console.print("[yellow]제안할 토픽이 없습니다.[/]")
@@ -362,6 +571,66 @@ def status(
     console.print(f"  발행: {len(published)}개")
 
 
+@app.command()
+def sources(
+    limit: int = typer.Option(
+        10, "--limit", "-n",
+        help="표시할 소스 수",
+    ),
+    project_dir: Optional[str] = typer.Option(
+        None, "--project-dir", "-d",
+    ),
+):
+    """수집 소스 상태 리포트 (오류율·지연이 나쁜 순)"""
+    from datetime import datetime
+
+    from blog_agents.tools.source_health import SourceHealth
+
+    config = _get_config(project_dir)
+    health = SourceHealth.from_config(
+        config.cache_dir / "source_health.json", config.source_health
+    )
+
+    if not health.records:
+        console.print("  아직 수집 기록이 없습니다.", style="dim")
+        return
+
+    table = Table(title="소스 상태 (문제 소스 순)", show_header=True)
+    table.add_column("소스", max_width=40, overflow="fold")
+    table.add_column("시도", justify="right")
+    table.add_column("오류율", justify="right")
+    table.add_column("p50(초)", justify="right")
+    table.add_column("p95(초)", justify="right")
+    table.add_column("평균 항목", justify="right")
+    table.add_column("마지막 성공")
+    table.add_column("상태")
+
+    now = datetime.now()
+    for rec in health.worst(limit):
+        rate_style = (
+            "red" if rec.error_rate >= 0.5
+            else "yellow" if rec.error_rate > 0
+            else "green"
+        )
+        state = (
+            f"[red]차단 ~{rec.open_until[5:16].replace('T', ' ')}[/]" if rec.is_open(now)
+            else "[yellow]재시도 중[/]" if rec.consecutive_failures
+            else "[green]정상[/]"
+        )
+        table.add_row(
+            rec.url,
+            str(rec.attempts),
+            f"[{rate_style}]{rec.error_rate:.0%}[/]",
+            f"{rec.p50:.1f}",
+            f"{rec.p95:.1f}",
+            f"{rec.avg_yield:.1f}",
+            rec.last_success or "-",
+            state,
+        )
+
+    console.print(table)
+
+
 @app.command()
 def naver_login(
     project_dir: Optional[str] = typer.Option(
@@ -8,6 +8,7 @@ from blog_agents.models.research import (
 )
 from blog_agents.models.content import Draft, BlogPost, Section
 from blog_agents.models.review import EditReview, ScoreDimension
+from blog_agents.models.run import RunManifest, RunPhase
 
 __all__ = [
     "ContentCategory",
@@ -21,4 +22,6 @@ __all__ = [
     "Section",
     "EditReview",
     "ScoreDimension",
+    "RunManifest",
+    "RunPhase",
 ]
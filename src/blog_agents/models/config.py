@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Optional
+from zoneinfo import ZoneInfo
 
 import yaml
 from pydantic import Field
@@ -32,6 +33,11 @@ class AppConfig:
         self._yaml = load_yaml_config(self.root / "config" / "settings.yaml")
         self._sources = load_yaml_config(self.root / "config" / "sources.yaml")
 
+    @property
+    def timezone(self) -> ZoneInfo:
+        """콘텐츠 기준 시간대 (project.timezone). "오늘"의 토픽·스케줄 판정에 쓴다."""
+        return ZoneInfo(self._yaml.get("project", {}).get("timezone", "Asia/Seoul"))
+
     @property
     def models(self) -> dict:
         return self._yaml.get("models", {})
@@ -40,6 +46,30 @@ class AppConfig:
     def quality(self) -> dict:
         return self._yaml.get("quality", {})
 
+    @property
+    def research(self) -> dict:
+        return self._yaml.get("research", {})
+
+    @property
+    def network(self) -> dict:
+        return self._yaml.get("network", {})
+
+    @property
+    def source_health(self) -> dict:
+        return self._yaml.get("source_health", {})
+
+    @property
+    def content(self) -> dict:
+        return self._yaml.get("content", {})
+
+    @property
+    def serve(self) -> dict:
+        return self._yaml.get("serve", {})
+
+    @property
+    def quota(self) -> dict:
+        return self._yaml.get("quota", {})
+
     @property
     def sources(self) -> dict:
         return self._sources
@@ -56,3 +86,7 @@ class AppConfig:
     def output_dir(self) -> Path:
         base = self._yaml.get("storage", {}).get("base_path", "./output")
         return self.root / base
+
+    @property
+    def cache_dir(self) -> Path:
+        return self.output_dir / "cache"
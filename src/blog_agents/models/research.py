@@ -93,6 +93,10 @@ class ResearchBrief(BaseModel):
         default="",
         description="원본 검색 결과 스니펫 (편집장 팩트체크용)",
     )
+    sanitize_report: dict = Field(
+        default_factory=dict,
+        description="사후 정제 기록 (제거된 URL·미래 날짜·미검증 항목)",
+    )
 
 
 class ResearchBriefOutput(BaseModel):
@@ -5,6 +5,7 @@ from typing import Optional
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, model_validator
+from pydantic.json_schema import SkipJsonSchema
 
 
 class ScoreDimension(BaseModel):
@@ -20,6 +21,23 @@ class LineEdit(BaseModel):
     reason: str = Field(description="수정 이유")
 
 
+class DimensionReview(BaseModel):
+    """차원 그룹별 병렬 검토의 부분 결과 (종합 점수·승인은 병합 단계에서 계산)."""
+
+    dimensions: list[ScoreDimension] = Field(
+        default_factory=list, description="담당 차원별 평가"
+    )
+    revision_instructions: str = Field(
+        default="", description="담당 차원에 대한 수정 요청 사항"
+    )
+    line_edits: list[LineEdit] = Field(
+        default_factory=list, description="구체적 라인 수정 제안"
+    )
+    strengths: list[str] = Field(
+        default_factory=list, description="잘된 점"
+    )
+
+
 class EditReview(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid4()))
     draft_id: str = ""
@@ -39,6 +57,10 @@ class EditReview(BaseModel):
     strengths: list[str] = Field(
         default_factory=list, description="잘된 점"
     )
+    # 검토 방식 (full: 전체 검토, parallel: 차원 그룹별 병렬 검토, diff: 변경분 검토,
+    # lint/grounding: 로컬 자동 반려).
+    # 모델 출력 스키마에는 노출하지 않는다.
+    review_mode: SkipJsonSchema[str] = "full"
 
     @model_validator(mode="before")
     @classmethod
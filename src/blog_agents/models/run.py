@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import uuid4
+
+from pydantic import BaseModel, Field
+
+from blog_agents.models.research import ContentCategory
+
+
+def _new_run_id() -> str:
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid4().hex[:6]}"
+
+
+class RunPhase(str, Enum):
+    """마지막으로 완료된 파이프라인 단계."""
+
+    STARTED = "started"
+    BRIEF = "brief"
+    DRAFT = "draft"
+    REVIEW = "review"
+    PUBLISHED = "published"
+
+    @property
+    def display_name(self) -> str:
+        return {
+            RunPhase.STARTED: "시작",
+            RunPhase.BRIEF: "브리핑 완료",
+            RunPhase.DRAFT: "초안 작성",
+            RunPhase.REVIEW: "검토 완료",
+            RunPhase.PUBLISHED: "발행 완료",
+        }[self]
+
+
+class RunRound(BaseModel):
+    """작성·편집 라운드 하나의 산출물 (경로는 output 디렉토리 기준 상대 경로)."""
+
+    version: int
+    draft: str
+    review: Optional[str] = None
+    score: Optional[float] = None
+
+
+class RunManifest(BaseModel):
+    """파이프라인 실행 기록. 단계가 끝날 때마다 output/runs/{run_id}.json에 저장된다."""
+
+    run_id: str = Field(default_factory=_new_run_id)
+    category: ContentCategory
+    created_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now)
+    phase: RunPhase = RunPhase.STARTED
+    topic_title: str = ""
+    brief: Optional[str] = None
+    rounds: list[RunRound] = Field(default_factory=list)
+    published: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def completed(self) -> bool:
+        return self.phase == RunPhase.PUBLISHED
+
+    def round_for(self, version: int) -> Optional[RunRound]:
+        for r in self.rounds:
+            if r.version == version:
+                return r
+        return None
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import IntPrompt
+from rich.table import Table
 
 from blog_agents.agents.editor import EditorAgent
 from blog_agents.agents.research import ResearchAgent
@@ -15,11 +21,26 @@ from blog_agents.models.config import AppConfig
 from blog_agents.models.content import BlogPost, Draft
 from blog_agents.models.research import ContentCategory, ResearchBrief, TopicSuggestion
 from blog_agents.models.review import EditReview
-from blog_agents.utils.storage import StorageManager, slugify
+from blog_agents.models.run import RunManifest, RunPhase, RunRound
+from blog_agents.utils.stopping import CONTINUE, ESCALATE, StoppingPolicy
+from blog_agents.utils.storage import StorageManager, atomic_write_text, slugify
 
 console = Console()
 
 
+@dataclass
+class BatchJob:
+    """배치 생성의 글 한 편 (토픽 하나)."""
+
+    category: ContentCategory
+    topic: TopicSuggestion
+    run: RunManifest | None = None
+    post: BlogPost | None = None
+    error: str = ""
+    research_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+
 ROTATION_ORDER = [
     ContentCategory.SEOUL_EXHIBITION,
     ContentCategory.GWANGJU_CULTURE,
@@ -35,8 +56,18 @@ class BlogOrchestrator:
         self.research_agent = ResearchAgent(config)
         self.writer_agent = WriterAgent(config)
         self.editor_agent = EditorAgent(config)
+        # 후보 초안 선별용 저비용 편집장 (설정된 경우에만)
+        screening_model = config.models.get("editor_screening")
+        self.screening_editor = (
+            EditorAgent(config, model=screening_model)
+            if screening_model and screening_model != self.editor_agent.model
+            else None
+        )
         self.storage = StorageManager(config.output_dir)
         self.max_rounds = config.quality.get("max_revision_rounds", 3)
+        self._prefetch_executor: ThreadPoolExecutor | None = None
+        # 마지막 작성·편집 루프의 라운드별 진행 판단 기록
+        self.last_stop_decisions: list[dict] = []
 
     @property
     def _rotation_state_path(self) -> Path:
@@ -90,17 +121,26 @@ class BlogOrchestrator:
             "last_category": category.value,
             "last_generated": datetime.now().strftime("%Y-%m-%d %H:%M"),
         }
-        self._rotation_state_path.write_text(
+        atomic_write_text(
+            self._rotation_state_path,
             json.dumps(state, ensure_ascii=False, indent=2),
-            encoding="utf-8",
         )
 
     def run_full_pipeline(
         self,
         category: ContentCategory,
         auto_select: bool = False,
+        refresh: bool = False,
+        update_rotation: bool = True,
     ) -> BlogPost | None:
-        """전체 파이프라인을 실행: 리서치 → 토픽 선택 → 작성 → 편집 → 발행."""
+        """전체 파이프라인을 실행: 리서치 → 토픽 선택 → 작성 → 편집 → 발행.
+
+        refresh=True면 캐시된 리서치 결과를 무시하고 새로 수집한다.
+        update_rotation=False면 발행 후 로테이션 상태를 남기지 않는다
+        (여러 카테고리를 한꺼번에 돌릴 때 완료 순서에 좌우되지 않도록).
+        단계마다 output/runs/{run_id}.json에 실행 기록을 남겨 중단되면
+        ``resume_run``으로 마지막 완료 단계부터 이어갈 수 있다.
+        """
 
         console.print(
             Panel(
@@ -109,39 +149,140 @@ class BlogOrchestrator:
                 style="blue",
             )
         )
+        run = RunManifest(category=category)
+        self.storage.save_run(run)
+        console.print(f"  실행 ID: {run.run_id}", style="dim")
+
+        with self._recording_failure(run):
+            return self._run_pipeline(
+                category, auto_select, refresh, run, update_rotation
+            )
+
+    def resume_run(self, run_id: str | None = None) -> BlogPost | None:
+        """실행 기록을 읽어 마지막 완료 단계 다음부터 파이프라인을 이어간다.
+
+        run_id가 없으면 가장 최근의 미완료 실행을 재개한다. 토픽 선택 전에
+        중단된 실행은 토픽을 자동 선택해 처음부터(오늘 캐시 재사용) 다시 돈다.
+        """
+        if run_id:
+            run = self.storage.load_run(run_id)
+        else:
+            run = next(
+                (r for r in self.storage.list_runs() if not r.completed), None
+            )
+            if run is None:
+                console.print("[yellow]재개할 미완료 실행이 없습니다.[/]")
+                return None
+
+        if run.completed:
+            console.print(
+                f"[yellow]이미 완료된 실행입니다: {run.run_id} → {run.published}[/]"
+            )
+            return None
+
+        console.print(
+            Panel(
+                f"[bold]파이프라인 재개[/]\n"
+                f"실행 ID: {run.run_id}\n"
+                f"카테고리: {run.category.display_name}\n"
+                f"마지막 완료 단계: {run.phase.display_name}"
+                + (f"\n토픽: {run.topic_title}" if run.topic_title else "")
+                + (f"\n직전 오류: {run.error}" if run.error else ""),
+                style="blue",
+            )
+        )
+        run.error = None
+        self.storage.save_run(run)
+
+        with self._recording_failure(run):
+            if run.brief is None:
+                return self._run_pipeline(run.category, True, False, run)
+            brief = ResearchBrief.model_validate_json(
+                self.storage.resolve(run.brief).read_text(encoding="utf-8")
+            )
+            return self._write_and_publish(brief, run.category, run)
+
+    @contextmanager
+    def _recording_failure(self, run: RunManifest):
+        """실패·중단 시 오류를 실행 기록에 남기고 그대로 전파한다."""
+        try:
+            yield
+        except BaseException as e:
+            run.error = f"{type(e).__name__}: {e}".rstrip(": ")
+            self.storage.save_run(run)
+            raise
 
+    def _run_pipeline(
+        self,
+        category: ContentCategory,
+        auto_select: bool,
+        refresh: bool,
+        run: RunManifest,
+        update_rotation: bool = True,
+    ) -> BlogPost | None:
         # ===== PHASE 1: 리서치 =====
         console.print(
             Panel("Phase 1: 리서치 - 이슈 수집 및 토픽 제안", style="blue")
         )
-        topics = self.research_agent.discover_topics(category)
+        topics = self.research_agent.discover_topics(category, refresh=refresh)
 
         if not topics:
             console.print("[red]토픽을 찾지 못했습니다.[/]")
+            run.error = "토픽을 찾지 못했습니다"
+            self.storage.save_run(run)
             return None
 
-        # 토픽 선택
+        # 토픽 선택 (대화형이면 선택을 기다리는 동안 브리핑을 미리 생성)
         if auto_select:
             selected_topic = topics[0]
             console.print(
                 f'  자동 선택: "{selected_topic.title}"', style="dim"
             )
+            brief = self.research_agent.build_brief(
+                selected_topic, category, refresh=refresh
+            )
+        elif self.config.research.get("prefetch_briefs", True) and len(topics) > 1:
+            selected_topic, brief = self._select_with_prefetch(
+                topics, category, refresh
+            )
         else:
             selected_topic = self._user_select_topic(topics)
+            brief = self.research_agent.build_brief(
+                selected_topic, category, refresh=refresh
+            )
 
-        # 리서치 브리핑 생성
-        brief = self.research_agent.build_brief(selected_topic, category)
+        self._checkpoint_brief(run, selected_topic, brief, category)
+        return self._write_and_publish(brief, category, run, update_rotation)
+
+    def _checkpoint_brief(
+        self,
+        run: RunManifest,
+        topic: TopicSuggestion,
+        brief: ResearchBrief,
+        category: ContentCategory,
+    ) -> None:
         brief_path = self.storage.save_json(
-            "research", brief, category, selected_topic.title, "_brief"
+            "research", brief, category, topic.title, "_brief"
         )
         console.print(f"  리서치 브리핑 저장: {brief_path.name}", style="dim")
+        run.phase = RunPhase.BRIEF
+        run.topic_title = topic.title
+        run.brief = self.storage.relative(brief_path)
+        self.storage.save_run(run)
 
+    def _write_and_publish(
+        self,
+        brief: ResearchBrief,
+        category: ContentCategory,
+        run: RunManifest | None = None,
+        update_rotation: bool = True,
+    ) -> BlogPost | None:
         # ===== PHASE 2: 작성 & 편집 루프 =====
         console.print(
             Panel("Phase 2: 작성 & 편집 - 피드백 루프", style="green")
         )
 
-        result = self.run_write_edit_loop(brief, category)
+        result = self.run_write_edit_loop(brief, category, run)
         if result is None:
             return None
 
@@ -167,9 +308,14 @@ class BlogOrchestrator:
             "_final",
             frontmatter=blog_post.frontmatter,
         )
+        if run is not None:
+            run.phase = RunPhase.PUBLISHED
+            run.published = self.storage.relative(final_path)
+            self.storage.save_run(run)
 
         # 로테이션 상태 저장
-        self._save_rotation_state(category)
+        if update_rotation:
+            self._save_rotation_state(category)
 
         console.print(
             Panel(
@@ -184,34 +330,322 @@ class BlogOrchestrator:
 
         return blog_post
 
+    def run_all_categories(
+        self,
+        categories: list[ContentCategory] | None = None,
+        refresh: bool = False,
+        concurrency: int | None = None,
+    ) -> dict[ContentCategory, BlogPost | None]:
+        """여러 카테고리 파이프라인을 한 프로세스에서 동시에 실행한다 (토픽 자동 선택).
+
+        에이전트·HTTP 전송·캐시·쿼터 기록·모델별 호출 간격 제한을 모두
+        공유하므로 전체 처리량은 실행 횟수가 아니라 모델 쿼터에 맞춰진다.
+        한 카테고리가 실패해도 나머지는 계속 진행하고, 끝나면 요약표를 출력한다.
+        로테이션 상태(generate --auto의 다음 카테고리)는 바꾸지 않는다.
+        """
+        categories = categories or [
+            ContentCategory(value)
+            for value in self.config.content.get("categories", [])
+        ] or list(ROTATION_ORDER)
+        workers = max(1, min(
+            concurrency or int(self.config.content.get("all_concurrency", 3)),
+            len(categories),
+        ))
+        console.print(
+            Panel(
+                f"[bold]전체 카테고리 동시 실행[/]\n"
+                f"카테고리: {', '.join(c.display_name for c in categories)}\n"
+                f"동시 실행: {workers}개",
+                style="blue",
+            )
+        )
+
+        results: dict[ContentCategory, BlogPost | None] = {}
+        errors: dict[ContentCategory, str] = {}
+        elapsed: dict[ContentCategory, float] = {}
+
+        def run(category: ContentCategory) -> BlogPost | None:
+            started = time.monotonic()
+            try:
+                return self.run_full_pipeline(
+                    category, auto_select=True, refresh=refresh, update_rotation=False
+                )
+            finally:
+                elapsed[category] = time.monotonic() - started
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pipeline") as pool:
+            futures = {pool.submit(run, c): c for c in categories}
+            for future in as_completed(futures):
+                category = futures[future]
+                try:
+                    results[category] = future.result()
+                except Exception as e:
+                    console.print(
+                        f"[red]{category.display_name} 파이프라인 실패: {e}[/]"
+                    )
+                    results[category] = None
+                    errors[category] = str(e)
+
+        self._print_all_summary(categories, results, errors, elapsed)
+        return results
+
+    def _print_all_summary(
+        self,
+        categories: list[ContentCategory],
+        results: dict[ContentCategory, BlogPost | None],
+        errors: dict[ContentCategory, str],
+        elapsed: dict[ContentCategory, float],
+    ) -> None:
+        table = Table(title="전체 카테고리 실행 결과", show_header=True)
+        table.add_column("카테고리", style="cyan")
+        table.add_column("결과", justify="center")
+        table.add_column("제목", width=36)
+        table.add_column("점수", justify="right")
+        table.add_column("버전", justify="right")
+        table.add_column("소요", justify="right")
+
+        for category in categories:
+            post = results.get(category)
+            seconds = f"{elapsed.get(category, 0.0):.0f}초"
+            if post is not None:
+                table.add_row(
+                    category.display_name, "[green]완료[/]", post.draft.title,
+                    f"{post.final_score:.1f}", f"v{post.draft.version}", seconds,
+                )
+            else:
+                reason = errors.get(category, "생성 실패")
+                table.add_row(
+                    category.display_name, "[red]실패[/]", reason[:36], "-", "-", seconds,
+                )
+        console.print(table)
+
+        quota = self.writer_agent.quota
+        models = sorted({self.writer_agent.model, self.editor_agent.model,
+                         self.research_agent.model})
+        usage = ", ".join(
+            f"{m} {quota.used(m)}회"
+            + (f" (잔여 {quota.remaining(m)})" if quota.remaining(m) is not None else "")
+            for m in models
+        )
+        console.print(f"  [dim]오늘 모델 호출: {usage}[/]")
+
+    def run_batch(
+        self,
+        categories: list[ContentCategory] | None = None,
+        per_category: int | None = None,
+        refresh: bool = False,
+    ) -> list[BatchJob]:
+        """여러 편을 단계별 파이프라인으로 생성한다 (토픽 자동 선택).
+
+        토픽 발굴 → 브리핑(네트워크 위주) → 작성·편집·저장(LLM 위주) 단계를
+        크기 제한 큐로 잇고 단계마다 동시 작업 수를 따로 둔다. 글 N이 작성·편집
+        중일 때 글 N+1의 리서치가 진행되고, 작성 단계가 밀리면 큐가 차서
+        리서치도 멈춘다. 모델 호출 간격은 공유 RateLimiter가 그대로 지킨다.
+        로테이션 상태는 바꾸지 않는다.
+        """
+        options = self.config.content.get("batch", {}) or {}
+        categories = categories or [
+            ContentCategory(value)
+            for value in self.config.content.get("categories", [])
+        ] or list(ROTATION_ORDER)
+        per_category = per_category or int(options.get("posts_per_category", 1))
+
+        console.print(
+            Panel(
+                f"[bold]배치 생성 (단계별 파이프라인)[/]\n"
+                f"카테고리: {', '.join(c.display_name for c in categories)}\n"
+                f"카테고리당 {per_category}편 · "
+                f"리서치 동시 {options.get('research_concurrency', 2)} · "
+                f"작성 동시 {options.get('write_concurrency', 1)} · "
+                f"대기열 {options.get('queue_size', 2)}",
+                style="blue",
+            )
+        )
+        jobs = asyncio.run(
+            self._run_batch_async(categories, per_category, refresh, options)
+        )
+        self._print_batch_summary(jobs)
+        return jobs
+
+    async def _run_batch_async(
+        self,
+        categories: list[ContentCategory],
+        per_category: int,
+        refresh: bool,
+        options: dict,
+    ) -> list[BatchJob]:
+        research_workers = max(1, int(options.get("research_concurrency", 2)))
+        write_workers = max(1, int(options.get("write_concurrency", 1)))
+        queue_size = max(1, int(options.get("queue_size", 2)))
+        research_queue: asyncio.Queue[BatchJob | None] = asyncio.Queue(queue_size)
+        write_queue: asyncio.Queue[tuple[BatchJob, ResearchBrief] | None] = (
+            asyncio.Queue(queue_size)
+        )
+        jobs: list[BatchJob] = []
+
+        async def discover() -> None:
+            for category in categories:
+                try:
+                    topics = await asyncio.to_thread(
+                        self.research_agent.discover_topics, category, refresh
+                    )
+                except Exception as e:
+                    console.print(
+                        f"[red]{category.display_name} 토픽 발굴 실패: {e}[/]"
+                    )
+                    continue
+                for topic in topics[:per_category]:
+                    job = BatchJob(category, topic)
+                    jobs.append(job)
+                    await research_queue.put(job)
+            for _ in range(research_workers):
+                await research_queue.put(None)
+
+        def research(job: BatchJob) -> ResearchBrief:
+            started = time.monotonic()
+            job.run = RunManifest(category=job.category)
+            self.storage.save_run(job.run)
+            try:
+                with self._recording_failure(job.run):
+                    brief = self.research_agent.build_brief(
+                        job.topic, job.category, refresh=refresh
+                    )
+                    self._checkpoint_brief(job.run, job.topic, brief, job.category)
+                return brief
+            finally:
+                job.research_seconds = time.monotonic() - started
+
+        def write(job: BatchJob, brief: ResearchBrief) -> BlogPost | None:
+            started = time.monotonic()
+            try:
+                with self._recording_failure(job.run):
+                    return self._write_and_publish(
+                        brief, job.category, job.run, update_rotation=False
+                    )
+            finally:
+                job.write_seconds = time.monotonic() - started
+
+        async def research_stage() -> None:
+            while (job := await research_queue.get()) is not None:
+                try:
+                    brief = await asyncio.to_thread(research, job)
+                except Exception as e:
+                    job.error = f"리서치 실패: {e}"
+                    console.print(f'[red]"{job.topic.title}" {job.error}[/]')
+                    continue
+                # 작성 단계가 밀려 큐가 차면 여기서 대기 (다음 리서치도 멈춤)
+                await write_queue.put((job, brief))
+
+        async def write_stage() -> None:
+            while (item := await write_queue.get()) is not None:
+                job, brief = item
+                try:
+                    job.post = await asyncio.to_thread(write, job, brief)
+                except Exception as e:
+                    job.error = f"작성·편집 실패: {e}"
+                    console.print(f'[red]"{job.topic.title}" {job.error}[/]')
+
+        writers = [asyncio.create_task(write_stage()) for _ in range(write_workers)]
+        await asyncio.gather(
+            discover(), *(research_stage() for _ in range(research_workers))
+        )
+        for _ in range(write_workers):
+            await write_queue.put(None)
+        await asyncio.gather(*writers)
+        return jobs
+
+    def _print_batch_summary(self, jobs: list[BatchJob]) -> None:
+        table = Table(title="배치 생성 결과", show_header=True)
+        table.add_column("카테고리", style="cyan")
+        table.add_column("토픽", width=24)
+        table.add_column("결과", justify="center")
+        table.add_column("점수", justify="right")
+        table.add_column("리서치", justify="right")
+        table.add_column("작성·편집", justify="right")
+        table.add_column("실행 ID", style="dim")
+
+        for job in jobs:
+            if job.post is not None:
+                status, score = "[green]완료[/]", f"{job.post.final_score:.1f}"
+            else:
+                status, score = f"[red]{job.error[:12] or '실패'}[/]", "-"
+            table.add_row(
+                job.category.display_name,
+                job.topic.title,
+                status,
+                score,
+                f"{job.research_seconds:.0f}초",
+                f"{job.write_seconds:.0f}초",
+                job.run.run_id if job.run else "-",
+            )
+        console.print(table)
+        done = sum(1 for job in jobs if job.post is not None)
+        console.print(f"  {done}/{len(jobs)}편 완료", style="dim")
+
     def run_write_edit_loop(
         self,
         brief: ResearchBrief,
         category: ContentCategory,
+        run: RunManifest | None = None,
     ) -> tuple[Draft, EditReview] | None:
-        """작가 ↔ 편집장 피드백 루프를 실행."""
+        """작가 ↔ 편집장 피드백 루프를 실행.
 
-        # 초안 작성
-        draft = self.writer_agent.write_draft(brief, version=1)
-        self.storage.save_markdown(
-            "drafts", draft.full_markdown, category, draft.title, "_v1"
-        )
+        run에 이전 라운드 기록이 있으면 저장된 초안·리뷰를 불러와 마지막
+        초안부터 이어간다 (검토까지 끝난 초안이면 그 리뷰를 다시 쓰지 않는다).
+        """
+        rounds = self._restore_rounds(run) if run is not None else []
+        if rounds:
+            draft, first_review = rounds[-1]
+            reviewed = [(d, r) for d, r in rounds[:-1] if r is not None]
+            console.print(
+                f"  체크포인트에서 재개: v{draft.version} "
+                f"({'검토 완료' if first_review else '검토 전'})",
+                style="dim",
+            )
+        else:
+            # 초안 작성 (설정 시 후보 N개 중 최고점 선택)
+            draft, first_review = self._write_first_draft(brief, category)
+            self._checkpoint_draft(run, draft, category)
+            reviewed = []
 
         best_draft = draft
         best_review: EditReview | None = None
         best_score = 0.0
+        for prev_draft, prev_review in reviewed:
+            if prev_review.overall_score > best_score:
+                best_score = prev_review.overall_score
+                best_draft, best_review = prev_draft, prev_review
+        previous: tuple[Draft, EditReview] | None = reviewed[-1] if reviewed else None
+        reviews: list[EditReview] = [r for _, r in reviewed]
+        # 재개 시 설정이 바뀌어 이미 최대 라운드를 넘었어도 현재 초안은 검토한다
+        last_round = max(self.max_rounds, draft.version)
+        writer = self.writer_agent
+        policy = StoppingPolicy(
+            self.config.quality,
+            ledger=writer.quota,
+            escalation_model=self.config.models.get("writer_escalation"),
+        )
+        decisions: list[dict] = []
+        self.last_stop_decisions = decisions
 
-        for round_num in range(1, self.max_rounds + 1):
+        for round_num in range(draft.version, last_round + 1):
             console.print(
-                f"\n[bold]--- 편집 라운드 {round_num}/{self.max_rounds} ---[/]"
+                f"\n[bold]--- 편집 라운드 {round_num}/{last_round} ---[/]"
             )
 
-            # 편집장 검토
-            review = self.editor_agent.review_draft(draft, brief)
-            self.storage.save_json(
+            # 편집장 검토 (후보 선별 때 이미 본 초안이면 그 결과 사용)
+            if first_review is not None:
+                review, first_review = first_review, None
+            else:
+                review = self.editor_agent.review_draft(
+                    draft, brief, previous=previous
+                )
+            review_path = self.storage.save_json(
                 "reviews", review, category, draft.title,
                 f"_review_v{draft.version}",
             )
+            self._checkpoint_review(run, draft, review, review_path)
+            reviews.append(review)
 
             # 최고 점수 추적
             if review.overall_score > best_score:
@@ -228,7 +662,7 @@ class BlogOrchestrator:
                 return draft, review
 
             # 마지막 라운드인 경우
-            if round_num == self.max_rounds:
+            if round_num == last_round:
                 console.print(
                     f"\n[yellow]최대 수정 횟수 도달. "
                     f"최고 점수 버전 사용 (v{best_draft.version}, "
@@ -236,28 +670,246 @@ class BlogOrchestrator:
                 )
                 return best_draft, best_review
 
+            # 다음 라운드의 실익 판단 (정체·하락·쿼터 부족이면 중단)
+            decision = policy.decide(
+                reviews, round_num, writer.model, self.editor_agent.model
+            )
+            decisions.append(decision.to_dict())
+            if decision.action not in (CONTINUE, ESCALATE):
+                console.print(
+                    f"\n[yellow]수정 중단: {decision.reason}. "
+                    f"최고 점수 버전 사용 (v{best_draft.version}, "
+                    f"{best_score:.1f}점)[/]"
+                )
+                self.storage.save_json(
+                    "reviews", {"decisions": decisions},
+                    category, best_draft.title, "_stopping",
+                )
+                return best_draft, best_review
+            if decision.action == ESCALATE:
+                console.print(f"\n[magenta]{decision.reason}[/]")
+                writer = WriterAgent(self.config, model=policy.escalation_model)
+            else:
+                console.print(f"  [dim]다음 라운드 진행: {decision.reason}[/]")
+
             # 수정 요청 → 재작성
             console.print(
                 f"\n[yellow]수정 요청 (점수: {review.overall_score:.1f})[/]"
             )
+            previous = (draft, review)
+            draft = writer.revise_draft(
+                draft, brief, version=round_num + 1, review=review
+            )
+            self._checkpoint_draft(run, draft, category)
+
+        return best_draft, best_review
+
+    def _checkpoint_draft(
+        self, run: RunManifest | None, draft: Draft, category: ContentCategory
+    ) -> None:
+        """초안을 마크다운(열람용)과 JSON(재개용)으로 저장하고 실행 기록에 반영."""
+        suffix = f"_v{draft.version}"
+        self.storage.save_markdown(
+            "drafts", draft.full_markdown, category, draft.title, suffix
+        )
+        draft_path = self.storage.save_json(
+            "drafts", draft, category, draft.title, suffix
+        )
+        if run is None:
+            return
+        run.rounds = [r for r in run.rounds if r.version != draft.version]
+        run.rounds.append(
+            RunRound(version=draft.version, draft=self.storage.relative(draft_path))
+        )
+        run.phase = RunPhase.DRAFT
+        self.storage.save_run(run)
+
+    def _checkpoint_review(
+        self,
+        run: RunManifest | None,
+        draft: Draft,
+        review: EditReview,
+        review_path: Path,
+    ) -> None:
+        if run is None:
+            return
+        entry = run.round_for(draft.version)
+        if entry is None:
+            return
+        entry.review = self.storage.relative(review_path)
+        entry.score = review.overall_score
+        run.phase = RunPhase.REVIEW
+        self.storage.save_run(run)
+
+    def _restore_rounds(
+        self, run: RunManifest
+    ) -> list[tuple[Draft, EditReview | None]]:
+        """실행 기록의 라운드별 초안·리뷰를 버전 순으로 불러온다.
+
+        파일이 없거나 깨진 라운드, 또는 검토 전 초안을 만나면 거기까지만 사용한다.
+        """
+        restored: list[tuple[Draft, EditReview | None]] = []
+        for entry in sorted(run.rounds, key=lambda r: r.version):
+            try:
+                draft = Draft.model_validate_json(
+                    self.storage.resolve(entry.draft).read_text(encoding="utf-8")
+                )
+                review = (
+                    EditReview.model_validate_json(
+                        self.storage.resolve(entry.review).read_text(encoding="utf-8")
+                    )
+                    if entry.review else None
+                )
+            except (OSError, ValueError) as e:
+                console.print(
+                    f"  [yellow]v{entry.version} 체크포인트를 읽지 못해 "
+                    f"그 앞에서 재개합니다: {e}[/]"
+                )
+                break
+            restored.append((draft, review))
+            # 검토 전 초안에서 멈춘 실행이므로 이후 기록은 쓰지 않는다
+            if review is None:
+                break
+        return restored
+
+    def _best_of_n_options(self, category: ContentCategory) -> dict:
+        """quality.best_of_n 설정 (카테고리별 값이 default를 덮어씀)."""
+        options = self.config.quality.get("best_of_n", {}) or {}
+        merged = dict(options.get("default", {}))
+        merged.update(options.get(category.value, {}) or {})
+        return merged
+
+    def _write_first_draft(
+        self, brief: ResearchBrief, category: ContentCategory
+    ) -> tuple[Draft, EditReview | None]:
+        """첫 초안을 작성한다.
+
+        best_of_n.n이 2 이상이면 temperature를 달리한 후보 초안을 동시에 쓰고
+        각각 검토해 최고점 초안을 고른다. 본 편집장으로 검토했다면 그 리뷰를
+        1라운드 리뷰로 재사용하고, 저비용 선별 모델을 썼다면 None을 돌려준다.
+        """
+        options = self._best_of_n_options(category)
+        n = int(options.get("n", 1))
+        if n <= 1:
+            return self.writer_agent.write_draft(brief, version=1), None
+
+        low, high = options.get("temperature_range", [0.6, 1.0])
+        temperatures = [low + (high - low) * i / (n - 1) for i in range(n)]
+        reviewer = (
+            self.screening_editor
+            if options.get("screen_with_cheaper_model", True) and self.screening_editor
+            else self.editor_agent
+        )
+        workers = max(1, int(options.get("concurrency", 2)))
+        console.print(
+            f"  [bold]후보 초안 {n}개 동시 작성 (동시 {workers}개, "
+            f"선별 모델 {reviewer.model})[/]"
+        )
+
+        def candidate(temperature: float) -> tuple[Draft, EditReview]:
             draft = self.writer_agent.write_draft(
-                brief, version=round_num + 1, review=review
+                brief, version=1, temperature=temperature
             )
-            self.storage.save_markdown(
-                "drafts",
-                draft.full_markdown,
-                category,
-                draft.title,
-                f"_v{draft.version}",
+            return draft, reviewer.review_draft(draft, brief)
+
+        results: list[tuple[float, Draft, EditReview]] = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="draft") as pool:
+            futures = {pool.submit(candidate, t): t for t in temperatures}
+            for future in as_completed(futures):
+                try:
+                    draft, review = future.result()
+                except Exception as e:
+                    console.print(
+                        f"  [yellow]후보 초안 실패 (temperature "
+                        f"{futures[future]:.2f}): {e}[/]"
+                    )
+                    continue
+                results.append((futures[future], draft, review))
+
+        if not results:
+            # 후보가 모두 실패하면 기존 방식으로 한 번 더
+            return self.writer_agent.write_draft(brief, version=1), None
+
+        # 점수가 같으면 temperature가 낮은(더 보수적인) 초안 우선
+        results.sort(key=lambda r: (-r[2].overall_score, r[0]))
+        table = Table(title="후보 초안", show_lines=False)
+        table.add_column("temperature", justify="right")
+        table.add_column("점수", justify="right")
+        table.add_column("분량", justify="right")
+        table.add_column("제목")
+        for i, (temperature, draft, review) in enumerate(results):
+            table.add_row(
+                f"{temperature:.2f}",
+                f"{review.overall_score:.1f}",
+                f"{len(draft.full_markdown):,}자",
+                ("★ " if i == 0 else "") + draft.title,
             )
+        console.print(table)
 
-        return best_draft, best_review
+        _, best_draft, best_review = results[0]
+        return best_draft, (best_review if reviewer is self.editor_agent else None)
 
     def run_research_only(
-        self, category: ContentCategory
+        self, category: ContentCategory, refresh: bool = False
     ) -> list[TopicSuggestion]:
         """리서치만 실행하고 토픽 제안을 반환."""
-        return self.research_agent.discover_topics(category)
+        return self.research_agent.discover_topics(category, refresh=refresh)
+
+    def _select_with_prefetch(
+        self,
+        topics: list[TopicSuggestion],
+        category: ContentCategory,
+        refresh: bool,
+    ) -> tuple[TopicSuggestion, ResearchBrief]:
+        """모든 후보 토픽의 브리핑을 백그라운드로 만들면서 사용자 선택을 받는다.
+
+        선택되지 않은 토픽 중 아직 시작 전인 작업은 취소하고, 이미 진행 중인
+        작업은 끝까지 돌려 브리핑 캐시에 남긴다 (다음 실행에서 재사용).
+        """
+        workers = max(1, int(self.config.research.get("prefetch_concurrency", 2)))
+        console.print(
+            f"  [dim]선택을 기다리는 동안 브리핑 {len(topics)}개를 미리 생성합니다 "
+            f"(동시 {workers}개)[/]"
+        )
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="brief-prefetch"
+        )
+        self._prefetch_executor = executor
+        # 선택 프롬프트가 묻히지 않도록 사전 생성 스레드의 로그만 끈다
+        futures: list[Future] = [
+            executor.submit(
+                self.research_agent.build_brief, topic, category, refresh, quiet=True
+            )
+            for topic in topics
+        ]
+        try:
+            selected_topic = self._user_select_topic(topics)
+        except BaseException:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+        selected = futures[topics.index(selected_topic)]
+        for future in futures:
+            if future is not selected:
+                future.cancel()
+        executor.shutdown(wait=False)
+
+        if selected.cancel():
+            # 아직 시작 전이었으면 현재 스레드에서 바로 생성
+            brief = self.research_agent.build_brief(
+                selected_topic, category, refresh=refresh
+            )
+        else:
+            if not selected.done():
+                console.print("  [dim]미리 생성 중인 브리핑을 기다리는 중...[/]")
+            try:
+                brief = selected.result()
+            except Exception as e:
+                console.print(f"  [yellow]사전 생성 실패, 다시 시도: {e}[/]")
+                brief = self.research_agent.build_brief(
+                    selected_topic, category, refresh=refresh
+                )
+        return selected_topic, brief
 
     def _user_select_topic(
         self, topics: list[TopicSuggestion]
@@ -288,4 +940,7 @@ class BlogOrchestrator:
 
     def cleanup(self):
         """리소스 정리."""
+        if self._prefetch_executor is not None:
+            # 진행 중인 사전 브리핑은 캐시에 남도록 마저 끝낸다
+            self._prefetch_executor.shutdown(wait=True, cancel_futures=True)
         self.research_agent.cleanup()
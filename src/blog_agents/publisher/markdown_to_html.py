@@ -3,13 +3,24 @@ from __future__ import annotations
 
 import re
 
+from blog_agents.utils.markdown_doc import (
+    BLANK,
+    BULLET,
+    HEADING,
+    IMAGE,
+    ORDERED,
+    QUOTE,
+    REFERENCES,
+    RULE,
+    parse_markdown,
+)
+
 
 def markdown_to_html(md_text: str) -> str:
     """마크다운 텍스트를 블로그용 HTML로 변환한다."""
-    # frontmatter 제거
-    md_text = re.sub(r"^---\n.*?\n---\n*", "", md_text, flags=re.DOTALL)
+    # frontmatter는 파서가 분리하므로 본문 블록만 변환
+    doc = parse_markdown(md_text)
 
-    lines = md_text.split("\n")
     html_lines = []
     in_list = False
     in_ordered_list = False
@@ -19,12 +30,11 @@ def markdown_to_html(md_text: str) -> str:
     in_tag_section = False
     first_h2_seen = False
 
-    for line in lines:
-        stripped = line.strip()
-        indent = len(line) - len(line.lstrip())
+    for block in doc.blocks:
+        stripped = block.source
 
         # 빈 줄 → 문단 사이 여백 추가
-        if not stripped:
+        if block.kind == BLANK:
             if in_tag_section:
                 in_tag_section = False
                 continue
@@ -48,10 +58,9 @@ def markdown_to_html(md_text: str) -> str:
             continue
 
         # 헤딩
-        heading_match = re.match(r"^(#{1,4})\s+(.*)", stripped)
-        if heading_match:
-            level = len(heading_match.group(1))
-            text = _inline_format(heading_match.group(2))
+        if block.kind == HEADING:
+            level = block.level
+            text = _inline_format(block.text)
             # H1은 제목이므로 생략 (블로그 에디터가 자동 생성)
             if level == 1:
                 continue
@@ -76,15 +85,12 @@ def markdown_to_html(md_text: str) -> str:
             continue
 
         # 블록 레벨 이미지: ![캡션](경로)
-        img_match = re.match(r"^!\[(.*?)\]\((.*?)\)$", stripped)
-        if img_match:
-            caption = img_match.group(1)
-            path = img_match.group(2)
-            html_lines.append(f"<!-- IMG:{path}|{caption} -->")
+        if block.kind == IMAGE:
+            html_lines.append(f"<!-- IMG:{block.url}|{block.text} -->")
             continue
 
         # 수평선
-        if re.match(r"^(-{3,}|\*{3,}|_{3,})$", stripped):
+        if block.kind == RULE:
             if in_references:
                 html_lines.append("</ul>")
                 html_lines.append("</div>")
@@ -93,8 +99,7 @@ def markdown_to_html(md_text: str) -> str:
             continue
 
         # 참고자료 섹션 시작
-        ref_match = re.match(r"^\*?\*?\[참고자료\]\*?\*?$", stripped)
-        if ref_match:
+        if block.kind == REFERENCES:
             in_references = True
             html_lines.append('<div class="references">')
             html_lines.append('<p class="ref-title">References</p>')
@@ -102,12 +107,10 @@ def markdown_to_html(md_text: str) -> str:
             continue
 
         # 참고자료 섹션 내 리스트 아이템
-        if in_references:
-            ul_match = re.match(r"^[-*+]\s+(.*)", stripped)
-            if ul_match:
-                text = _format_reference(ul_match.group(1))
-                html_lines.append(f"  <li>• {text}</li>")
-                continue
+        if in_references and block.kind == BULLET:
+            text = _format_reference(block.text)
+            html_lines.append(f"  <li>• {text}</li>")
+            continue
 
         # 면책 고지 → 본문에서 제거
         if ("면책 고지" in stripped or "면책고지" in stripped
@@ -121,18 +124,16 @@ def markdown_to_html(md_text: str) -> str:
             continue
 
         # 순서 있는 리스트
-        ol_match = re.match(r"^\d+\.\s+(.*)", stripped)
-        if ol_match:
+        if block.kind == ORDERED:
             if not in_ordered_list:
                 html_lines.append("<ol>")
                 in_ordered_list = True
-            text = _inline_format(ol_match.group(1))
+            text = _inline_format(block.text)
             html_lines.append(f"  <li>{text}</li>")
             continue
 
         # 중첩 리스트 (들여쓰기 4칸 이상)
-        ul_match = re.match(r"^[-*+]\s+(.*)", stripped)
-        if ul_match and indent >= 4 and in_list:
+        if block.kind == BULLET and block.indent >= 4 and in_list:
             if not in_sub_list:
                 # 마지막 </li>를 제거하고 중첩 시작
                 if html_lines and html_lines[-1].strip().endswith("</li>"):
@@ -140,25 +141,25 @@ def markdown_to_html(md_text: str) -> str:
                     html_lines.append(last.replace("</li>", ""))
                 html_lines.append("<ul>")
                 in_sub_list = True
-            text = _inline_format(ul_match.group(1))
+            text = _inline_format(block.text)
             html_lines.append(f"    <li>{text}</li>")
             continue
 
         # 순서 없는 리스트
-        if ul_match:
+        if block.kind == BULLET:
             if in_sub_list:
                 html_lines.append("</ul></li>")
                 in_sub_list = False
             if not in_list:
                 html_lines.append("<ul>")
                 in_list = True
-            text = _inline_format(ul_match.group(1))
+            text = _inline_format(block.text)
             html_lines.append(f"  <li>{text}</li>")
             continue
 
         # 인용
-        if stripped.startswith(">"):
-            text = _inline_format(stripped.lstrip("> "))
+        if block.kind == QUOTE:
+            text = _inline_format(block.text)
             if not in_blockquote:
                 html_lines.append("<blockquote>")
                 in_blockquote = True
@@ -9,6 +9,7 @@ from typing import Optional
 from rich.console import Console
 
 from blog_agents.publisher.markdown_to_html import markdown_to_html
+from blog_agents.utils.markdown_doc import parse_markdown
 
 console = Console()
 
@@ -106,18 +107,18 @@ class NaverBlogPublisher:
         self._markdown_dir = path.parent
         md_content = path.read_text(encoding="utf-8")
 
-        # frontmatter에서 제목, 키워드 추출
-        title = self._extract_frontmatter_field(md_content, "title")
-        if not title:
-            h1_match = re.search(r"^#\s+(.+)$", md_content, re.MULTILINE)
-            title = h1_match.group(1) if h1_match else path.stem
+        # frontmatter에서 제목, 키워드 추출 (없으면 첫 H1)
+        doc = parse_markdown(md_content)
+        title = doc.frontmatter.get("title") or doc.title or path.stem
 
         if tags is None:
-            kw_str = self._extract_frontmatter_field(md_content, "keywords")
-            if kw_str:
+            keywords = doc.frontmatter.get("keywords")
+            if isinstance(keywords, str):
+                keywords = keywords.strip("[]").split(",")
+            if keywords:
                 tags = [
                     k.strip().strip('"').strip("'")
-                    for k in kw_str.strip("[]").split(",")
+                    for k in keywords
                     if k.strip()
                 ]
 
@@ -768,17 +769,6 @@ class NaverBlogPublisher:
             segments.append({"type": "text", "content": html})
         return segments
 
-    @staticmethod
-    def _extract_frontmatter_field(md_text: str, field: str) -> Optional[str]:
-        """마크다운 frontmatter에서 특정 필드 값을 추출."""
-        fm_match = re.match(r"^---\n(.*?)\n---", md_text, re.DOTALL)
-        if not fm_match:
-            return None
-        for line in fm_match.group(1).split("\n"):
-            if line.startswith(f"{field}:"):
-                return line[len(field) + 1 :].strip()
-        return None
-
 
 def run_naver_publish(
     naver_id: str,
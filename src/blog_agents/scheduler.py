@@ -0,0 +1,308 @@
+"""blog-agents serve — 요일 스케줄에 맞춰 파이프라인을 실행하는 상주 데몬.
+
+오케스트레이터(LLM 클라이언트, HTTP 연결, 캐시, 프롬프트 템플릿)를 한 번만 만들어
+실행 사이에도 유지하고, 실행 몇 분 전에 토픽·브리핑을 미리 수집해 둔다.
+상태는 /health 엔드포인트(JSON)로 확인한다.
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time as time_module
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+from rich.console import Console
+
+from blog_agents.models.config import AppConfig
+from blog_agents.models.content import BlogPost
+from blog_agents.models.research import ContentCategory
+from blog_agents.orchestrator import BlogOrchestrator
+
+console = Console()
+
+WEEKDAYS = [
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+]
+
+# 시계 변경·절전 복귀에 대비해 대기 중에도 이 간격(초)마다 일정을 다시 계산한다
+_MAX_SLEEP = 300.0
+
+
+@dataclass(frozen=True)
+class ScheduledRun:
+    """예정된 실행 하나 (카테고리와 실행 시각)."""
+
+    category: ContentCategory
+    at: datetime
+
+    @property
+    def key(self) -> str:
+        return f"{self.at.isoformat()}_{self.category.value}"
+
+    def to_dict(self) -> dict:
+        return {"category": self.category.value, "at": self.at.isoformat()}
+
+
+def parse_run_time(value: str) -> time:
+    """'HH:MM' 형식의 실행 시각을 읽는다."""
+    hour, _, minute = str(value).partition(":")
+    return time(int(hour), int(minute or 0))
+
+
+def upcoming_runs(
+    schedule: dict,
+    run_time: time,
+    after: datetime,
+    days: int = 8,
+) -> list[ScheduledRun]:
+    """after 이후 days일 안의 예정 실행 목록 (시각 순).
+
+    schedule은 settings.yaml content.schedule의 요일 → 카테고리 매핑이며,
+    알 수 없는 요일·카테고리는 건너뛴다.
+    """
+    tz = after.tzinfo
+    runs = []
+    for offset in range(days):
+        day: date = after.date() + timedelta(days=offset)
+        value = schedule.get(WEEKDAYS[day.weekday()])
+        if not value:
+            continue
+        try:
+            category = ContentCategory(value)
+        except ValueError:
+            continue
+        at = datetime.combine(day, run_time, tzinfo=tz)
+        if at >= after:
+            runs.append(ScheduledRun(category, at))
+    return runs
+
+
+@dataclass
+class ServeState:
+    """데몬 상태 (스케줄 스레드가 갱신하고 health 스레드가 읽는다)."""
+
+    started_at: datetime
+    status: str = "starting"   # starting / idle / prefetching / running / stopping
+    next_run: Optional[ScheduledRun] = None
+    prefetched: Optional[dict] = None
+    current: Optional[ScheduledRun] = None
+    last_run: Optional[dict] = None
+    runs: int = 0
+    failures: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def update(self, **changes) -> None:
+        with self._lock:
+            for key, value in changes.items():
+                setattr(self, key, value)
+
+    def to_dict(self, now: datetime) -> dict:
+        with self._lock:
+            return {
+                "status": self.status,
+                "started_at": self.started_at.isoformat(),
+                "uptime_seconds": int((now - self.started_at).total_seconds()),
+                "next_run": self.next_run.to_dict() if self.next_run else None,
+                "prefetched": self.prefetched,
+                "current": self.current.to_dict() if self.current else None,
+                "last_run": self.last_run,
+                "runs": self.runs,
+                "failures": self.failures,
+            }
+
+
+class BlogScheduler:
+    """요일 스케줄에 따라 사전 수집과 파이프라인 실행을 반복하는 데몬."""
+
+    def __init__(
+        self,
+        config: AppConfig,
+        orchestrator: Optional[BlogOrchestrator] = None,
+        on_published: Optional[Callable[[BlogPost], None]] = None,
+    ):
+        """on_published는 예정 실행이 글을 완성할 때마다 호출된다 (네이버 발행 등)."""
+        self.config = config
+        self.on_published = on_published
+        serve = config.serve
+        # 토픽 캐시와 같은 시간대여야 사전 수집이 예정 실행과 같은 "오늘"에 저장된다
+        self.tz = config.timezone
+        self.run_time = parse_run_time(serve.get("run_time", "10:00"))
+        self.prefetch_lead = timedelta(minutes=serve.get("prefetch_minutes", 30))
+        self.schedule = config.content.get("schedule", {})
+        self.orchestrator = orchestrator or BlogOrchestrator(config)
+        self.state = ServeState(started_at=self.now())
+        self._done: set[str] = set()
+        self._prefetched: set[str] = set()
+        self._stop = threading.Event()
+        self._health_server: Optional[ThreadingHTTPServer] = None
+
+    def now(self) -> datetime:
+        return datetime.now(self.tz)
+
+    def next_run(self, now: datetime) -> Optional[ScheduledRun]:
+        """아직 실행하지 않은 가장 이른 예정 실행.
+
+        데몬 시작 전에 지난 시각은 건너뛰고(밀린 실행은 하지 않는다),
+        시작 후에 지난 시각은 하루 안이면 늦더라도 실행한다.
+        """
+        after = max(self.state.started_at, now - timedelta(days=1))
+        for run in upcoming_runs(self.schedule, self.run_time, after):
+            if run.key not in self._done:
+                return run
+        return None
+
+    # ------------------------------------------------------------------
+    # 실행 루프
+    # ------------------------------------------------------------------
+
+    def warm_up(self) -> None:
+        """프롬프트 템플릿과 발행 인덱스를 미리 읽어 첫 실행의 준비 시간을 없앤다."""
+        agents = [
+            self.orchestrator.research_agent,
+            self.orchestrator.writer_agent,
+            self.orchestrator.editor_agent,
+        ]
+        if self.orchestrator.screening_editor is not None:
+            agents.append(self.orchestrator.screening_editor)
+        for agent in agents:
+            for name in agent.jinja_env.list_templates():
+                agent.jinja_env.get_template(name)
+        self.orchestrator.research_agent.published_index.refresh()
+
+    def run_forever(self) -> None:
+        """stop()이 호출될 때까지 예정 실행을 기다렸다가 실행한다."""
+        self.warm_up()
+        self.state.update(status="idle")
+
+        while not self._stop.is_set():
+            now = self.now()
+            run = self.next_run(now)
+            self.state.update(next_run=run)
+            if run is None:
+                console.print("[yellow]content.schedule에 실행할 요일이 없습니다.[/]")
+                self._stop.wait(_MAX_SLEEP)
+                continue
+
+            if run.key not in self._prefetched:
+                prefetch_at = run.at - self.prefetch_lead
+                if now >= prefetch_at:
+                    self._prefetch(run)
+                    continue
+                wake_at = prefetch_at
+            elif now >= run.at:
+                self._fire(run)
+                continue
+            else:
+                wake_at = run.at
+
+            self._stop.wait(min((wake_at - now).total_seconds(), _MAX_SLEEP))
+
+        self.state.update(status="stopping")
+
+    def stop(self) -> None:
+        """루프를 끝낸다. 진행 중인 파이프라인은 마치고 종료한다."""
+        self._stop.set()
+
+    def _prefetch(self, run: ScheduledRun) -> None:
+        """토픽 탐색과 첫 토픽 브리핑을 미리 해 둔다.
+
+        둘 다 캐시(오늘 토픽, 브리핑)에 남으므로 예정 시각의 파이프라인은
+        수집 없이 바로 작성 단계로 넘어간다. 실패해도 실행 자체는 진행한다.
+        """
+        self._prefetched.add(run.key)
+        if self.prefetch_lead <= timedelta(0):
+            return
+
+        console.print(
+            f"\n[bold blue]사전 수집: {run.category.display_name} "
+            f"({run.at:%m-%d %H:%M} 실행 예정)[/]"
+        )
+        self.state.update(status="prefetching")
+        started = time_module.monotonic()
+        info = {"category": run.category.value, "for": run.at.isoformat()}
+        research = self.orchestrator.research_agent
+        try:
+            topics = research.discover_topics(run.category)
+            info["topics"] = len(topics)
+            if topics:
+                research.build_brief(topics[0], run.category)
+                info["brief"] = topics[0].title
+        except Exception as e:
+            info["error"] = str(e)
+            console.print(f"  [yellow]사전 수집 실패 (실행 시 다시 수집): {e}[/]")
+        info["seconds"] = round(time_module.monotonic() - started, 1)
+        self.state.update(status="idle", prefetched=info)
+
+    def _fire(self, run: ScheduledRun) -> None:
+        """예정 실행 하나를 수행하고 결과를 상태에 기록한다."""
+        self._done.add(run.key)
+        self.state.update(status="running", current=run)
+        started = time_module.monotonic()
+        result = {"category": run.category.value, "scheduled_at": run.at.isoformat()}
+        try:
+            post = self.orchestrator.run_full_pipeline(run.category, auto_select=True)
+            result["ok"] = post is not None
+            if post is not None:
+                result["title"] = post.draft.title
+                result["score"] = post.final_score
+                if self.on_published is not None:
+                    self.on_published(post)
+        except Exception as e:
+            result["ok"] = False
+            result["error"] = str(e)
+            console.print(f"[red]예정 실행 실패: {e}[/]")
+        result["finished_at"] = self.now().isoformat()
+        result["seconds"] = round(time_module.monotonic() - started, 1)
+
+        with self.state._lock:
+            self.state.runs += 1
+            if not result["ok"]:
+                self.state.failures += 1
+        self.state.update(status="idle", current=None, last_run=result)
+
+    # ------------------------------------------------------------------
+    # 상태 엔드포인트
+    # ------------------------------------------------------------------
+
+    def health(self) -> dict:
+        data = self.state.to_dict(self.now())
+        data["sources"] = self.orchestrator.research_agent.source_health.summary()
+        return data
+
+    def start_health_server(self, host: str, port: int) -> ThreadingHTTPServer:
+        """/health에 상태 JSON을 응답하는 HTTP 서버를 백그라운드 스레드로 띄운다."""
+        scheduler = self
+
+        class HealthHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/health"):
+                    self.send_error(404)
+                    return
+                body = json.dumps(scheduler.health(), ensure_ascii=False).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), HealthHandler)
+        server.daemon_threads = True
+        threading.Thread(
+            target=server.serve_forever, name="health-server", daemon=True
+        ).start()
+        self._health_server = server
+        return server
+
+    def shutdown(self) -> None:
+        """상태 서버와 오케스트레이터 리소스를 정리한다."""
+        if self._health_server is not None:
+            self._health_server.shutdown()
+            self._health_server.server_close()
+            self._health_server = None
+        self.orchestrator.cleanup()
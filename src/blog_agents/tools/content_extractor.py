@@ -0,0 +1,154 @@
+"""HTML 본문 추출 — 텍스트 밀도 기반 보일러플레이트 제거."""
+from __future__ import annotations
+
+import re
+
+import lxml.html
+from lxml import etree
+
+# 본문과 무관한 태그 (통째로 제거)
+_DROP_TAGS = (
+    "script", "style", "noscript", "nav", "header", "footer", "aside",
+    "form", "iframe", "button", "select", "svg",
+)
+
+# class/id에 이 단어가 들어가면 보일러플레이트로 간주
+_BOILERPLATE_RE = re.compile(
+    r"comment|footer|gnb|lnb|menu|nav|sidebar|banner|share|sns|related|"
+    r"copyright|breadcrumb|popup|advert|^ad[-_]|[-_]ad$",
+    re.IGNORECASE,
+)
+
+# 점수를 매길 문단 단위 요소
+_PARAGRAPH_TAGS = ("p", "td", "pre", "li", "dd")
+
+# 텍스트 추출 시 줄바꿈을 넣을 블록 요소
+_BLOCK_TAGS = {
+    "p", "div", "br", "li", "tr", "dd", "dt", "section", "article",
+    "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre",
+}
+
+# <meta charset="..."> 또는 http-equiv content의 charset
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+# 문장 종결 부호 (한국어 "다." 포함) — 본문다움의 신호
+_SENTENCE_END_RE = re.compile(r"[.!?。]|다\.")
+
+
+def decode_html(raw: bytes, encoding: str | None = None) -> str:
+    """HTML 바이트를 문자열로 변환한다.
+
+    응답 헤더 charset → <meta charset> → UTF-8 → CP949(EUC-KR) 순으로 시도한다.
+    """
+    candidates = [encoding]
+    meta = _META_CHARSET_RE.search(raw[:4096])
+    if meta:
+        candidates.append(meta.group(1).decode("ascii", "ignore"))
+    candidates += ["utf-8", "cp949"]
+    for enc in candidates:
+        if not enc:
+            continue
+        try:
+            return raw.decode(enc)
+        except (LookupError, UnicodeDecodeError):
+            continue
+    return raw.decode("utf-8", errors="replace")
+
+
+def extract_main_text(
+    html: str | bytes, max_chars: int | None = 3000, encoding: str | None = None
+) -> str:
+    """HTML에서 본문 텍스트만 추출한다 (max_chars=None이면 자르지 않음).
+
+    문단마다 길이·문장부호 기반 점수를 매겨 부모(1배)와 조부모(0.5배)에
+    누적하고, 링크 밀도로 보정한 최고 점수 노드를 본문으로 선택한다.
+    후보가 없으면 <body> 전체 텍스트를 반환한다.
+    """
+    if not html:
+        return ""
+    if isinstance(html, bytes):
+        html = decode_html(html, encoding)
+    try:
+        doc = lxml.html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return ""
+
+    _strip_boilerplate(doc)
+
+    scores: dict = {}
+    for para in doc.iter(*_PARAGRAPH_TAGS):
+        text = para.text_content().strip()
+        if len(text) < 25:
+            continue
+        score = 1.0 + len(_SENTENCE_END_RE.findall(text)) + min(len(text) / 100, 3.0)
+        parent = para.getparent()
+        if parent is None:
+            continue
+        scores[parent] = scores.get(parent, 0.0) + score
+        grandparent = parent.getparent()
+        if grandparent is not None:
+            scores[grandparent] = scores.get(grandparent, 0.0) + score / 2
+
+    best = None
+    best_score = 0.0
+    for node, score in scores.items():
+        adjusted = score * (1.0 - _link_density(node))
+        if adjusted > best_score:
+            best, best_score = node, adjusted
+
+    if best is None:
+        body = doc.find(".//body")
+        best = body if body is not None else doc
+        max_chars = min(max_chars, 2000) if max_chars else 2000
+
+    return _node_text(best)[:max_chars]
+
+
+def _strip_boilerplate(doc) -> None:
+    """내비게이션·광고·스크립트 등 본문이 아닌 요소를 제거한다."""
+    for el in list(doc.iter(*_DROP_TAGS)):
+        el.drop_tree()
+    for el in list(doc.iter("div", "section", "ul", "table")):
+        marker = f"{el.get('class', '')} {el.get('id', '')}"
+        if marker.strip() and _BOILERPLATE_RE.search(marker):
+            el.drop_tree()
+
+
+def _link_density(node) -> float:
+    """노드 텍스트 중 링크 텍스트가 차지하는 비율."""
+    total = len(node.text_content())
+    if not total:
+        return 1.0
+    linked = sum(len(a.text_content()) for a in node.iter("a"))
+    return min(linked / total, 1.0)
+
+
+def _node_text(node) -> str:
+    """블록 경계를 줄바꿈으로 보존하며 텍스트를 추출한다."""
+    lines: list[str] = []
+    current: list[str] = []
+
+    def flush():
+        line = re.sub(r"\s+", " ", "".join(current)).strip()
+        if line:
+            lines.append(line)
+        current.clear()
+
+    for event, el in etree.iterwalk(node, events=("start", "end")):
+        if not isinstance(el.tag, str):
+            if event == "end" and el.tail:
+                current.append(el.tail)
+            continue
+        if event == "start":
+            if el.tag in _BLOCK_TAGS:
+                flush()
+            if el.text:
+                current.append(el.text)
+        else:
+            if el.tag in _BLOCK_TAGS:
+                flush()
+            if el.tail and el is not node:
+                current.append(el.tail)
+    flush()
+
+    return "\n".join(lines)
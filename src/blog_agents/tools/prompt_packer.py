@@ -0,0 +1,221 @@
+"""토큰 예산 기반 프롬프트 패커 — 수집 항목을 우선순위대로 예산 안에 채운다."""
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from blog_agents.tools.relevance import RankedItem, tokenize
+
+_HANGUL_RE = re.compile(r"[가-힣ㄱ-ㅎㅏ-ㅣ一-鿿]")
+# 문장부호(…다. …요? …!) 뒤 공백에서 문장을 나눈다
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?。…])\s+")
+
+# 같은 사건을 다룬 항목으로 볼 제목 토큰 Jaccard 유사도
+_SAME_STORY_JACCARD = 0.45
+
+_SECTIONS = (
+    ("rss", "### RSS 피드 (최근 전시 뉴스)"),
+    ("scraped", "### 미술관/갤러리 전시 목록"),
+    ("search", "### 전시 뉴스 검색 결과"),
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (보수적).
+
+    한글·한자는 대략 1.5자당 1토큰, 그 밖의 문자는 4자당 1토큰으로 본다.
+    실제 토크나이저 호출 없이 예산 판단에만 쓰므로 약간 크게 잡는다.
+    """
+    if not text:
+        return 0
+    hangul = len(_HANGUL_RE.findall(text))
+    other = len(text) - hangul
+    return math.ceil(hangul / 1.5 + other / 4)
+
+
+def split_sentences_ko(text: str) -> list[str]:
+    """한국어 문장 경계로 나눈다 (종결 부호를 문장에 남긴다)."""
+    return [p.strip() for p in _SENTENCE_END_RE.split(text.strip()) if p.strip()]
+
+
+def trim_to_sentences(text: str, max_tokens: int) -> str:
+    """문장 단위로 앞에서부터 ``max_tokens`` 안에 들어가는 만큼만 남긴다.
+
+    첫 문장부터 예산을 넘으면 어절 경계에서 자르고 "…"를 붙인다.
+    """
+    if max_tokens <= 0 or not text:
+        return ""
+    if estimate_tokens(text) <= max_tokens:
+        return text.strip()
+
+    kept: list[str] = []
+    used = 0
+    for sentence in split_sentences_ko(text):
+        cost = estimate_tokens(sentence) + 1
+        if used + cost > max_tokens:
+            break
+        kept.append(sentence)
+        used += cost
+    if kept:
+        return " ".join(kept)
+
+    words = text.split()
+    out: list[str] = []
+    used = 1  # "…"
+    for word in words:
+        cost = estimate_tokens(word) + 1
+        if used + cost > max_tokens:
+            break
+        out.append(word)
+        used += cost
+    return " ".join(out) + "…" if out else ""
+
+
+@dataclass
+class PackResult:
+    text: str
+    budget: int
+    used_tokens: int
+    included: list[RankedItem] = field(default_factory=list)
+    dropped: int = 0
+    trimmed: int = 0
+
+
+class PromptPacker:
+    """순위화된 수집 항목을 토큰 예산 안에 채워 토픽 제안 프롬프트를 만든다.
+
+    항목 우선순위 = 관련도 순위(50%) + 최신성(30%) + 여러 출처 보도(20%).
+    우선순위가 높은 항목일수록 요약에 더 많은 토큰을 배정하고, 예산이
+    바닥나면 나머지 항목은 제외한다.
+    """
+
+    def __init__(
+        self,
+        budget_tokens: int,
+        summary_min_tokens: int = 30,
+        summary_max_tokens: int = 160,
+        now: Optional[datetime] = None,
+    ):
+        self.budget = budget_tokens
+        self.summary_min = summary_min_tokens
+        self.summary_max = summary_max_tokens
+        self.now = now or datetime.now()
+
+    @classmethod
+    def from_config(cls, research: dict, model: str) -> PromptPacker:
+        """settings.yaml의 research.prompt_token_budget에서 모델별 예산을 고른다."""
+        budgets = research.get("prompt_token_budget", {}) or {}
+        budget = budgets.get(model, budgets.get("default", 6000))
+        return cls(
+            int(budget),
+            summary_min_tokens=research.get("summary_min_tokens", 30),
+            summary_max_tokens=research.get("summary_max_tokens", 160),
+        )
+
+    # ------------------------------------------------------------------
+    # 우선순위
+    # ------------------------------------------------------------------
+
+    def _recency(self, item: RankedItem) -> float:
+        if item.published is None:
+            return 0.5
+        age_days = max((self.now - item.published).total_seconds() / 86400, 0.0)
+        return 1 / (1 + age_days / 3)
+
+    @staticmethod
+    def _coverage(items: list[RankedItem]) -> list[int]:
+        """항목마다 비슷한 제목을 보도한 서로 다른 출처 수."""
+        token_sets = [set(tokenize(it.title)) for it in items]
+        sources = [it.source or it.kind for it in items]
+        coverage = []
+        for i, tokens in enumerate(token_sets):
+            seen = {sources[i]}
+            if tokens:
+                for j, other in enumerate(token_sets):
+                    if j == i or not other or sources[j] in seen:
+                        continue
+                    if len(tokens & other) / len(tokens | other) >= _SAME_STORY_JACCARD:
+                        seen.add(sources[j])
+            coverage.append(len(seen))
+        return coverage
+
+    def prioritize(self, ranked: list[RankedItem]) -> list[tuple[RankedItem, float]]:
+        if not ranked:
+            return []
+        top = max((it.score for it in ranked), default=0.0) or 1.0
+        coverage = self._coverage(ranked)
+        scored = []
+        for it, cov in zip(ranked, coverage):
+            priority = (
+                0.5 * max(it.score, 0.0) / top
+                + 0.3 * self._recency(it)
+                + 0.2 * min(cov - 1, 2) / 2
+            )
+            scored.append((it, priority))
+        scored.sort(key=lambda pair: pair[1], reverse=True)
+        return scored
+
+    # ------------------------------------------------------------------
+    # 패킹
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _header(item: RankedItem) -> str:
+        if item.kind == "search":
+            return f"- {item.title}"
+        return f"- [{item.date}] {item.title} ({item.source})"
+
+    def pack(self, ranked: list[RankedItem], footer: str = "") -> PackResult:
+        """우선순위 순으로 예산을 채우고 출처 유형별 섹션으로 묶는다.
+
+        ``footer``(카테고리·수집 건수 등)는 예산에서 먼저 떼어 둔다.
+        """
+        used = estimate_tokens(footer) + sum(
+            estimate_tokens(title) + 1 for _, title in _SECTIONS
+        )
+        chosen: dict[str, list[str]] = {kind: [] for kind, _ in _SECTIONS}
+        included: list[RankedItem] = []
+        trimmed = 0
+        scored = self.prioritize(ranked)
+
+        for it, priority in scored:
+            header = self._header(it)
+            cost = estimate_tokens(header) + 1
+            if used + cost > self.budget:
+                break
+            used += cost
+            lines = [header]
+            if it.text:
+                cap = self.summary_min + (self.summary_max - self.summary_min) * priority
+                cap = min(int(cap), self.budget - used - 2)
+                summary = trim_to_sentences(it.text, cap)
+                if summary:
+                    if summary != it.text.strip():
+                        trimmed += 1
+                    line = f"  요약: {summary}" if it.kind == "rss" else f"  {summary}"
+                    used += estimate_tokens(line) + 1
+                    lines.append(line)
+            chosen.setdefault(it.kind, []).extend(lines)
+            included.append(it)
+
+        parts = []
+        for kind, title in _SECTIONS:
+            if chosen.get(kind):
+                if parts:
+                    parts.append("")
+                parts.append(title)
+                parts.extend(chosen[kind])
+        if footer:
+            parts.append(footer)
+
+        return PackResult(
+            text="\n".join(parts),
+            budget=self.budget,
+            used_tokens=used,
+            included=included,
+            dropped=len(ranked) - len(included),
+            trimmed=trimmed,
+        )
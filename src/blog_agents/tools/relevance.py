@@ -0,0 +1,246 @@
+"""수집 항목 관련도 순위 — 문자 n-gram 토크나이저 + BM25 역색인."""
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from blog_agents.utils.storage import atomic_write_text
+
+_WORD_RE = re.compile(r"[0-9a-z]+|[가-힣]+|[一-鿿]+")
+_HANGUL_RE = re.compile(r"[가-힣一-鿿]")
+
+# IDF 이력에 보관할 최근 항목 키 수 (df·n_docs도 이 창 크기에 맞춰 줄인다)
+_MAX_SEEN = 5000
+# 줄이다가 이 값 밑으로 내려간 df 항목은 버린다
+_MIN_DF = 0.05
+
+
+def tokenize(text: str) -> list[str]:
+    """한국어는 음절 bigram, 영문·숫자는 단어 단위로 토큰화한다.
+
+    형태소 분석기 없이도 "국립현대미술관" ↔ "현대미술관" 같은 부분 일치가
+    점수에 반영되도록 한글 어절을 2글자 단위로 쪼갠다.
+    """
+    text = unicodedata.normalize("NFKC", text).lower()
+    tokens: list[str] = []
+    for word in _WORD_RE.findall(text):
+        if _HANGUL_RE.match(word) and len(word) > 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        elif len(word) >= 2:
+            tokens.append(word)
+    return tokens
+
+
+@dataclass
+class RankedItem:
+    """순위 계산 대상이 되는 수집 항목 (RSS·스크래핑·검색 공통 형태)."""
+
+    kind: str  # "rss" | "scraped" | "search"
+    title: str
+    text: str
+    source: str = ""
+    date: str = ""
+    published: Optional[datetime] = None
+    url: str = ""
+    score: float = 0.0
+    item: Any = None
+
+    @property
+    def key(self) -> str:
+        return self.url or self.title
+
+
+class IdfHistory:
+    """지금까지 본 항목들의 문서 빈도(df)를 누적 저장하는 IDF 이력.
+
+    하루 수집량만으로 IDF를 계산하면 "전시"처럼 어디에나 나오는 단어의
+    가중치가 그날 데이터 편향에 휘둘린다. 이력이 충분히 쌓이면 이 누적 df로
+    IDF를 계산한다.
+
+    통계는 최근 ``_MAX_SEEN``개 항목 창을 따른다. 창에서 밀려난 항목이 다시
+    들어와도 n_docs가 창 크기를 넘지 않도록 df를 같은 비율로 줄인다.
+
+    여러 카테고리 파이프라인이 동시에 갱신하므로 에이전트당 하나를 공유하고
+    갱신·저장은 잠금 안에서 한다.
+    """
+
+    def __init__(self, path: Path, min_docs: int = 200):
+        self.path = path
+        self.min_docs = min_docs
+        self.n_docs = 0
+        self.df: Counter = Counter()
+        self.seen: list[str] = []
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return
+        self.n_docs = data.get("n_docs", 0)
+        self.df = Counter(data.get("df", {}))
+        self.seen = data.get("seen", [])[-_MAX_SEEN:]
+        self._rescale()
+
+    @property
+    def ready(self) -> bool:
+        return self.n_docs >= self.min_docs
+
+    def update(self, docs: Iterable[tuple[str, list[str]]]) -> None:
+        """처음 보는 항목만 df에 반영한다."""
+        docs = [
+            (hashlib.sha1(key.encode("utf-8")).hexdigest()[:16], set(tokens))
+            for key, tokens in docs
+        ]
+        with self._lock:
+            seen = set(self.seen)
+            for digest, tokens in docs:
+                if digest in seen:
+                    continue
+                seen.add(digest)
+                self.seen.append(digest)
+                self.n_docs += 1
+                self.df.update(tokens)
+            self.seen = self.seen[-_MAX_SEEN:]
+            self._rescale()
+
+    def _rescale(self) -> None:
+        """n_docs가 보관 중인 항목 수를 넘으면 df를 같은 비율로 줄여 맞춘다."""
+        if self.n_docs <= len(self.seen):
+            return
+        ratio = len(self.seen) / self.n_docs
+        self.n_docs = len(self.seen)
+        self.df = Counter({
+            term: round(count * ratio, 3)
+            for term, count in self.df.items()
+            if count * ratio >= _MIN_DF
+        })
+
+    def save(self) -> None:
+        with self._lock:
+            data = {"n_docs": self.n_docs, "df": dict(self.df), "seen": self.seen}
+            atomic_write_text(self.path, json.dumps(data, ensure_ascii=False))
+
+
+class BM25Index:
+    """메모리 내 BM25 역색인. 질의 토큰의 포스팅만 순회하므로 수천 건도 빠르다."""
+
+    def __init__(
+        self,
+        k1: float = 1.5,
+        b: float = 0.75,
+        history: Optional[IdfHistory] = None,
+    ):
+        self.k1 = k1
+        self.b = b
+        self.history = history
+        self.doc_lengths: list[int] = []
+        self.postings: dict[str, list[tuple[int, int]]] = {}
+        self.doc_tokens: list[list[str]] = []
+
+    def add(self, text: str) -> int:
+        tokens = tokenize(text)
+        doc_id = len(self.doc_lengths)
+        self.doc_lengths.append(len(tokens))
+        self.doc_tokens.append(tokens)
+        for term, tf in Counter(tokens).items():
+            self.postings.setdefault(term, []).append((doc_id, tf))
+        return doc_id
+
+    def idf(self, term: str) -> float:
+        if self.history and self.history.ready:
+            n, df = self.history.n_docs, self.history.df.get(term, 0)
+        else:
+            n, df = len(self.doc_lengths), len(self.postings.get(term, ()))
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def scores(self, query: dict[str, float]) -> list[float]:
+        """질의(토큰 → 가중치)에 대한 문서별 BM25 점수."""
+        n = len(self.doc_lengths)
+        result = [0.0] * n
+        if not n:
+            return result
+        avgdl = sum(self.doc_lengths) / n or 1.0
+        norms = [
+            self.k1 * (1 - self.b + self.b * length / avgdl)
+            for length in self.doc_lengths
+        ]
+        for term, weight in query.items():
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = self.idf(term) * weight
+            for doc_id, tf in postings:
+                result[doc_id] += idf * tf * (self.k1 + 1) / (tf + norms[doc_id])
+        return result
+
+
+def build_query(
+    keywords: list[str],
+    recent_titles: list[str],
+    recent_terms: int = 15,
+    recent_weight: float = 0.5,
+) -> dict[str, float]:
+    """카테고리 키워드(가중치 1.0)와 최근 제목 빈출 토큰으로 질의를 만든다."""
+    query: dict[str, float] = {}
+    for kw in keywords:
+        for token in tokenize(kw):
+            query[token] = 1.0
+
+    counts = Counter(t for title in recent_titles for t in set(tokenize(title)))
+    for token, count in counts.most_common(recent_terms):
+        if count >= 2:
+            query.setdefault(token, recent_weight)
+    return query
+
+
+def rank_items(
+    items: list[RankedItem],
+    keywords: list[str],
+    history: Optional[IdfHistory] = None,
+    recent_days: int = 3,
+) -> list[RankedItem]:
+    """수집 항목을 카테고리 관련도(BM25) 순으로 정렬해 반환한다.
+
+    최근 ``recent_days``일 안의 제목에서 자주 나온 토큰을 질의에 더해,
+    키워드에 없던 그날의 화제도 순위에 반영한다.
+    """
+    if not items:
+        return []
+
+    index = BM25Index(history=history)
+    for it in items:
+        # 제목은 두 번 넣어 본문보다 가중치를 높인다
+        index.add(f"{it.title} {it.title} {it.text}")
+
+    now = datetime.now()
+    recent_titles = [
+        it.title for it in items
+        if it.published and (now - it.published).days < recent_days
+    ]
+    query = build_query(keywords, recent_titles)
+
+    for it, score in zip(items, index.scores(query)):
+        it.score = score
+
+    if history is not None:
+        history.update((it.key, tokens) for it, tokens in zip(items, index.doc_tokens))
+
+    # 동점이면 최신 항목 우선
+    return sorted(
+        items,
+        key=lambda it: (it.score, it.published or datetime.min),
+        reverse=True,
+    )
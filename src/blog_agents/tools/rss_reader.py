@@ -6,10 +6,12 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 import feedparser
-import httpx
-from rich.console import Console
 
-console = Console()
+from blog_agents.tools.source_health import SourceHealth
+from blog_agents.tools.transport import HttpTransport
+from blog_agents.utils.console import AgentConsole
+
+console = AgentConsole()
 
 
 @dataclass
@@ -73,13 +75,16 @@ def _parse_date(date_str: str | None) -> Optional[datetime]:
 class RSSReader:
     """RSS 피드를 읽고 파싱하는 도구."""
 
-    def __init__(self, sources_config: dict):
+    def __init__(
+        self,
+        sources_config: dict,
+        transport: Optional[HttpTransport] = None,
+        health: Optional[SourceHealth] = None,
+    ):
         self.sources = sources_config
-        self.client = httpx.Client(
-            timeout=30.0,
-            headers={"User-Agent": "BlogAgents/1.0 (Korean Art Exhibition Blog)"},
-            follow_redirects=True,
-        )
+        self.health = health
+        self._owns_transport = transport is None
+        self.http = transport or HttpTransport()
 
     def fetch_feeds(
         self, urls: list[str], days_back: int = 7
@@ -89,12 +94,30 @@ class RSSReader:
         all_items: list[RSSItem] = []
 
         for url in urls:
+            # 반복 실패로 차단된 피드는 재시도 시각 전까지 건너뜀
+            if self.health and self.health.should_skip(url):
+                console.print(f"  [RSS] {url[:80]} 차단 중 → 건너뜀", style="dim")
+                continue
+
+            timeout = self.health.timeout_for(url) if self.health else None
+            start = time.perf_counter()
             try:
-                items = self._fetch_single_feed(url, cutoff)
+                items = self._fetch_single_feed(url, cutoff, timeout=timeout)
                 all_items.extend(items)
+                if self.health:
+                    self.health.record_success(
+                        url, time.perf_counter() - start, len(items)
+                    )
                 time.sleep(0.5)  # 서버 부하 방지
             except Exception as e:
                 console.print(f"  [RSS] {url} 피드 오류: {e}", style="yellow")
+                if self.health:
+                    self.health.record_failure(
+                        url, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+                    )
+
+        if self.health:
+            self.health.save()
 
         # 시간 역순 정렬 (None은 맨 뒤)
         all_items.sort(
@@ -103,10 +126,10 @@ class RSSReader:
         return all_items
 
     def _fetch_single_feed(
-        self, url: str, cutoff: datetime
+        self, url: str, cutoff: datetime, timeout: Optional[float] = None
     ) -> list[RSSItem]:
         """단일 RSS 피드를 가져와 파싱."""
-        response = self.client.get(url)
+        response = self.http.get(url, timeout=timeout)
         response.raise_for_status()
 
         feed = feedparser.parse(response.text)
@@ -179,4 +202,5 @@ class RSSReader:
         return urls
 
     def close(self):
-        self.client.close()
+        if self._owns_transport:
+            self.http.close()
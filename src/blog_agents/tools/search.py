@@ -3,11 +3,12 @@ from __future__ import annotations
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from typing import Optional
 
-import httpx
-from rich.console import Console
+from blog_agents.tools.transport import HttpTransport
+from blog_agents.utils.console import AgentConsole
 
-console = Console()
+console = AgentConsole()
 
 
 def _resolve_google_news_url(url: str) -> str:
@@ -96,16 +97,9 @@ class WebSearcher:
     이 구현은 MVP용 간단한 검색입니다.
     """
 
-    def __init__(self):
-        self.client = httpx.Client(
-            timeout=15.0,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36",
-            },
-            follow_redirects=True,
-        )
+    def __init__(self, transport: Optional[HttpTransport] = None):
+        self._owns_transport = transport is None
+        self.http = transport or HttpTransport()
 
     def search_news(self, query: str, max_results: int = 5) -> list[SearchResult]:
         """뉴스 검색 결과를 반환.
@@ -121,7 +115,7 @@ class WebSearcher:
                 f"https://news.google.com/rss/search"
                 f"?q={query}&hl=ko&gl=KR&ceid=KR:ko"
             )
-            response = self.client.get(rss_url)
+            response = self.http.get(rss_url, timeout=15.0)
             response.raise_for_status()
 
             # RSS XML 파싱
@@ -162,4 +156,5 @@ class WebSearcher:
         return re.sub(r"\s+", " ", clean).strip()
 
     def close(self):
-        self.client.close()
+        if self._owns_transport:
+            self.http.close()
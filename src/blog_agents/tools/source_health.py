@@ -0,0 +1,202 @@
+"""수집 소스(RSS 피드·스크래핑 페이지)별 상태 추적과 서킷 브레이커."""
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from blog_agents.utils.console import AgentConsole
+from blog_agents.utils.storage import atomic_write_text
+
+console = AgentConsole()
+
+# 지연 시간 표본은 최근 N회만 보관
+_MAX_SAMPLES = 20
+
+
+@dataclass
+class SourceRecord:
+    url: str
+    attempts: int = 0
+    errors: int = 0
+    consecutive_failures: int = 0
+    items_total: int = 0
+    latencies: list[float] = field(default_factory=list)
+    last_success: Optional[str] = None
+    last_error: str = ""
+    open_until: Optional[str] = None
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        idx = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+        return ordered[idx]
+
+    @property
+    def p50(self) -> float:
+        return self.percentile(50)
+
+    @property
+    def p95(self) -> float:
+        return self.percentile(95)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.attempts if self.attempts else 0.0
+
+    @property
+    def avg_yield(self) -> float:
+        successes = self.attempts - self.errors
+        return self.items_total / successes if successes else 0.0
+
+    def is_open(self, now: datetime) -> bool:
+        """차단 중인지 여부 (차단 기간이 지나면 재시도 허용)."""
+        if not self.open_until:
+            return False
+        return now < datetime.fromisoformat(self.open_until)
+
+
+class SourceHealth:
+    """소스별 지연·오류율·수집량을 영속 저장하고 실패가 반복되는 소스를 차단한다.
+
+    - 연속 ``failure_threshold``회 실패하면 ``cooldown_hours`` 동안 건너뛴다.
+    - 차단 기간이 지나면 짧은 타임아웃으로 한 번 재시도(probe)하고,
+      성공하면 정상 상태로 복귀, 실패하면 다시 차단한다.
+    - 정상 소스도 과거 p95 지연 기반으로 타임아웃 상한을 둔다.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        failure_threshold: int = 3,
+        cooldown_hours: float = 12.0,
+        probe_timeout: float = 8.0,
+        min_timeout: float = 5.0,
+        max_timeout: float = 30.0,
+    ):
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.cooldown = timedelta(hours=cooldown_hours)
+        self.probe_timeout = probe_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._lock = threading.Lock()
+        self.records: dict[str, SourceRecord] = self._load()
+
+    @classmethod
+    def from_config(cls, path: Path, config: dict) -> SourceHealth:
+        """settings.yaml의 source_health 섹션으로 생성."""
+        return cls(
+            path,
+            failure_threshold=int(config.get("failure_threshold", 3)),
+            cooldown_hours=float(config.get("cooldown_hours", 12)),
+            probe_timeout=float(config.get("probe_timeout", 8)),
+            min_timeout=float(config.get("min_timeout", 5)),
+            max_timeout=float(config.get("max_timeout", 30)),
+        )
+
+    def _load(self) -> dict[str, SourceRecord]:
+        if not self.path.exists():
+            return {}
+        try:
+            raw = json.loads(self.path.read_text(encoding="utf-8"))
+            return {url: SourceRecord(**data) for url, data in raw.items()}
+        except (json.JSONDecodeError, TypeError):
+            console.print(
+                f"  [소스 상태] {self.path.name} 손상 → 초기화", style="yellow"
+            )
+            return {}
+
+    def save(self) -> None:
+        with self._lock:
+            data = {url: asdict(rec) for url, rec in self.records.items()}
+        atomic_write_text(
+            self.path, json.dumps(data, ensure_ascii=False, indent=2)
+        )
+
+    def _record(self, url: str) -> SourceRecord:
+        rec = self.records.get(url)
+        if rec is None:
+            rec = SourceRecord(url=url)
+            self.records[url] = rec
+        return rec
+
+    # ------------------------------------------------------------------
+    # 요청 전 판단
+    # ------------------------------------------------------------------
+
+    def should_skip(self, url: str) -> bool:
+        """차단 중인 소스면 True."""
+        with self._lock:
+            rec = self.records.get(url)
+            return bool(rec and rec.is_open(datetime.now()))
+
+    def timeout_for(self, url: str) -> Optional[float]:
+        """이 소스에 적용할 타임아웃. 이력이 없으면 None(기본값 사용)."""
+        with self._lock:
+            rec = self.records.get(url)
+            if rec is None:
+                return None
+            # 차단 후 재시도 중인 소스는 짧은 타임아웃으로 확인만 한다
+            if rec.open_until or rec.consecutive_failures:
+                return self.probe_timeout
+            if len(rec.latencies) < 3:
+                return None
+            return max(self.min_timeout, min(self.max_timeout, rec.p95 * 2))
+
+    # ------------------------------------------------------------------
+    # 결과 기록
+    # ------------------------------------------------------------------
+
+    def record_success(self, url: str, latency: float, items: int) -> None:
+        with self._lock:
+            rec = self._record(url)
+            rec.attempts += 1
+            rec.items_total += items
+            rec.latencies = (rec.latencies + [round(latency, 3)])[-_MAX_SAMPLES:]
+            rec.consecutive_failures = 0
+            rec.open_until = None
+            rec.last_success = datetime.now().isoformat(timespec="seconds")
+
+    def record_failure(self, url: str, latency: float, error: str) -> None:
+        with self._lock:
+            rec = self._record(url)
+            rec.attempts += 1
+            rec.errors += 1
+            rec.consecutive_failures += 1
+            rec.latencies = (rec.latencies + [round(latency, 3)])[-_MAX_SAMPLES:]
+            rec.last_error = error[:200]
+            if rec.consecutive_failures >= self.failure_threshold:
+                rec.open_until = (datetime.now() + self.cooldown).isoformat(
+                    timespec="seconds"
+                )
+                console.print(
+                    f"  [소스 상태] 연속 {rec.consecutive_failures}회 실패 → "
+                    f"{rec.open_until}까지 건너뜀: {url[:80]}",
+                    style="yellow",
+                )
+
+    def summary(self, now: Optional[datetime] = None) -> dict[str, int]:
+        """추적 중·차단 중·재시도 중 소스 수 (다른 스레드가 기록하는 중에도 안전)."""
+        now = now or datetime.now()
+        with self._lock:
+            records = list(self.records.values())
+            return {
+                "tracked": len(records),
+                "open": sum(1 for rec in records if rec.is_open(now)),
+                "retrying": sum(
+                    1 for rec in records
+                    if rec.consecutive_failures and not rec.is_open(now)
+                ),
+            }
+
+    def worst(self, limit: int = 10) -> list[SourceRecord]:
+        """오류율·p95 지연이 나쁜 순으로 정렬한 소스 목록."""
+        with self._lock:
+            records = list(self.records.values())
+        records.sort(key=lambda r: (r.error_rate, r.p95), reverse=True)
+        return records[:limit]
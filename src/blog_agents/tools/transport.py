@@ -0,0 +1,240 @@
+"""RSS·검색·스크래핑 도구가 공유하는 HTTP 전송 계층."""
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import urlsplit
+
+import httpx
+from rich.table import Table
+
+from blog_agents.utils.console import AgentConsole
+
+console = AgentConsole()
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+
+
+# iter_bytes()로 읽은 본문은 이미 압축이 풀려 있으므로 복사본에서 뺄 헤더
+_DECODED_BODY_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+# 요청 시작 시각은 요청 객체(extensions)에 실어 보낸다.
+# 응답 없이 실패한 요청의 기록이 남거나 재사용된 id()에 섞이지 않는다.
+_STARTED_KEY = "blog_agents.started"
+
+
+class ResponseTooLargeError(httpx.HTTPError):
+    """응답 본문이 크기 제한을 넘었을 때 발생."""
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass
+class HostStats:
+    """호스트별 요청 통계."""
+
+    requests: int = 0
+    errors: int = 0
+    header_seconds: float = 0.0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    bytes_read: int = 0
+
+    @property
+    def avg_seconds(self) -> float:
+        return self.total_seconds / self.requests if self.requests else 0.0
+
+    @property
+    def avg_header_seconds(self) -> float:
+        return self.header_seconds / self.requests if self.requests else 0.0
+
+
+class HttpTransport:
+    """공유 커넥션 풀 기반 HTTP 클라이언트.
+
+    - 모든 도구가 하나의 ``httpx.Client``(HTTP/2 가능 시 사용)를 공유한다.
+    - 호스트별 동시 요청 수를 세마포어로 제한한다.
+    - 응답 본문은 스트리밍으로 읽으며 크기 제한을 적용한다.
+    - httpx 이벤트 훅으로 모든 요청의 응답 헤더 도착 시간을 기록한다.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 20.0,
+        max_connections: int = 20,
+        per_host_limit: int = 4,
+        max_response_bytes: int = 2_000_000,
+        http2: bool = True,
+    ):
+        self.per_host_limit = per_host_limit
+        self.max_response_bytes = max_response_bytes
+        self.http2 = http2 and _http2_available()
+        self.stats: dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+
+        self.client = httpx.Client(
+            timeout=timeout,
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            event_hooks={
+                "request": [self._on_request],
+                "response": [self._on_response],
+            },
+        )
+
+    @classmethod
+    def from_config(cls, network: dict) -> HttpTransport:
+        """settings.yaml의 network 섹션으로 생성."""
+        return cls(
+            timeout=float(network.get("timeout", 20.0)),
+            max_connections=int(network.get("max_connections", 20)),
+            per_host_limit=int(network.get("per_host_limit", 4)),
+            max_response_bytes=int(float(network.get("max_response_mb", 2)) * 1_000_000),
+            http2=bool(network.get("http2", True)),
+        )
+
+    # ------------------------------------------------------------------
+    # 요청
+    # ------------------------------------------------------------------
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        truncate: bool = False,
+    ) -> httpx.Response:
+        """GET 요청. 본문은 크기 제한까지만 읽은 완결된 Response로 반환한다.
+
+        truncate=True면 제한 지점까지 읽은 본문을 그대로 반환하고,
+        False면 ResponseTooLargeError를 발생시킨다.
+        """
+        limit = max_bytes or self.max_response_bytes
+        host = urlsplit(url).netloc.lower()
+        kwargs = {"headers": headers}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        start = time.perf_counter()
+        size = 0
+        try:
+            with self._host_slot(host):
+                with self.client.stream("GET", url, **kwargs) as response:
+                    chunks: list[bytes] = []
+                    for chunk in response.iter_bytes():
+                        chunks.append(chunk)
+                        size += len(chunk)
+                        if size > limit:
+                            if not truncate:
+                                raise ResponseTooLargeError(
+                                    f"응답 크기 제한 초과 ({limit:,} bytes): {url}"
+                                )
+                            break
+                    result = httpx.Response(
+                        response.status_code,
+                        headers=[
+                            (name, value)
+                            for name, value in response.headers.multi_items()
+                            if name.lower() not in _DECODED_BODY_HEADERS
+                        ],
+                        content=b"".join(chunks)[:limit],
+                        request=response.request,
+                    )
+        except Exception:
+            self._record(host, time.perf_counter() - start, size, error=True)
+            raise
+
+        self._record(host, time.perf_counter() - start, size)
+        return result
+
+    @contextmanager
+    def _host_slot(self, host: str):
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_slots[host] = slot
+        with slot:
+            yield
+
+    # ------------------------------------------------------------------
+    # 계측 (httpx 이벤트 훅)
+    # ------------------------------------------------------------------
+
+    def _on_request(self, request: httpx.Request) -> None:
+        request.extensions[_STARTED_KEY] = time.perf_counter()
+
+    def _on_response(self, response: httpx.Response) -> None:
+        started = response.request.extensions.get(_STARTED_KEY)
+        if started is None:
+            return
+        with self._lock:
+            stats = self.stats.setdefault(response.request.url.host, HostStats())
+            stats.header_seconds += time.perf_counter() - started
+            if response.status_code >= 400:
+                stats.errors += 1
+
+    def _record(self, host: str, elapsed: float, size: int, error: bool = False) -> None:
+        host = host.split(":")[0]
+        with self._lock:
+            stats = self.stats.setdefault(host, HostStats())
+            stats.requests += 1
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            stats.bytes_read += size
+            if error:
+                stats.errors += 1
+
+    def slowest_hosts(self, limit: int = 5) -> list[tuple[str, HostStats]]:
+        """누적 소요 시간이 큰 호스트 순으로 반환."""
+        with self._lock:
+            items = list(self.stats.items())
+        items.sort(key=lambda kv: kv[1].total_seconds, reverse=True)
+        return items[:limit]
+
+    def print_report(self, limit: int = 5) -> None:
+        """호스트별 네트워크 소요 시간 요약을 출력."""
+        hosts = self.slowest_hosts(limit)
+        if not hosts:
+            return
+        table = Table(title="네트워크 요청 (느린 호스트 순)", show_header=True)
+        table.add_column("호스트", style="cyan")
+        table.add_column("요청", justify="right")
+        table.add_column("오류", justify="right")
+        table.add_column("누적(초)", justify="right")
+        table.add_column("평균(초)", justify="right")
+        table.add_column("최대(초)", justify="right")
+        for host, s in hosts:
+            table.add_row(
+                host,
+                str(s.requests),
+                str(s.errors),
+                f"{s.total_seconds:.1f}",
+                f"{s.avg_seconds:.2f}",
+                f"{s.max_seconds:.2f}",
+            )
+        console.print(table)
+
+    def close(self):
+        self.client.close()
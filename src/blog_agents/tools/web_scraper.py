@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-import re
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
-import httpx
 from bs4 import BeautifulSoup
-from rich.console import Console
 
-console = Console()
+from blog_agents.tools.content_extractor import extract_main_text
+from blog_agents.tools.source_health import SourceHealth
+from blog_agents.tools.transport import HttpTransport
+from blog_agents.utils.cache import ArticleCache
+from blog_agents.utils.console import AgentConsole
+
+console = AgentConsole()
 
 
 @dataclass
@@ -55,17 +60,18 @@ class ExhibitionScraper:
         },
     }
 
-    def __init__(self):
-        self.client = httpx.Client(
-            timeout=30.0,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36",
-                "Accept-Language": "ko-KR,ko;q=0.9",
-            },
-            follow_redirects=True,
-        )
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_article_bytes: int = 1_000_000,
+        transport: Optional[HttpTransport] = None,
+        health: Optional[SourceHealth] = None,
+    ):
+        self.health = health
+        self.cache = ArticleCache(cache_dir) if cache_dir else None
+        self.max_article_bytes = max_article_bytes
+        self._owns_transport = transport is None
+        self.http = transport or HttpTransport()
 
     def scrape_exhibitions(
         self, institution: str, max_items: int = 15
@@ -80,8 +86,17 @@ class ExhibitionScraper:
         config = self.CONFIGS[institution]
         items: list[ScrapedItem] = []
 
+        url = config["url"]
+        if self.health and self.health.should_skip(url):
+            console.print(
+                f"  [스크래퍼] {institution}: 차단 중 → 건너뜀", style="dim"
+            )
+            return []
+
+        start = time.perf_counter()
         try:
-            response = self.client.get(config["url"])
+            timeout = self.health.timeout_for(url) if self.health else None
+            response = self.http.get(url, timeout=timeout)
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "lxml")
 
@@ -115,51 +130,99 @@ class ExhibitionScraper:
             console.print(
                 f"  [스크래퍼] {institution}: {len(items)}개 전시", style="dim"
             )
+            if self.health:
+                self.health.record_success(
+                    url, time.perf_counter() - start, len(items)
+                )
 
         except Exception as e:
             console.print(
                 f"  [스크래퍼] {institution} 스크래핑 오류: {e}", style="yellow"
             )
+            if self.health:
+                self.health.record_failure(
+                    url, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+                )
 
         time.sleep(1)  # 서버 부하 방지
         return items
 
     def fetch_article_text(self, url: str) -> str:
         """개별 전시 상세 페이지의 본문 텍스트를 가져온다."""
-        try:
-            response = self.client.get(url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "lxml")
-
-            # 전시 상세 페이지 본문 영역 셀렉터
-            content_selectors = [
-                "div.exhibit_detail",
-                "div.exhibition_view",
-                "div.view_con",
-                "div.board_view_con",
-                "div#content",
-                "article",
-                "div.content",
-            ]
-
-            for selector in content_selectors:
-                content = soup.select_one(selector)
-                if content:
-                    text = content.get_text(separator="\n", strip=True)
-                    text = re.sub(r"\n{3,}", "\n\n", text)
-                    return text[:3000]
-
-            body = soup.find("body")
-            if body:
-                return body.get_text(separator="\n", strip=True)[:2000]
+        return self.fetch_articles([url]).get(url, "")
+
+    def fetch_articles(
+        self,
+        urls: list[str],
+        max_workers: int = 6,
+        max_chars: int = 3000,
+    ) -> dict[str, str]:
+        """여러 기사 본문을 병렬로 가져온다. 실패한 URL은 빈 문자열.
+
+        캐시가 설정된 경우 ETag/Last-Modified로 재검증하여 변경되지 않은
+        페이지는 다시 내려받거나 파싱하지 않는다.
+        """
+        unique = list(dict.fromkeys(u for u in urls if u))
+        results: dict[str, str] = {u: "" for u in unique}
+        if not unique:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique))) as executor:
+            future_to_url = {
+                executor.submit(self._fetch_article, url, max_chars): url
+                for url in unique
+            }
+            for future in as_completed(future_to_url):
+                url = future_to_url[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    console.print(
+                        f"  [스크래퍼] 본문 가져오기 실패 ({url}): {e}",
+                        style="yellow",
+                    )
 
-        except Exception as e:
-            console.print(
-                f"  [스크래퍼] 본문 가져오기 실패 ({url}): {e}",
-                style="yellow",
+        fetched = sum(1 for text in results.values() if text)
+        console.print(
+            f"  [스크래퍼] 기사 본문 {fetched}/{len(unique)}개 확보", style="dim"
+        )
+        return results
+
+    def _fetch_article(self, url: str, max_chars: int) -> str:
+        """단일 기사를 캐시 확인 → 조건부 스트리밍 다운로드 → 본문 추출."""
+        entry = self.cache.get(url) if self.cache else None
+        if entry and not (entry.get("etag") or entry.get("last_modified")):
+            if self.cache.is_fresh(entry):
+                return entry.get("text", "")[:max_chars]
+            entry = None
+
+        # 본문 크기 제한: 상한을 넘으면 그 지점까지만 읽는다
+        response = self.http.get(
+            url,
+            headers=ArticleCache.conditional_headers(entry),
+            max_bytes=self.max_article_bytes,
+            truncate=True,
+        )
+        if response.status_code == 304 and entry:
+            self.cache.touch(url, entry)
+            return entry.get("text", "")[:max_chars]
+        response.raise_for_status()
+
+        # 캐시에는 전체 본문을 두고 호출마다 필요한 길이만 잘라 반환한다
+        text = extract_main_text(
+            response.content,
+            max_chars=None,
+            encoding=response.charset_encoding,
+        )
+        if self.cache and text:
+            self.cache.put(
+                url,
+                text,
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
             )
-
-        return ""
+        return text[:max_chars]
 
     def close(self):
-        self.client.close()
+        if self._owns_transport:
+            self.http.close()
@@ -0,0 +1,107 @@
+"""리서치 브리핑 공용 렌더러 — 작가·편집장 프롬프트가 같은 브리핑 본문을 공유."""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from blog_agents.models.research import ResearchBrief
+from blog_agents.utils.brief_sanitizer import extract_proper_nouns
+
+WRITER = "writer"
+EDITOR = "editor"
+
+# (필드, 작가용 헤더, 편집장용 헤더) — 순서가 곧 렌더링 순서
+_LIST_SECTIONS = (
+    ("key_facts", "핵심 팩트", "핵심 팩트 (초안과 교차 검증할 것)"),
+    ("exhibition_info", "전시 기본 정보", "전시 기본 정보 (일정·장소·요금 정확성 확인)"),
+    ("artist_info", "작가 정보", "작가 정보 (약력·작품세계 정확성 확인)"),
+    ("artwork_highlights", "주요 작품", "주요 작품 (작품명·매체·해석 정확성 확인)"),
+    ("expert_opinions", "전문가 의견", "전문가 의견"),
+    ("data_points", "데이터/통계", "데이터/통계 (수치 정확성 확인)"),
+)
+_HEADERS = {
+    "title": ("리서치 브리핑", "원본 리서치 브리핑 (팩트체크 기준)"),
+    "sources": ("참고 출처", "참고 출처 (실재성·본문 매칭 확인)"),
+    "nouns": ("고유명사 목록 (반드시 이 표기 그대로 사용)", "고유명사 목록 (초안 표기와 대조)"),
+}
+_NOUN_SOURCE_FIELDS = (
+    "key_facts", "exhibition_info", "artist_info", "artwork_highlights",
+)
+
+_MAX_CACHED = 32
+_cache: OrderedDict[str, BriefRenderer] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+class BriefRenderer:
+    """브리핑 하나를 마크다운으로 렌더링하고 결과를 보관한다.
+
+    작가용·편집장용 뷰는 헤더 문구만 다르고 항목 순서와 본문은 같다.
+    같은 브리핑으로 라운드를 반복해도 프롬프트 앞부분이 바이트 단위로
+    같아 제공자 측 프롬프트 캐시가 적중한다.
+    """
+
+    def __init__(self, brief: ResearchBrief):
+        self.brief = brief
+        self._views: dict[str, str] = {}
+        self._nouns: list[str] | None = None
+
+    @classmethod
+    def for_brief(cls, brief: ResearchBrief) -> BriefRenderer:
+        """brief.id 단위로 캐시된 렌더러를 반환한다."""
+        with _cache_lock:
+            renderer = _cache.get(brief.id)
+            if renderer is None or renderer.brief is not brief:
+                renderer = cls(brief)
+                _cache[brief.id] = renderer
+                if len(_cache) > _MAX_CACHED:
+                    _cache.popitem(last=False)
+            else:
+                _cache.move_to_end(brief.id)
+            return renderer
+
+    @property
+    def proper_nouns(self) -> list[str]:
+        """브리핑 배경·팩트·전시·작가·작품 정보의 고유명사 앵커 (정렬)."""
+        if self._nouns is None:
+            text = "\n".join(
+                [self.brief.background_context]
+                + [item for name in _NOUN_SOURCE_FIELDS for item in getattr(self.brief, name)]
+            )
+            self._nouns = sorted(extract_proper_nouns(text))
+        return self._nouns
+
+    def render(self, role: str = WRITER) -> str:
+        view = self._views.get(role)
+        if view is None:
+            view = self._render(0 if role == WRITER else 1)
+            self._views[role] = view
+        return view
+
+    def _render(self, h: int) -> str:
+        brief = self.brief
+        topic = brief.topic
+        parts = [
+            f"# {_HEADERS['title'][h]}: {topic.title}",
+            f"\n## 카테고리: {brief.category.display_name}",
+            f"\n## 작성 관점\n{topic.angle}",
+            f"\n## 시의성\n{topic.timeliness}",
+            f"\n## 타겟 키워드\n{', '.join(topic.target_keywords)}",
+            f"\n## 배경\n{brief.background_context}",
+        ]
+        for name, *headers in _LIST_SECTIONS:
+            items = getattr(brief, name)
+            if items:
+                parts.append(f"\n## {headers[h]}")
+                parts.extend(f"- {item}" for item in items)
+
+        if brief.sources:
+            parts.append(f"\n## {_HEADERS['sources'][h]}")
+            for src in brief.sources[:10]:
+                parts.append(f"- {src.title} ({src.publisher}): {src.url}")
+
+        if self.proper_nouns:
+            parts.append(f"\n## {_HEADERS['nouns'][h]}")
+            parts.extend(f"- {noun}" for noun in self.proper_nouns)
+
+        return "\n".join(parts)
@@ -0,0 +1,182 @@
+"""리서치 브리핑 사후 정제 — 모든 필드를 한 번 순회하며 규칙을 일괄 적용."""
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Iterable, Optional
+
+from blog_agents.utils.urls import UrlPrefixTrie
+
+# ----------------------------------------------------------------------
+# 정규식 레지스트리 (모듈 로드 시 1회 컴파일)
+# ----------------------------------------------------------------------
+
+PATTERNS: dict[str, re.Pattern] = {
+    # 한 번의 sub 패스로 처리하는 규칙: URL / 괄호 속 출처 날짜 / 맨 날짜
+    # (출처 접두사 속 URL은 cite 처리 중에 같은 규칙으로 다시 검증한다)
+    "inline": re.compile(
+        r"(?P<url>https?://[^\s),\]]+)"
+        r"|(?P<cite>\((?P<prefix>[^()]*?,\s*)?"
+        r"(?P<year>20\d{2})\.(?P<month>\d{1,2})\.(?P<day>\d{1,2})\))"
+        r"|(?P<date>\d{4}\.\d{1,2}\.\d{1,2})"
+    ),
+    # 따옴표/괄호로 감싼 고유명사: '...', ‘...’, “...”, 《...》, 「...」
+    "proper_noun": re.compile(
+        r"['‘’](?P<q1>[^'‘’]+?)['‘’]"
+        r"|“(?P<q2>[^”]+?)”"
+        r"|《(?P<q3>[^》]+?)》"
+        r"|「(?P<q4>[^」]+?)」"
+    ),
+}
+
+# URL을 지운 뒤 남는 빈 쉼표 정리
+_EMPTY_COMMAS = re.compile(r"(?:,\s*){2,}")
+
+# 문자열 필드 / 리스트 필드 (ResearchBriefOutput·ResearchBrief 공통)
+TEXT_FIELDS = ("background_context",)
+LIST_FIELDS = (
+    "key_facts", "exhibition_info", "artist_info", "artwork_highlights",
+    "expert_opinions", "data_points", "related_topics",
+)
+# 고유명사 앵커를 뽑는 필드
+NOUN_FIELDS = (
+    "background_context", "key_facts", "exhibition_info", "artist_info",
+    "artwork_highlights",
+)
+# 날짜 반복을 세는 필드
+DATE_COUNT_FIELDS = ("key_facts",)
+
+
+def extract_proper_nouns(text: str) -> set[str]:
+    """텍스트에서 따옴표/괄호로 감싼 고유명사를 추출한다 (2글자 미만 제외)."""
+    terms = set()
+    for m in PATTERNS["proper_noun"].finditer(text):
+        term = (m.group(m.lastgroup) or "").strip()
+        if len(term) >= 2:
+            terms.add(term)
+    return terms
+
+
+@dataclass
+class SanitizeReport:
+    """정제 결과 감사 기록."""
+
+    today: str
+    removed_urls: list[dict] = field(default_factory=list)
+    removed_dates: list[dict] = field(default_factory=list)
+    removed_items: list[dict] = field(default_factory=list)
+    date_counts: Counter = field(default_factory=Counter)
+    proper_nouns: set[str] = field(default_factory=set)
+    repeat_threshold: int = 4
+
+    @property
+    def repeated_dates(self) -> dict[str, int]:
+        return {
+            d: c for d, c in self.date_counts.items()
+            if c >= self.repeat_threshold
+        }
+
+    def is_today(self, date_str: str) -> bool:
+        try:
+            y, m, d = (int(x) for x in date_str.split("."))
+            return date(y, m, d).isoformat() == self.today
+        except ValueError:
+            return False
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.removed_urls or self.removed_dates or self.removed_items)
+
+    def to_dict(self) -> dict:
+        return {
+            "today": self.today,
+            "removed_urls": self.removed_urls,
+            "removed_dates": self.removed_dates,
+            "removed_items": self.removed_items,
+            "repeated_dates": self.repeated_dates,
+            "proper_noun_count": len(self.proper_nouns),
+        }
+
+
+class BriefSanitizer:
+    """브리핑 필드를 한 번씩만 순회하며 다음 규칙을 적용한다.
+
+    - 수집 URL과 접두사 관계가 없는 가짜 URL 제거 (valid_urls가 주어진 경우)
+    - 오늘 이후의 출처 날짜 제거: "(한국경제, 2026.2.23)" → "(한국경제)"
+    - 날짜 반복 횟수 집계 (날조 패턴 탐지용)
+    - 고유명사 앵커 추출
+
+    "오늘"은 생성 시점에 고정되므로 한 브리핑 안에서 판정이 흔들리지 않는다.
+    """
+
+    def __init__(
+        self,
+        valid_urls: Optional[Iterable[str]] = None,
+        today: Optional[date] = None,
+        repeat_threshold: int = 4,
+    ):
+        self.valid = UrlPrefixTrie(valid_urls) if valid_urls is not None else None
+        self.today = today or date.today()
+        self.repeat_threshold = repeat_threshold
+
+    def run(self, brief) -> SanitizeReport:
+        """브리핑(ResearchBriefOutput 또는 ResearchBrief)을 제자리에서 정제한다."""
+        report = SanitizeReport(
+            today=self.today.isoformat(), repeat_threshold=self.repeat_threshold
+        )
+        for name in TEXT_FIELDS:
+            setattr(brief, name, self._clean(getattr(brief, name), name, report))
+        for name in LIST_FIELDS:
+            items = getattr(brief, name)
+            setattr(brief, name, [self._clean(item, name, report) for item in items])
+        return report
+
+    def _clean(self, text: str, field_name: str, report: SanitizeReport) -> str:
+        if not text:
+            return text
+
+        def replace(match: re.Match) -> str:
+            kind = match.lastgroup
+            full = match.group(0)
+            if kind == "url":
+                if self.valid is None:
+                    return full
+                url = full.rstrip(")")
+                if self.valid.matches(url):
+                    return full
+                report.removed_urls.append({"field": field_name, "url": url})
+                return ""
+            if kind == "date":
+                if field_name in DATE_COUNT_FIELDS:
+                    report.date_counts[full] += 1
+                return full
+
+            # 괄호 속 출처 날짜 — 접두사에 든 URL도 검증한다
+            raw_prefix = match.group("prefix") or ""
+            prefix = raw_prefix
+            if "://" in prefix:
+                prefix = PATTERNS["inline"].sub(replace, prefix)
+                prefix = _EMPTY_COMMAS.sub(", ", prefix).lstrip(", ")
+            date_text = full[1 + len(raw_prefix):-1]
+            date_str = f"{match.group('year')}.{match.group('month')}.{match.group('day')}"
+            if field_name in DATE_COUNT_FIELDS:
+                report.date_counts[date_str] += 1
+            try:
+                cited = date(
+                    int(match.group("year")),
+                    int(match.group("month")),
+                    int(match.group("day")),
+                )
+            except ValueError:
+                return f"({prefix}{date_text})"
+            if cited <= self.today:
+                return f"({prefix}{date_text})"
+            report.removed_dates.append({"field": field_name, "date": date_str})
+            return f"({prefix.rstrip(', ')})" if prefix.strip(", ") else ""
+
+        cleaned = PATTERNS["inline"].sub(replace, text)
+        if field_name in NOUN_FIELDS:
+            report.proper_nouns.update(extract_proper_nouns(cleaned))
+        return cleaned
@@ -0,0 +1,193 @@
+"""파이프라인 단계 사이에 재사용하는 로컬 JSON 캐시."""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import unicodedata
+from datetime import date, datetime, timedelta, tzinfo
+from pathlib import Path
+from typing import Optional
+
+from pydantic import ValidationError
+
+from blog_agents.models.research import ContentCategory, ResearchBrief, TopicSuggestion
+from blog_agents.utils.storage import atomic_write_text
+
+
+def _key_hash(key: str) -> str:
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+
+def normalize_topic_key(title: str) -> str:
+    """토픽 제목을 캐시 키로 정규화 (따옴표·기호·공백·대소문자 차이 무시)."""
+    text = unicodedata.normalize("NFKC", title).lower()
+    return re.sub(r"[^0-9a-z가-힣]+", "", text)
+
+
+class ArticleCache:
+    """기사 본문 캐시. URL 단위로 저장하고 ETag/Last-Modified로 재검증한다.
+
+    검증자(ETag, Last-Modified)가 있는 항목은 조건부 요청(304)으로 재사용하고,
+    검증자가 없는 항목은 ``max_age_hours`` 동안만 그대로 재사용한다.
+    본문은 자르지 않고 저장하며 길이 제한은 읽는 쪽에서 적용한다.
+    """
+
+    def __init__(self, cache_dir: Path, max_age_hours: float = 24.0):
+        self.cache_dir = cache_dir
+        self.max_age = timedelta(hours=max_age_hours)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{_key_hash(url)}.json"
+
+    def get(self, url: str) -> Optional[dict]:
+        """캐시 항목을 반환한다 (없거나 손상됐거나 잘린 본문의 옛 형식이면 None)."""
+        path = self._path(url)
+        if not path.exists():
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return None
+        if entry.get("url") != url or not entry.get("full_text"):
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        """검증자 없이 재사용 가능한 기간 내인지 확인."""
+        try:
+            fetched_at = datetime.fromisoformat(entry["fetched_at"])
+        except (KeyError, ValueError):
+            return False
+        return datetime.now() - fetched_at < self.max_age
+
+    @staticmethod
+    def conditional_headers(entry: Optional[dict]) -> dict[str, str]:
+        """캐시 항목의 검증자로 조건부 요청 헤더를 만든다."""
+        headers: dict[str, str] = {}
+        if not entry:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(
+        self,
+        url: str,
+        text: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        entry = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": datetime.now().isoformat(),
+            "full_text": True,
+            "text": text,
+        }
+        atomic_write_text(
+            self._path(url), json.dumps(entry, ensure_ascii=False)
+        )
+
+    def touch(self, url: str, entry: dict) -> None:
+        """304 응답 후 조회 시각만 갱신한다."""
+        self.put(url, entry.get("text", ""), entry.get("etag"), entry.get("last_modified"))
+
+
+class BriefCache:
+    """리서치 브리핑 캐시. (카테고리, 정규화된 토픽 제목)으로 저장한다.
+
+    같은 토픽을 몇 시간 안에 다시 브리핑할 때(작성·발행 단계 실패 후 재시도 등)
+    검색·URL 디코딩·LLM 호출을 반복하지 않도록 한다.
+    """
+
+    def __init__(self, cache_dir: Path, max_age_hours: float = 12.0):
+        self.cache_dir = cache_dir
+        self.max_age = timedelta(hours=max_age_hours)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, title: str, category: ContentCategory) -> Path:
+        key = _key_hash(normalize_topic_key(title))[:16]
+        return self.cache_dir / f"{category.value}_{key}.json"
+
+    def get(self, title: str, category: ContentCategory) -> Optional[ResearchBrief]:
+        """유효 기간 내의 브리핑을 반환한다 (없거나 오래됐으면 None)."""
+        path = self._path(title, category)
+        if not path.exists():
+            return None
+        try:
+            brief = ResearchBrief.model_validate_json(path.read_text(encoding="utf-8"))
+        except (ValidationError, OSError):
+            return None
+        if datetime.now() - brief.created_at > self.max_age:
+            return None
+        return brief
+
+    def put(self, brief: ResearchBrief) -> Path:
+        path = self._path(brief.topic.title, brief.category)
+        atomic_write_text(path, brief.model_dump_json(indent=2))
+        return path
+
+
+def raw_data_hash(raw_data: str) -> str:
+    """토픽 제안 입력(수집 데이터 텍스트)의 지문."""
+    return _key_hash(raw_data)
+
+
+class TopicCache:
+    """카테고리별 일일 토픽 제안 캐시.
+
+    ``research``로 미리 본 토픽을 같은 날 ``generate``에서 그대로 쓰도록
+    (카테고리, 날짜) 단위로 토픽과 수집 데이터 해시를 저장한다.
+    날짜는 tz 기준이라 서버 시간대와 무관하게 같은 "오늘"을 공유한다.
+    """
+
+    def __init__(self, cache_dir: Path, tz: Optional[tzinfo] = None):
+        self.cache_dir = cache_dir
+        self.tz = tz
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def today(self) -> date:
+        return datetime.now(self.tz).date() if self.tz else date.today()
+
+    def _path(self, category: ContentCategory, day: date) -> Path:
+        return self.cache_dir / f"{category.value}_{day.isoformat()}.json"
+
+    def get(
+        self, category: ContentCategory, day: Optional[date] = None
+    ) -> Optional[tuple[list[TopicSuggestion], str]]:
+        """오늘(또는 지정일) 저장된 (토픽 목록, 수집 데이터 해시)를 반환한다."""
+        path = self._path(category, day or self.today())
+        if not path.exists():
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            topics = [TopicSuggestion.model_validate(t) for t in entry["topics"]]
+        except (json.JSONDecodeError, KeyError, ValidationError, OSError):
+            return None
+        if not topics:
+            return None
+        return topics, entry.get("raw_hash", "")
+
+    def put(
+        self,
+        category: ContentCategory,
+        topics: list[TopicSuggestion],
+        raw_hash: str,
+        day: Optional[date] = None,
+    ) -> Path:
+        day = day or self.today()
+        entry = {
+            "category": category.value,
+            "date": day.isoformat(),
+            "raw_hash": raw_hash,
+            "created_at": datetime.now().isoformat(),
+            "topics": [t.model_dump(mode="json") for t in topics],
+        }
+        path = self._path(category, day)
+        atomic_write_text(path, json.dumps(entry, ensure_ascii=False, indent=2))
+        return path
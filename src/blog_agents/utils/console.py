@@ -0,0 +1,42 @@
+"""스레드 단위로 끌 수 있는 에이전트·도구 콘솔."""
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+
+from rich.console import Console
+
+_state = threading.local()
+
+
+@contextmanager
+def quiet_output():
+    """이 스레드에서 AgentConsole 출력을 끈다 (다른 스레드의 출력은 그대로)."""
+    previous = getattr(_state, "quiet", False)
+    _state.quiet = True
+    try:
+        yield
+    finally:
+        _state.quiet = previous
+
+
+def is_quiet() -> bool:
+    return getattr(_state, "quiet", False)
+
+
+class AgentConsole(Console):
+    """quiet_output() 안의 스레드에서는 아무것도 출력하지 않는 Console.
+
+    백그라운드 브리핑 생성처럼 대화형 프롬프트와 동시에 도는 작업의 로그만
+    숨길 때 쓴다. 전역 Console 상태를 바꾸지 않으므로 다른 스레드에 영향이 없다.
+    """
+
+    def print(self, *args, **kwargs) -> None:
+        if is_quiet():
+            return
+        super().print(*args, **kwargs)
+
+    def log(self, *args, **kwargs) -> None:
+        if is_quiet():
+            return
+        super().log(*args, **kwargs)
@@ -0,0 +1,242 @@
+"""편집장 검토 전 로컬 초안 린터 — 명백한 규격 위반은 LLM 호출 없이 반려."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from blog_agents.models.content import Draft
+from blog_agents.models.research import ResearchBrief
+from blog_agents.models.review import EditReview, LineEdit, ScoreDimension
+from blog_agents.utils.brief_sanitizer import NOUN_FIELDS, extract_proper_nouns
+from blog_agents.utils.markdown_doc import MarkdownDoc, parse_markdown
+
+HARD = "hard"
+SOFT = "soft"
+
+
+# 규칙 → 평가 차원
+_DIMENSIONS = {
+    "length": "구성/논리",
+    "headings": "구성/논리",
+    "keywords": "SEO",
+    "title": "SEO",
+    "proper_nouns": "사실정확성",
+    "banned_phrases": "가독성·문체",
+}
+
+DEFAULT_BANNED_PHRASES = [
+    "AI로서", "AI 언어 모델", "인공지능 모델로서", "As an AI",
+    "실제 정보와 다를 수 있", "정확한 정보는 공식 홈페이지에서 확인하시기 바랍니다",
+    "이 글은 AI", "```",
+]
+
+
+@dataclass
+class LintFinding:
+    rule: str
+    severity: str
+    message: str
+    location: str = "전체"
+    original: str = ""
+    suggestion: str = ""
+
+
+@dataclass
+class LintReport:
+    findings: list[LintFinding] = field(default_factory=list)
+
+    @property
+    def hard(self) -> list[LintFinding]:
+        return [f for f in self.findings if f.severity == HARD]
+
+    @property
+    def soft(self) -> list[LintFinding]:
+        return [f for f in self.findings if f.severity == SOFT]
+
+    def to_prompt(self, dimensions: tuple[str, ...] | None = None) -> str:
+        """편집장 프롬프트용 참고 목록 (dimensions를 주면 해당 차원 항목만)."""
+        return "\n".join(
+            f"- [{f.rule}] {f.message}" for f in self.findings
+            if dimensions is None or _DIMENSIONS.get(f.rule, "구성/논리") in dimensions
+        )
+
+    def to_review(self, draft: Draft, max_score: float) -> EditReview:
+        """치명적 위반이 있는 초안에 대한 반려 리뷰 (편집장 모델 미호출)."""
+        by_dimension: dict[str, list[LintFinding]] = {}
+        for f in self.findings:
+            by_dimension.setdefault(_DIMENSIONS.get(f.rule, "구성/논리"), []).append(f)
+
+        dimensions = []
+        for name, items in by_dimension.items():
+            hard = sum(1 for f in items if f.severity == HARD)
+            score = max(1.0, 10.0 - 3 * hard - (len(items) - hard))
+            dimensions.append(ScoreDimension(
+                dimension=name,
+                score=score,
+                feedback=" / ".join(f.message for f in items),
+            ))
+        overall = min(
+            max_score,
+            max(1.0, 10.0 - 1.5 * len(self.hard) - 0.5 * len(self.soft)),
+        )
+        return EditReview(
+            draft_id=draft.id,
+            draft_version=draft.version,
+            overall_score=round(overall, 1),
+            dimensions=dimensions,
+            approved=False,
+            review_mode="lint",
+            revision_instructions=(
+                "자동 점검에서 다음 규격 위반이 발견되었습니다. 모두 고친 뒤 다시 제출하십시오.\n"
+                + "\n".join(f"- {f.message}" for f in self.hard)
+            ),
+            line_edits=[
+                LineEdit(
+                    location=f.location,
+                    original=f.original,
+                    suggestion=f.suggestion,
+                    reason=f.message,
+                )
+                for f in self.findings
+            ],
+        )
+
+
+def length_bounds(quality: dict) -> tuple[int, int]:
+    """본문 분량 범위 (quality.min/max_word_count). 작가 프롬프트 안내와 린터가 함께 쓴다."""
+    return (
+        int(quality.get("min_word_count", 1800)),
+        int(quality.get("max_word_count", 2500)),
+    )
+
+
+class DraftLinter:
+    """settings.yaml ``quality.lint`` 규칙으로 초안을 점검한다.
+
+    - 분량: 본문 글자 수(참고자료·마크다운 기호 제외)가 min/max_word_count를
+      벗어나면 위반. 부족은 ``length_tolerance``, 초과는 ``over_length_tolerance``를
+      넘을 때만 치명적
+    - 소제목: H1 제목 유무, H2 개수
+    - 키워드: 타겟 키워드 포함 비율
+    - 고유명사: 브리핑에 없는 인용 고유명사 수
+    - 금지 문구: 면책·메타 발언 등 남아 있으면 치명적
+    """
+
+    def __init__(self, quality: dict):
+        rules = quality.get("lint", {}) or {}
+        self.enabled = rules.get("enabled", True)
+        self.min_chars, self.max_chars = length_bounds(quality)
+        self.length_tolerance = rules.get("length_tolerance", 0.1)
+        self.over_length_tolerance = rules.get("over_length_tolerance", 0.4)
+        self.min_h2 = rules.get("min_h2", 2)
+        self.title_max_chars = rules.get("title_max_chars", 25)
+        self.keyword_min_coverage = rules.get("keyword_min_coverage", 0.5)
+        self.max_unlisted_nouns = rules.get("max_unlisted_nouns", 3)
+        self.banned_phrases = rules.get("banned_phrases", DEFAULT_BANNED_PHRASES)
+
+    def lint(self, draft: Draft, brief: ResearchBrief) -> LintReport:
+        report = LintReport()
+        if not self.enabled:
+            return report
+        doc = parse_markdown(draft.full_markdown)
+        body = doc.body
+        self._check_length(doc, report)
+        self._check_headings(doc, draft, report)
+        self._check_keywords(body, brief, report)
+        self._check_proper_nouns(body, brief, report)
+        self._check_banned(body, report)
+        return report
+
+    def _check_length(self, doc: MarkdownDoc, report: LintReport) -> None:
+        length = doc.prose_char_count
+        if self.min_chars <= length <= self.max_chars:
+            return
+        if length < self.min_chars:
+            severity = HARD if length < self.min_chars * (1 - self.length_tolerance) else SOFT
+            message = f"분량 부족: 본문 {length:,}자 (최소 {self.min_chars:,}자)"
+            suggestion = "관람 팁·작품 설명 등 브리핑 근거가 있는 내용으로 보강"
+        else:
+            severity = (
+                HARD if length > self.max_chars * (1 + self.over_length_tolerance) else SOFT
+            )
+            message = f"분량 초과: 본문 {length:,}자 (최대 {self.max_chars:,}자)"
+            suggestion = "중복 설명과 수식어를 줄여 압축"
+        report.findings.append(
+            LintFinding("length", severity, message, suggestion=suggestion)
+        )
+
+    def _check_headings(
+        self, doc: MarkdownDoc, draft: Draft, report: LintReport
+    ) -> None:
+        if doc.title is None:
+            report.findings.append(LintFinding(
+                "headings", HARD, "H1(#) 제목이 없습니다",
+                location="글 첫 줄", suggestion=f"# {draft.title}",
+            ))
+        h2_count = len(doc.headings(2))
+        if h2_count < self.min_h2:
+            report.findings.append(LintFinding(
+                "headings", HARD,
+                f"H2(##) 소제목 {h2_count}개 (최소 {self.min_h2}개)",
+                suggestion="소개·볼거리·관람 가이드 단위로 ## 소제목을 나눌 것",
+            ))
+        if len(draft.title) > self.title_max_chars:
+            report.findings.append(LintFinding(
+                "title", SOFT,
+                f"제목 {len(draft.title)}자 (권장 {self.title_max_chars}자 이내)",
+                location="제목", original=draft.title,
+            ))
+
+    def _check_keywords(
+        self, body: str, brief: ResearchBrief, report: LintReport
+    ) -> None:
+        keywords = [k for k in brief.topic.target_keywords if k.strip()]
+        if not keywords:
+            return
+        squashed = re.sub(r"\s+", "", body).lower()
+        missing = [k for k in keywords if re.sub(r"\s+", "", k).lower() not in squashed]
+        if not missing:
+            return
+        coverage = 1 - len(missing) / len(keywords)
+        severity = HARD if coverage < self.keyword_min_coverage else SOFT
+        report.findings.append(LintFinding(
+            "keywords", severity,
+            f"타겟 키워드 누락 {len(missing)}/{len(keywords)}개: {', '.join(missing)}",
+            location="제목·H2·본문",
+            suggestion="누락 키워드를 제목이나 소제목, 본문에 자연스럽게 포함",
+        ))
+
+    def _check_proper_nouns(
+        self, body: str, brief: ResearchBrief, report: LintReport
+    ) -> None:
+        brief_text = "\n".join(
+            [brief.topic.title, brief.raw_source_snippets]
+            + [
+                value if isinstance(value, str) else "\n".join(value)
+                for value in (getattr(brief, name) for name in NOUN_FIELDS)
+            ]
+        ).lower()
+        unlisted = sorted(
+            noun for noun in extract_proper_nouns(body)
+            if noun.lower() not in brief_text
+        )
+        if not unlisted:
+            return
+        severity = HARD if len(unlisted) > self.max_unlisted_nouns else SOFT
+        report.findings.append(LintFinding(
+            "proper_nouns", severity,
+            f"브리핑에 없는 고유명사 {len(unlisted)}개: {', '.join(unlisted[:10])}",
+            location="고유명사 인용",
+            suggestion="브리핑 고유명사 목록의 표기로 바꾸거나 삭제",
+        ))
+
+    def _check_banned(self, body: str, report: LintReport) -> None:
+        for line in body.split("\n"):
+            for phrase in self.banned_phrases:
+                if phrase and phrase in line:
+                    report.findings.append(LintFinding(
+                        "banned_phrases", HARD,
+                        f"금지 문구 포함: \"{phrase}\"",
+                        location="본문", original=line.strip(), suggestion="",
+                    ))
+                    break
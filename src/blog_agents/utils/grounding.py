@@ -0,0 +1,169 @@
+"""초안 문장별 근거 점수 — 브리핑·원본 스니펫 대비 로컬 팩트 그라운딩."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from blog_agents.utils.brief_sanitizer import extract_proper_nouns
+
+# 날짜: 2026.3.1 / 2026-03-01 / 2026년 3월 1일 / 2026. 3. 1.
+_DATE_RE = re.compile(
+    r"(20\d{2})\s*(?:[.\-/]|년)\s*(\d{1,2})\s*(?:[.\-/]|월)\s*(\d{1,2})\s*일?"
+)
+# 수치: 쉼표 포함 숫자 (단위는 주장 식별에 쓰지 않음)
+_NUMBER_RE = re.compile(r"\d[\d,]*(?:\.\d+)?")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+_MD_NOISE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)|\]\([^)]*\)|[*_`>#\[]|^\s*[-+]\s+|^\s*\d+\.\s+")
+_SPACE_RE = re.compile(r"\s+")
+
+# n-gram 색인 단위
+_N = 3
+
+
+def _normalize(text: str) -> str:
+    """비교용 정규화: 날짜를 Y.M.D로 통일하고 숫자 쉼표·공백을 제거한다."""
+    text = _DATE_RE.sub(lambda m: f"{int(m.group(1))}.{int(m.group(2))}.{int(m.group(3))}", text)
+    text = re.sub(r"(?<=\d),(?=\d{3})", "", text)
+    return _SPACE_RE.sub("", text).lower()
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[i:i + _N] for i in range(len(text) - _N + 1)}
+
+
+@dataclass
+class SentenceSupport:
+    sentence: str
+    claims: list[str]
+    unsupported: list[str] = field(default_factory=list)
+
+    @property
+    def score(self) -> float:
+        if not self.claims:
+            return 1.0
+        return 1 - len(self.unsupported) / len(self.claims)
+
+
+@dataclass
+class GroundingReport:
+    sentences: list[SentenceSupport]
+
+    @property
+    def claim_count(self) -> int:
+        return sum(len(s.claims) for s in self.sentences)
+
+    @property
+    def unsupported_count(self) -> int:
+        return sum(len(s.unsupported) for s in self.sentences)
+
+    @property
+    def unsupported_ratio(self) -> float:
+        total = self.claim_count
+        return self.unsupported_count / total if total else 0.0
+
+    @property
+    def weak_sentences(self) -> list[SentenceSupport]:
+        return [s for s in self.sentences if s.unsupported]
+
+    def to_table(self, max_rows: int = 15) -> str:
+        """편집장 프롬프트용 요약 표 (근거 부족 문장 위주)."""
+        lines = [
+            f"검증 대상 주장 {self.claim_count}개 중 근거 미확인 "
+            f"{self.unsupported_count}개 ({self.unsupported_ratio:.0%})",
+        ]
+        weak = sorted(self.weak_sentences, key=lambda s: s.score)[:max_rows]
+        if weak:
+            lines.append("")
+            lines.append("| 근거점수 | 문장 | 근거 미확인 주장 |")
+            lines.append("|---|---|---|")
+            for s in weak:
+                sentence = s.sentence if len(s.sentence) <= 80 else s.sentence[:77] + "..."
+                sentence = sentence.replace("|", "/")
+                lines.append(
+                    f"| {s.score:.2f} | {sentence} | {', '.join(s.unsupported)} |"
+                )
+        return "\n".join(lines)
+
+
+class GroundingIndex:
+    """근거 코퍼스의 문자 3-gram 역색인.
+
+    주장(수치·날짜·인용 고유명사)의 n-gram 포스팅을 교집합해 후보 문서를 좁힌 뒤
+    후보 문서에서만 부분 문자열을 확인하므로 코퍼스가 커져도 빠르다.
+    """
+
+    def __init__(self, documents: list[str]):
+        self.documents = [_normalize(d) for d in documents if d and d.strip()]
+        self.postings: dict[str, set[int]] = {}
+        for doc_id, doc in enumerate(self.documents):
+            for gram in _ngrams(doc):
+                self.postings.setdefault(gram, set()).add(doc_id)
+
+    @classmethod
+    def from_brief(cls, brief) -> GroundingIndex:
+        """브리핑 전 필드와 원본 스니펫을 근거 코퍼스로 삼는다."""
+        docs = [brief.background_context, brief.topic.title]
+        for items in (
+            brief.key_facts, brief.exhibition_info, brief.artist_info,
+            brief.artwork_highlights, brief.expert_opinions, brief.data_points,
+        ):
+            docs.extend(items)
+        docs.extend(f"{s.title} {s.snippet}" for s in brief.sources)
+        docs.extend(brief.raw_source_snippets.split("\n"))
+        return cls(docs)
+
+    def supports(self, claim: str) -> bool:
+        key = _normalize(claim)
+        if not key:
+            return True
+        if len(key) < _N:
+            # n-gram보다 짧은 주장은 색인으로 좁힐 수 없으므로 직접 확인
+            return any(key in doc for doc in self.documents)
+        grams = sorted(_ngrams(key), key=lambda g: len(self.postings.get(g, ())))
+        candidates: set[int] | None = None
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if not posting:
+                return False
+            candidates = set(posting) if candidates is None else candidates & posting
+            if not candidates:
+                return False
+        return any(key in self.documents[i] for i in candidates or ())
+
+    def score_draft(self, markdown: str) -> GroundingReport:
+        """초안 문장마다 주장을 뽑아 근거 여부를 판정한다."""
+        results: list[SentenceSupport] = []
+        for sentence in split_sentences(markdown):
+            claims = extract_claims(sentence)
+            if not claims:
+                continue
+            unsupported = [c for c in claims if not self.supports(c)]
+            results.append(SentenceSupport(sentence, claims, unsupported))
+        return GroundingReport(results)
+
+
+def split_sentences(markdown: str) -> list[str]:
+    """frontmatter·이미지·마크다운 기호를 걷어내고 문장 단위로 나눈다."""
+    body = re.sub(r"^---\n.*?\n---\n*", "", markdown, flags=re.DOTALL)
+    sentences = []
+    for line in body.split("\n"):
+        line = _MD_NOISE_RE.sub("", line).strip()
+        for part in _SENTENCE_SPLIT_RE.split(line):
+            part = part.strip()
+            if len(part) >= 8:
+                sentences.append(part)
+    return sentences
+
+
+def extract_claims(sentence: str) -> list[str]:
+    """문장에서 검증 가능한 주장(날짜·두 자리 이상 수치·인용 고유명사)을 뽑는다."""
+    claims: list[str] = []
+    for m in _DATE_RE.finditer(sentence):
+        claims.append(m.group(0).strip())
+    without_dates = _DATE_RE.sub(" ", sentence)
+    for m in _NUMBER_RE.finditer(without_dates):
+        number = m.group(0).rstrip(",")
+        if len(number.replace(",", "")) >= 2:
+            claims.append(number)
+    claims.extend(sorted(extract_proper_nouns(sentence)))
+    return list(dict.fromkeys(claims))
@@ -0,0 +1,184 @@
+"""발행 이력 색인 — 이미 쓴 주제를 다시 제안·작성하지 않도록 한다."""
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterable, Optional
+
+from blog_agents.utils.brief_sanitizer import extract_proper_nouns
+from blog_agents.utils.cache import normalize_topic_key
+from blog_agents.utils.markdown_doc import parse_markdown
+from blog_agents.utils.storage import atomic_write_text
+
+
+def _bigrams(text: str) -> set[str]:
+    key = normalize_topic_key(text)
+    if len(key) < 2:
+        return {key} if key else set()
+    return {key[i:i + 2] for i in range(len(key) - 1)}
+
+
+def _overlap(a: set[str], b: set[str]) -> float:
+    """겹침 계수 |A∩B| / min(|A|, |B|) — 길이가 다른 제목 사이의 포함 관계에 강하다."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / min(len(a), len(b))
+
+
+@dataclass
+class PublishedEntry:
+    file: str
+    title: str
+    date: str
+    category: str
+    keywords: list[str] = field(default_factory=list)
+    proper_nouns: list[str] = field(default_factory=list)
+    mtime: float = 0.0
+
+
+@dataclass
+class DuplicateMatch:
+    entry: PublishedEntry
+    score: float
+
+
+class PublishedIndex:
+    """output/published 마크다운의 frontmatter로 만드는 발행 이력 색인.
+
+    파일별 수정 시각을 기억해 새로 생기거나 바뀐 파일만 다시 읽고, 제목의
+    문자 bigram 역색인으로 후보를 좁혀 유사 주제를 빠르게 찾는다.
+    여러 카테고리 파이프라인이 동시에 써도 되도록 조회·갱신을 잠금으로 묶는다.
+    """
+
+    def __init__(self, published_dir: Path, index_path: Path):
+        self.published_dir = published_dir
+        self.index_path = index_path
+        self.entries: dict[str, PublishedEntry] = {}
+        self._postings: dict[str, set[str]] = {}
+        self._lock = threading.RLock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.index_path.exists():
+            return
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            self.entries = {
+                name: PublishedEntry(**entry)
+                for name, entry in data.get("entries", {}).items()
+            }
+        except (json.JSONDecodeError, TypeError, OSError):
+            self.entries = {}
+        self._rebuild_postings()
+
+    def _rebuild_postings(self) -> None:
+        self._postings = {}
+        for name, entry in self.entries.items():
+            for gram in _bigrams(entry.title):
+                self._postings.setdefault(gram, set()).add(name)
+
+    def save(self) -> None:
+        data = {"entries": {name: asdict(e) for name, e in self.entries.items()}}
+        atomic_write_text(
+            self.index_path, json.dumps(data, ensure_ascii=False, indent=2)
+        )
+
+    def refresh(self) -> int:
+        """발행 디렉토리를 훑어 바뀐 파일만 반영한다. 갱신된 항목 수를 반환."""
+        with self._lock:
+            if not self.published_dir.exists():
+                return 0
+            current = {p.name: p for p in self.published_dir.glob("*.md")}
+            changed = 0
+
+            for name in list(self.entries):
+                if name not in current:
+                    del self.entries[name]
+                    changed += 1
+
+            for name, path in current.items():
+                mtime = path.stat().st_mtime
+                known = self.entries.get(name)
+                if known is not None and known.mtime == mtime:
+                    continue
+                entry = self._read_entry(path, mtime)
+                if entry is not None:
+                    self.entries[name] = entry
+                    changed += 1
+
+            if changed:
+                self._rebuild_postings()
+                self.save()
+            return changed
+
+    @staticmethod
+    def _read_entry(path: Path, mtime: float) -> Optional[PublishedEntry]:
+        try:
+            doc = parse_markdown(path.read_text(encoding="utf-8"))
+        except OSError:
+            return None
+        meta, body = doc.frontmatter, doc.body
+        title = meta.get("title", "")
+        if not title:
+            return None
+        keywords = meta.get("keywords", [])
+        return PublishedEntry(
+            file=path.name,
+            title=title,
+            date=meta.get("date", ""),
+            category=meta.get("category", ""),
+            keywords=keywords if isinstance(keywords, list) else [],
+            proper_nouns=sorted(extract_proper_nouns(f"{title}\n{body}"))[:30],
+            mtime=mtime,
+        )
+
+    def find_similar(
+        self,
+        title: str,
+        keywords: Iterable[str] = (),
+        threshold: float = 0.65,
+    ) -> list[DuplicateMatch]:
+        """제목·키워드가 비슷한 발행 글을 유사도 순으로 반환한다.
+
+        유사도 = 제목 bigram 겹침 60% + 키워드·고유명사 겹침 40%.
+        """
+        with self._lock:
+            grams = _bigrams(title)
+            candidates: set[str] = set()
+            for gram in grams:
+                candidates |= self._postings.get(gram, set())
+
+            entities = {
+                normalize_topic_key(k)
+                for k in [*keywords, *extract_proper_nouns(title)] if k
+            }
+            matches = []
+            for name in candidates:
+                entry = self.entries[name]
+                title_sim = _overlap(grams, _bigrams(entry.title))
+                entry_entities = {
+                    normalize_topic_key(k) for k in [*entry.keywords, *entry.proper_nouns]
+                }
+                score = 0.6 * title_sim + 0.4 * _overlap(entities, entry_entities)
+                if score >= threshold:
+                    matches.append(DuplicateMatch(entry, score))
+            return sorted(matches, key=lambda m: m.score, reverse=True)
+
+    def recent_titles(
+        self,
+        category: Optional[str] = None,
+        days: int = 90,
+        limit: int = 20,
+    ) -> list[str]:
+        """최근 ``days``일 안에 발행한 글 제목 (최신순)."""
+        with self._lock:
+            cutoff = (date.today() - timedelta(days=days)).isoformat()
+            entries = [
+                e for e in self.entries.values()
+                if e.date >= cutoff and (category is None or e.category == category)
+            ]
+            entries.sort(key=lambda e: e.date, reverse=True)
+            return [e.title for e in entries[:limit]]
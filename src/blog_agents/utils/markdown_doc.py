@@ -0,0 +1,183 @@
+"""초안·발행 마크다운의 블록 단위 문서 모델 — 한 번 파싱해 작가·편집장·발행기가 공유."""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+# 블록 종류
+HEADING = "heading"
+PARAGRAPH = "paragraph"
+BULLET = "bullet"
+ORDERED = "ordered"
+QUOTE = "quote"
+IMAGE = "image"
+RULE = "rule"
+REFERENCES = "references"   # **[참고자료]** 표시 줄
+BLANK = "blank"
+
+_HEADING_RE = re.compile(r"^(#{1,4})\s+(.*)")
+_IMAGE_RE = re.compile(r"^!\[(.*?)\]\((.*?)\)$")
+_RULE_RE = re.compile(r"^(-{3,}|\*{3,}|_{3,})$")
+_REFERENCES_RE = re.compile(r"^\*?\*?\[참고자료\]\*?\*?$")
+_ORDERED_RE = re.compile(r"^\d+\.\s+(.*)")
+_BULLET_RE = re.compile(r"^[-*+]\s+(.*)")
+_SPACE_RE = re.compile(r"\s+")
+_EMPHASIS_RE = re.compile(r"\*\*|\*|`")
+_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_URL_RE = re.compile(r"https?://\S+")
+
+# 분량 계산에 넣는 본문 블록
+_PROSE_KINDS = (PARAGRAPH, BULLET, ORDERED, QUOTE)
+
+_MAX_CACHED = 64
+_cache: OrderedDict[str, MarkdownDoc] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Block:
+    """마크다운 한 줄에 해당하는 블록.
+
+    text는 표시 기호(#, -, 1., >)를 뗀 본문, source는 앞뒤 공백을 뗀 원래 줄이다.
+    level은 헤딩 단계, indent는 원래 줄의 들여쓰기 칸 수다.
+    이미지 블록은 text에 캡션, url에 경로를 담는다.
+    """
+
+    kind: str
+    text: str = ""
+    source: str = ""
+    level: int = 0
+    indent: int = 0
+    url: str = ""
+
+    @property
+    def plain(self) -> str:
+        """굵게·기울임·코드 기호를 뺀 본문."""
+        return _EMPHASIS_RE.sub("", self.text)
+
+
+@dataclass(frozen=True)
+class MarkdownDoc:
+    """frontmatter와 본문 블록 목록. parse_markdown이 캐시해 공유하므로 수정하지 않는다."""
+
+    frontmatter: dict
+    body: str
+    blocks: tuple[Block, ...]
+
+    @property
+    def title(self) -> Optional[str]:
+        """첫 H1 헤딩 (없으면 None)."""
+        for block in self.blocks:
+            if block.kind == HEADING and block.level == 1:
+                return block.text.strip()
+        return None
+
+    def headings(self, level: Optional[int] = None) -> list[Block]:
+        return [
+            b for b in self.blocks
+            if b.kind == HEADING and (level is None or b.level == level)
+        ]
+
+    def paragraphs(self) -> list[Block]:
+        return [b for b in self.blocks if b.kind == PARAGRAPH]
+
+    @property
+    def char_count(self) -> int:
+        """본문의 공백 제외 글자 수."""
+        return len(_SPACE_RE.sub("", self.body))
+
+    @property
+    def prose_char_count(self) -> int:
+        """참고자료 앞 문단·목록·인용문의 글자 수.
+
+        공백은 포함하되(연속 공백은 하나로) 마크다운 기호, 링크 주소, URL은 뺀다.
+        제목·소제목·이미지와 참고자료 섹션은 세지 않는다.
+        """
+        count = 0
+        for block in self.blocks:
+            if block.kind == REFERENCES or (
+                block.kind == HEADING and "참고자료" in block.plain
+            ):
+                break
+            if block.kind not in _PROSE_KINDS:
+                continue
+            text = _URL_RE.sub("", _LINK_RE.sub(r"\1", block.plain))
+            count += len(_SPACE_RE.sub(" ", text).strip())
+        return count
+
+
+def _parse_frontmatter(text: str) -> tuple[dict, str]:
+    """save_markdown이 쓴 frontmatter(key: value, 리스트는 JSON)를 읽는다."""
+    if not text.startswith("---\n"):
+        return {}, text
+    end = text.find("\n---", 4)
+    if end == -1:
+        return {}, text
+    meta: dict = {}
+    for line in text[4:end].splitlines():
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        value = value.strip()
+        if value.startswith("["):
+            try:
+                meta[key.strip()] = json.loads(value)
+                continue
+            except json.JSONDecodeError:
+                pass
+        meta[key.strip()] = value
+    return meta, text[end + 4:].lstrip("\n")
+
+
+def _parse_line(line: str) -> Block:
+    stripped = line.strip()
+    if not stripped:
+        return Block(BLANK)
+    indent = len(line) - len(line.lstrip())
+
+    m = _HEADING_RE.match(stripped)
+    if m:
+        return Block(HEADING, m.group(2), stripped, level=len(m.group(1)), indent=indent)
+    m = _IMAGE_RE.match(stripped)
+    if m:
+        return Block(IMAGE, m.group(1), stripped, indent=indent, url=m.group(2))
+    if _RULE_RE.match(stripped):
+        return Block(RULE, "", stripped, indent=indent)
+    if _REFERENCES_RE.match(stripped):
+        return Block(REFERENCES, "참고자료", stripped, indent=indent)
+    m = _ORDERED_RE.match(stripped)
+    if m:
+        return Block(ORDERED, m.group(1), stripped, indent=indent)
+    m = _BULLET_RE.match(stripped)
+    if m:
+        return Block(BULLET, m.group(1), stripped, indent=indent)
+    if stripped.startswith(">"):
+        return Block(QUOTE, stripped.lstrip("> "), stripped, indent=indent)
+    return Block(PARAGRAPH, stripped, stripped, indent=indent)
+
+
+def parse_markdown(text: str) -> MarkdownDoc:
+    """마크다운을 블록 문서로 파싱한다. 같은 내용은 해시 단위로 캐시해 재사용한다."""
+    key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+    with _cache_lock:
+        doc = _cache.get(key)
+        if doc is not None:
+            _cache.move_to_end(key)
+            return doc
+
+    meta, body = _parse_frontmatter(text)
+    doc = MarkdownDoc(
+        frontmatter=meta,
+        body=body,
+        blocks=tuple(_parse_line(line) for line in body.split("\n")),
+    )
+    with _cache_lock:
+        _cache[key] = doc
+        if len(_cache) > _MAX_CACHED:
+            _cache.popitem(last=False)
+    return doc
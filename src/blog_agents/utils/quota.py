@@ -0,0 +1,117 @@
+"""모델별 일일 호출 수 기록과 분당 호출 간격 제한 (Gemini 쿼터 관리용)."""
+from __future__ import annotations
+
+import json
+import threading
+import time
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+from blog_agents.utils.storage import atomic_write_text
+
+_ledgers: dict[Path, "QuotaLedger"] = {}
+_ledgers_lock = threading.Lock()
+_rate_limiter: Optional["RateLimiter"] = None
+
+
+class QuotaLedger:
+    """모델별 오늘 호출 수를 파일에 누적한다.
+
+    API가 남은 쿼터를 알려주지 않으므로, 이 프로젝트에서 보낸 호출 수와
+    settings.yaml ``quota.daily_limits``로 남은 호출 수를 추정한다.
+    같은 파일을 쓰는 에이전트들이 한 인스턴스를 공유하도록 ``for_path``로 얻는다.
+    """
+
+    def __init__(self, path: Path, limits: Optional[dict[str, int]] = None):
+        self.path = path
+        self.limits = limits or {}
+        self._lock = threading.Lock()
+        self._day = date.today().isoformat()
+        self._counts: dict[str, int] = self._load()
+
+    @classmethod
+    def for_path(cls, path: Path, limits: Optional[dict[str, int]] = None) -> QuotaLedger:
+        with _ledgers_lock:
+            ledger = _ledgers.get(path)
+            if ledger is None:
+                ledger = cls(path, limits)
+                _ledgers[path] = ledger
+            elif limits:
+                ledger.limits = limits
+            return ledger
+
+    def _load(self) -> dict[str, int]:
+        if not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            return {}
+        if data.get("date") != self._day:
+            return {}
+        return {k: int(v) for k, v in data.get("calls", {}).items()}
+
+    def _roll_day(self) -> None:
+        today = date.today().isoformat()
+        if today != self._day:
+            self._day, self._counts = today, {}
+
+    def record(self, model: str, calls: int = 1) -> None:
+        with self._lock:
+            self._roll_day()
+            self._counts[model] = self._counts.get(model, 0) + calls
+            atomic_write_text(
+                self.path,
+                json.dumps({"date": self._day, "calls": self._counts}, indent=2),
+            )
+
+    def used(self, model: str) -> int:
+        with self._lock:
+            self._roll_day()
+            return self._counts.get(model, 0)
+
+    def remaining(self, model: str) -> Optional[int]:
+        """남은 호출 수 추정 (한도가 설정되지 않은 모델은 None)."""
+        limit = self.limits.get(model)
+        if limit is None:
+            return None
+        return max(0, int(limit) - self.used(model))
+
+
+class RateLimiter:
+    """모델별 분당 호출 수를 넘지 않도록 호출 간격을 벌린다.
+
+    여러 파이프라인이 한 프로세스에서 동시에 돌 때 같은 모델 호출이 몰려
+    429(PerMinute)로 대기하는 대신, 호출 슬롯을 60/rpm초 간격으로 배정한다.
+    프로세스 전체가 한 인스턴스를 공유하도록 ``shared``로 얻는다.
+    """
+
+    def __init__(self, rpm_limits: Optional[dict[str, int]] = None):
+        self.rpm_limits = rpm_limits or {}
+        self._lock = threading.Lock()
+        self._next_slot: dict[str, float] = {}
+
+    @classmethod
+    def shared(cls, rpm_limits: Optional[dict[str, int]] = None) -> RateLimiter:
+        global _rate_limiter
+        with _ledgers_lock:
+            if _rate_limiter is None:
+                _rate_limiter = cls(rpm_limits)
+            elif rpm_limits:
+                _rate_limiter.rpm_limits = rpm_limits
+            return _rate_limiter
+
+    def wait(self, model: str) -> float:
+        """이 모델의 다음 호출 슬롯까지 기다린다. 기다린 초를 반환."""
+        rpm = self.rpm_limits.get(model)
+        if not rpm:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(model, now))
+            self._next_slot[model] = slot + 60.0 / float(rpm)
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
@@ -0,0 +1,144 @@
+"""편집장 차원 그룹별 병렬 검토의 그룹 정의와 결정적 병합."""
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from blog_agents.models.review import (
+    DimensionReview,
+    EditReview,
+    LineEdit,
+    ScoreDimension,
+)
+
+# editor_agent.md 종합 점수 계산식의 가중치
+DIMENSION_WEIGHTS = {
+    "사실정확성": 0.25,
+    "문화예술지식": 0.10,
+    "가독성·문체": 0.25,
+    "SEO": 0.10,
+    "구성/논리": 0.15,
+    "실용성/정보가치": 0.15,
+}
+
+
+@dataclass(frozen=True)
+class DimensionGroup:
+    """한 번의 부분 검토 호출이 맡는 차원 묶음.
+
+    name은 편집장 에이전트가 이 그룹에 보낼 자료 종류를 정한다.
+      - facts: 브리핑 전문 + 근거 검증 표 + 원본 검색 결과
+      - style: 초안 본문만
+      - seo: 타겟 키워드·작성 관점·전시 기본 정보
+    """
+
+    name: str
+    label: str
+    dimensions: tuple[str, ...]
+
+
+# 순서가 곧 병합 순서 (수정 요청·라인 수정 제안의 우선순위)
+DIMENSION_GROUPS = (
+    DimensionGroup("facts", "사실·지식", ("사실정확성", "문화예술지식")),
+    DimensionGroup("style", "문체·구성", ("가독성·문체", "구성/논리")),
+    DimensionGroup("seo", "SEO·실용성", ("SEO", "실용성/정보가치")),
+)
+
+_PAREN_RE = re.compile(r"\(.*?\)")
+_NAME_RE = re.compile(r"[\s·/_\-]+")
+
+
+def _squash_name(name: str) -> str:
+    return _NAME_RE.sub("", _PAREN_RE.sub("", name.lower()))
+
+
+def _match_name(name: str, expected: tuple[str, ...]) -> str | None:
+    key = _squash_name(name)
+    for candidate in expected:
+        standard = _squash_name(candidate)
+        if key and (key == standard or standard in key or key in standard):
+            return candidate
+    return None
+
+
+def normalize_dimensions(
+    dimensions: list[ScoreDimension], expected: tuple[str, ...]
+) -> list[ScoreDimension]:
+    """모델이 돌려준 차원명을 그룹의 표준 이름으로 맞춘다.
+
+    "사실 정확성 (factual_accuracy)", "SEO 최적화"처럼 표기가 달라도 공백과
+    괄호 부분을 뺀 이름의 포함 관계로 대조하고, 대조되지 않으면 남은 표준
+    이름을 순서대로 배정한다. 표준 이름 밖의 여분 차원은 버린다.
+    """
+    named: dict[str, ScoreDimension] = {}
+    leftovers: list[ScoreDimension] = []
+    for dim in dimensions:
+        name = _match_name(dim.dimension, expected)
+        if name and name not in named:
+            named[name] = dim.model_copy(update={"dimension": name})
+        else:
+            leftovers.append(dim)
+    for name in expected:
+        if name not in named and leftovers:
+            named[name] = leftovers.pop(0).model_copy(update={"dimension": name})
+    return [named[name] for name in expected if name in named]
+
+
+def missing_dimensions(group: DimensionGroup, partial: DimensionReview) -> list[str]:
+    """부분 검토가 점수를 매기지 않은 그룹 차원 (정규화 후 기준)."""
+    scored = {d.dimension for d in normalize_dimensions(partial.dimensions, group.dimensions)}
+    return [name for name in group.dimensions if name not in scored]
+
+
+def weighted_score(dimensions: list[ScoreDimension]) -> float:
+    """평가된 차원의 가중 평균 (빠진 차원은 가중치를 나머지에 재분배)."""
+    total = sum(DIMENSION_WEIGHTS.get(d.dimension, 0.0) for d in dimensions)
+    if not total:
+        return 1.0
+    score = sum(d.score * DIMENSION_WEIGHTS.get(d.dimension, 0.0) for d in dimensions)
+    return round(min(10.0, max(1.0, score / total)), 2)
+
+
+def merge_group_reviews(
+    results: list[tuple[DimensionGroup, DimensionReview]],
+) -> EditReview:
+    """그룹별 부분 검토를 하나의 EditReview로 합친다.
+
+    완료 순서와 무관하게 DIMENSION_GROUPS 순서로 합치므로 같은 입력이면
+    결과도 같다. 종합 점수는 가중 평균으로 계산하고, 라인 수정 제안과
+    강점은 중복을 제거한다. 승인 여부는 호출 측에서 정한다.
+    """
+    order = {group.name: i for i, group in enumerate(DIMENSION_GROUPS)}
+    results = sorted(results, key=lambda r: order.get(r[0].name, len(order)))
+
+    dimensions: list[ScoreDimension] = []
+    instructions: list[str] = []
+    line_edits: list[LineEdit] = []
+    strengths: list[str] = []
+    seen_edits: set[tuple[str, str]] = set()
+
+    for group, partial in results:
+        dimensions.extend(normalize_dimensions(partial.dimensions, group.dimensions))
+        if partial.revision_instructions.strip():
+            instructions.append(
+                f"[{group.label}]\n{partial.revision_instructions.strip()}"
+            )
+        for edit in partial.line_edits:
+            key = (edit.original.strip(), edit.suggestion.strip())
+            if key in seen_edits and any(key):
+                continue
+            seen_edits.add(key)
+            line_edits.append(edit)
+        for strength in partial.strengths:
+            if strength not in strengths:
+                strengths.append(strength)
+
+    return EditReview(
+        overall_score=weighted_score(dimensions),
+        dimensions=dimensions,
+        approved=False,
+        revision_instructions="\n\n".join(instructions) or None,
+        line_edits=line_edits,
+        strengths=strengths,
+        review_mode="parallel",
+    )
@@ -0,0 +1,127 @@
+"""초안 마크다운의 H2 섹션 분할·재조립과 편집 제안 위치 매핑."""
+from __future__ import annotations
+
+import difflib
+import re
+from dataclasses import dataclass
+
+from blog_agents.models.content import Section
+from blog_agents.models.review import LineEdit
+
+_H2_RE = re.compile(r"^##\s+(.+?)\s*$")
+_SPACE_RE = re.compile(r"\s+")
+
+# 위치 설명에서 도입부·마무리 섹션을 가리키는 표현
+_INTRO_WORDS = ("도입", "서론", "인트로", "첫 문단", "첫문단", "리드", "제목")
+_OUTRO_WORDS = ("마무리", "결론", "맺음", "마지막")
+
+
+def split_sections(markdown: str) -> list[Section]:
+    """H2 기준으로 나눈다. 첫 H2 이전(제목·도입부)은 heading이 빈 섹션이다.
+
+    ``join_sections(split_sections(md)) == md``가 성립하도록 줄 단위 원문을
+    그대로 보존한다 (소제목 줄 끝 공백만 예외).
+    """
+    sections: list[Section] = []
+    heading = ""
+    lines: list[str] = []
+    for line in markdown.split("\n"):
+        m = _H2_RE.match(line)
+        if m:
+            if heading or lines:
+                sections.append(Section(heading=heading, content="\n".join(lines)))
+            heading, lines = m.group(1), []
+        else:
+            lines.append(line)
+    sections.append(Section(heading=heading, content="\n".join(lines)))
+    return sections
+
+
+def render_section(section: Section) -> str:
+    if not section.heading:
+        return section.content
+    return f"## {section.heading}\n{section.content}"
+
+
+def join_sections(sections: list[Section]) -> str:
+    return "\n".join(render_section(s) for s in sections)
+
+
+def _squash(text: str) -> str:
+    return _SPACE_RE.sub("", text.replace("**", "").replace("*", ""))
+
+
+def locate_edit(edit: LineEdit, sections: list[Section]) -> int | None:
+    """편집 제안이 가리키는 섹션 번호 (찾지 못하면 None).
+
+    원문 인용이 들어 있는 섹션을 먼저 찾고, 없으면 위치 설명에 섹션
+    소제목이 언급됐는지, 도입부·마무리 표현이 있는지 순으로 본다.
+    """
+    original = _squash(edit.original)
+    if len(original) >= 6:
+        for i, section in enumerate(sections):
+            if original in _squash(render_section(section)):
+                return i
+
+    location = _squash(edit.location)
+    for i, section in enumerate(sections):
+        heading = _squash(section.heading)
+        if heading and location and (heading in location or location in heading):
+            return i
+    if any(w in edit.location for w in _INTRO_WORDS) and not sections[0].heading:
+        return 0
+    if any(w in edit.location for w in _OUTRO_WORDS):
+        return len(sections) - 1
+    return None
+
+
+def target_sections(
+    edits: list[LineEdit], sections: list[Section]
+) -> tuple[set[int], list[LineEdit]]:
+    """편집 제안을 섹션에 배정한다. (대상 섹션 번호, 배정 못 한 제안)을 반환."""
+    targets: set[int] = set()
+    unplaced: list[LineEdit] = []
+    for edit in edits:
+        index = locate_edit(edit, sections)
+        if index is None:
+            unplaced.append(edit)
+        else:
+            targets.add(index)
+    return targets, unplaced
+
+
+@dataclass
+class DraftDiff:
+    """두 초안 버전 사이의 변경 요약."""
+
+    unified: str
+    changed_chars: int
+    total_chars: int
+    changed_sections: list[Section]
+
+    @property
+    def changed_ratio(self) -> float:
+        """바뀐 줄(삭제+추가)의 글자 수 비율. 한국어 초안은 문단이 한 줄이라 글자로 잰다."""
+        return self.changed_chars / self.total_chars if self.total_chars else 1.0
+
+
+def diff_drafts(old: str, new: str, context: int = 0) -> DraftDiff:
+    """줄 단위 unified diff와 내용이 바뀐 새 버전 섹션 목록."""
+    diff_lines = list(difflib.unified_diff(
+        old.split("\n"), new.split("\n"), "이전 버전", "수정 버전",
+        n=context, lineterm="",
+    ))
+    changed = sum(
+        len(line) - 1 for line in diff_lines
+        if line[:1] in "+-" and not line.startswith(("+++", "---"))
+    )
+    old_sections = {(s.heading, s.content) for s in split_sections(old)}
+    changed_sections = [
+        s for s in split_sections(new) if (s.heading, s.content) not in old_sections
+    ]
+    return DraftDiff(
+        unified="\n".join(diff_lines),
+        changed_chars=changed,
+        total_chars=len(old) + len(new),
+        changed_sections=changed_sections,
+    )
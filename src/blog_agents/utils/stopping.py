@@ -0,0 +1,127 @@
+"""작성·편집 루프 조기 종료 정책 — 점수 추세와 남은 쿼터로 다음 라운드 여부를 결정."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from blog_agents.models.review import EditReview
+from blog_agents.utils.quota import QuotaLedger
+
+CONTINUE = "continue"
+STOP = "stop"
+ESCALATE = "escalate"
+
+
+@dataclass
+class StopDecision:
+    action: str
+    reason: str
+    round_num: int
+    score: float
+    expected_gain: float
+    dimension_deltas: dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class StoppingPolicy:
+    """settings.yaml ``quality.stopping``에 따라 다음 수정 라운드의 실익을 판단한다.
+
+    - 기대 이득: 직전 라운드 점수 변화 (첫 라운드는 ``first_round_gain`` 사전값)
+    - 기대 이득이 ``min_expected_gain`` 미만이면 정체로 보고, 상위 작가 모델
+      (models.writer_escalation)이 있으면 한 번 전환하고 아니면 중단
+    - 점수가 떨어졌고 절반 이상의 차원이 하락했으면 중단 (최고점 버전 사용)
+    - 작가·편집장 모델의 남은 일일 호출이 한 라운드분에 못 미치면 중단
+    """
+
+    def __init__(
+        self,
+        quality: dict,
+        ledger: Optional[QuotaLedger] = None,
+        escalation_model: Optional[str] = None,
+    ):
+        options = quality.get("stopping", {}) or {}
+        self.enabled = options.get("enabled", True)
+        self.min_expected_gain = options.get("min_expected_gain", 0.3)
+        self.first_round_gain = options.get("first_round_gain", 1.0)
+        self.calls_per_round = options.get("calls_per_round", {"writer": 1, "editor": 1})
+        self.approval_threshold = quality.get("approval_threshold", 8.0)
+        self.ledger = ledger
+        self.escalation_model = escalation_model
+        self.escalated = False
+
+    @staticmethod
+    def _dimension_deltas(prev: EditReview, last: EditReview) -> dict[str, float]:
+        before = {d.dimension: d.score for d in prev.dimensions}
+        return {
+            d.dimension: round(d.score - before[d.dimension], 2)
+            for d in last.dimensions if d.dimension in before
+        }
+
+    def _quota_short(self, writer_model: str, editor_model: str) -> Optional[str]:
+        if self.ledger is None:
+            return None
+        for role, model in (("writer", writer_model), ("editor", editor_model)):
+            remaining = self.ledger.remaining(model)
+            needed = self.calls_per_round.get(role, 1)
+            if remaining is not None and remaining < needed:
+                return f"{model} 일일 쿼터 잔여 {remaining}회 < 라운드당 {needed}회"
+        return None
+
+    def decide(
+        self,
+        reviews: list[EditReview],
+        round_num: int,
+        writer_model: str,
+        editor_model: str,
+    ) -> StopDecision:
+        """지금까지의 리뷰(라운드 순)로 다음 라운드 진행 여부를 정한다."""
+        last = reviews[-1]
+        gap = self.approval_threshold - last.overall_score
+
+        def decision(action: str, reason: str, gain: float, deltas=None) -> StopDecision:
+            return StopDecision(
+                action, reason, round_num, last.overall_score, round(gain, 2), deltas or {}
+            )
+
+        if not self.enabled:
+            return decision(CONTINUE, "정책 비활성화", 0.0)
+
+        if len(reviews) < 2:
+            gain = self.first_round_gain
+            deltas: dict[str, float] = {}
+        else:
+            prev = reviews[-2]
+            gain = last.overall_score - prev.overall_score
+            deltas = self._dimension_deltas(prev, last)
+            dropped = [d for d, v in deltas.items() if v < 0]
+            if gain < 0 and deltas and len(dropped) * 2 >= len(deltas):
+                return decision(
+                    STOP,
+                    f"점수 하락 {gain:+.1f} (차원 {len(dropped)}/{len(deltas)}개 하락)",
+                    gain, deltas,
+                )
+
+        short = self._quota_short(writer_model, editor_model)
+        if short:
+            return decision(STOP, f"쿼터 부족: {short}", gain, deltas)
+
+        if gain < self.min_expected_gain:
+            if self.escalation_model and not self.escalated:
+                if self.ledger is None or self.ledger.remaining(self.escalation_model) != 0:
+                    self.escalated = True
+                    return decision(
+                        ESCALATE,
+                        f"점수 정체 ({gain:+.1f} < {self.min_expected_gain}) → "
+                        f"{self.escalation_model}로 전환",
+                        gain, deltas,
+                    )
+            return decision(
+                STOP,
+                f"점수 정체: 기대 이득 {gain:+.1f} < {self.min_expected_gain} "
+                f"(승인까지 {gap:.1f}점)",
+                gain, deltas,
+            )
+
+        return decision(CONTINUE, f"기대 이득 {gain:+.1f}, 승인까지 {gap:.1f}점", gain, deltas)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -8,6 +10,7 @@ from typing import Any
 from pydantic import BaseModel
 
 from blog_agents.models.research import ContentCategory
+from blog_agents.models.run import RunManifest
 
 
 def slugify(text: str, max_length: int = 30) -> str:
@@ -20,6 +23,20 @@ def slugify(text: str, max_length: int = 30) -> str:
     return slug[:max_length]
 
 
+def atomic_write_text(path: Path, text: str) -> None:
+    """임시 파일에 쓴 뒤 교체하여 중단 시에도 파일이 깨지지 않게 저장."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
 class StorageManager:
     """로컬 파일 시스템에 아티팩트를 저장/로드."""
 
@@ -88,3 +105,42 @@ class StorageManager:
     def load_json(self, path: Path) -> dict:
         """JSON 파일 로드."""
         return json.loads(path.read_text(encoding="utf-8"))
+
+    # ------------------------------------------------------------------
+    # 실행 기록 (output/runs/{run_id}.json)
+    # ------------------------------------------------------------------
+
+    def relative(self, path: Path) -> str:
+        """output 디렉토리 기준 상대 경로 (실행 기록용)."""
+        try:
+            return path.relative_to(self.output_dir).as_posix()
+        except ValueError:
+            return str(path)
+
+    def resolve(self, relative: str) -> Path:
+        return self.output_dir / relative
+
+    def save_run(self, run: RunManifest) -> Path:
+        """실행 기록을 원자적으로 저장 (중단 시에도 직전 단계 기록이 남는다)."""
+        run.updated_at = datetime.now()
+        path = self.output_dir / "runs" / f"{run.run_id}.json"
+        atomic_write_text(path, run.model_dump_json(indent=2))
+        return path
+
+    def load_run(self, run_id: str) -> RunManifest:
+        path = self.output_dir / "runs" / f"{run_id}.json"
+        if not path.exists():
+            raise FileNotFoundError(f"실행 기록을 찾을 수 없습니다: {run_id}")
+        return RunManifest.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def list_runs(self) -> list[RunManifest]:
+        """실행 기록 목록 (최근 갱신 순). 읽을 수 없는 파일은 건너뛴다."""
+        runs = []
+        for path in (self.output_dir / "runs").glob("*.json"):
+            try:
+                runs.append(
+                    RunManifest.model_validate_json(path.read_text(encoding="utf-8"))
+                )
+            except (OSError, ValueError):
+                continue
+        return sorted(runs, key=lambda r: r.updated_at, reverse=True)
@@ -0,0 +1,95 @@
+"""다중 패턴 문자열 매칭 (Aho-Corasick 오토마톤)."""
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable
+
+
+class MultiPatternMatcher:
+    """여러 패턴을 한 번에 찾는 Aho-Corasick 오토마톤.
+
+    패턴 수와 무관하게 텍스트를 한 번만 훑으므로, 고유명사 N개를 코퍼스에서
+    찾을 때 ``noun in corpus``를 N번 반복하는 O(N × 코퍼스) 비용이
+    O(패턴 총길이 + 코퍼스)로 줄어든다.
+    """
+
+    def __init__(self, patterns: Iterable[str], ignore_case: bool = True):
+        self.ignore_case = ignore_case
+        self.patterns: list[str] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+
+        seen: set[str] = set()
+        for pattern in patterns:
+            key = self._norm(pattern)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            self._insert(key, len(self.patterns))
+            self.patterns.append(pattern)
+        self._build_links()
+
+    def _norm(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def _insert(self, key: str, pattern_id: int) -> None:
+        state = 0
+        for ch in key:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (pattern_id,)
+
+    def _build_links(self) -> None:
+        """BFS로 실패 링크를 만들고 출력 집합을 실패 링크 쪽과 합친다."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                if self._out[self._fail[nxt]]:
+                    self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _scan(self, text: str):
+        """텍스트를 한 번 훑으며 매칭된 패턴 id 묶음을 차례로 내보낸다."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for ch in self._norm(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                yield out[state]
+
+    def find(self, text: str) -> set[str]:
+        """텍스트에 등장하는 패턴 집합 (원래 표기 그대로)."""
+        found: set[int] = set()
+        if not self.patterns:
+            return set()
+        for ids in self._scan(text):
+            found.update(ids)
+            if len(found) == len(self.patterns):
+                break
+        return {self.patterns[i] for i in found}
+
+    def contains_any(self, text: str) -> bool:
+        """패턴 중 하나라도 등장하면 True (첫 매칭에서 바로 종료)."""
+        if not self.patterns:
+            return False
+        for _ in self._scan(text):
+            return True
+        return False
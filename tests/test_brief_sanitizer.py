@@ -0,0 +1,37 @@
+from datetime import date
+
+from blog_agents.utils.brief_sanitizer import BriefSanitizer, SanitizeReport
+
+TODAY = date(2026, 10, 19)
+
+
+def clean(text: str, valid_urls=("https://hankyung.com/a/1",)):
+    sanitizer = BriefSanitizer(valid_urls=list(valid_urls), today=TODAY)
+    report = SanitizeReport(today=TODAY.isoformat())
+    return sanitizer._clean(text, "background_context", report), report
+
+
+def test_future_date_removed_from_citation_with_valid_url():
+    text, report = clean("매출이 늘었다 (한국경제, https://hankyung.com/a/1, 2027.3.1).")
+
+    assert text == "매출이 늘었다 (한국경제, https://hankyung.com/a/1)."
+    assert report.removed_dates == [{"field": "background_context", "date": "2027.3.1"}]
+    assert report.removed_urls == []
+
+
+def test_fabricated_url_in_citation_removed_and_past_date_kept():
+    text, report = clean("개막했다 (뉴스1, https://fake.example/x, 2025.01.02).")
+
+    assert text == "개막했다 (뉴스1, 2025.01.02)."
+    assert report.removed_urls == [
+        {"field": "background_context", "url": "https://fake.example/x"}
+    ]
+    assert report.removed_dates == []
+
+
+def test_citation_with_only_fabricated_url_and_future_date_removed():
+    text, report = clean("소식 (https://fake.example/x, 2027.01.02)")
+
+    assert text == "소식 "
+    assert len(report.removed_urls) == 1
+    assert len(report.removed_dates) == 1
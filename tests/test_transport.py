@@ -0,0 +1,72 @@
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from blog_agents.tools.transport import HttpTransport, ResponseTooLargeError
+
+BODY = ("<rss><channel><title>전시 소식</title></channel></rss>" * 50).encode("utf-8")
+
+
+class GzipHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        payload = gzip.compress(BODY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+        self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def gzip_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GzipHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/feed.xml"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def transport():
+    transport = HttpTransport(http2=False)
+    yield transport
+    transport.close()
+
+
+def test_gzip_response_is_decoded_once(gzip_url, transport):
+    response = transport.get(gzip_url)
+
+    assert response.status_code == 200
+    assert response.content == BODY
+    assert response.text == BODY.decode("utf-8")
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-type"].startswith("application/rss+xml")
+
+
+def test_gzip_response_truncated_at_decoded_limit(gzip_url, transport):
+    response = transport.get(gzip_url, max_bytes=100, truncate=True)
+    assert response.content == BODY[:100]
+
+    with pytest.raises(ResponseTooLargeError):
+        transport.get(gzip_url, max_bytes=100)
+
+
+def test_body_of_exactly_limit_bytes_is_accepted(gzip_url, transport):
+    response = transport.get(gzip_url, max_bytes=len(BODY))
+    assert response.content == BODY
+
+
+def test_header_latency_recorded_per_request(gzip_url, transport):
+    transport.get(gzip_url)
+    transport.get(gzip_url)
+
+    stats = transport.stats["127.0.0.1"]
+    assert stats.requests == 2
+    assert stats.header_seconds > 0